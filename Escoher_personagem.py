@@ -26,6 +26,12 @@ import os
 import subprocess
 from pygame import Rect
 
+from render_cache import text_cache
+from assets import asset_index, asset_log
+from asset_loader import asset_loader, report_first_frame
+from fonts import font_registry
+import procedural
+
 # =============================================================================
 # FUNÇÕES DE INICIALIZAÇÃO E GERENCIAMENTO DE ESTADO
 # =============================================================================
@@ -125,14 +131,10 @@ def load_font(path, size):
         size (int): Tamanho da fonte em pontos
     
     Returns:
-        Font: Objeto de fonte do Pygame
+        Font: Objeto de fonte do Pygame (compartilhado pelo registro de fontes)
     """
-    try:
-        return pygame.font.Font(path, size)
-    except Exception as e:
-        print(f"Aviso: não foi possível carregar '{path}' ({e}). Usando fonte padrão.")
-        # Fallback para fonte serifada que mantém o tema medieval
-        return pygame.font.SysFont("georgia", size)
+    # Fallback para fonte serifada que mantém o tema medieval
+    return font_registry.get(f"{path},georgia", size)
 
 # Carrega hierarquia de fontes para design consistente
 font_path = "font/MorrisRomanAlternate-Black.ttf"
@@ -150,20 +152,35 @@ def load_image_safe(path, size):
     Carrega imagens com tratamento robusto de erro
     
     Args:
-        path (str): Caminho para a imagem
+        path (str): Caminho para a imagem (resolvido pelo índice de recursos,
+            sem diferenciar maiúsculas)
         size (tuple): (largura, altura) para redimensionamento
     
     Returns:
         Surface: Imagem carregada ou None se falhar
     """
+    if asset_loader.has(path, size):
+        # Já decodificada (ou dada como ausente) pelo pré-carregamento
+        return asset_loader.get(path, size)
+    resolved = asset_index.find(path)
+    if not resolved:
+        # Retorna None para que o sistema possa usar placeholders
+        return None
     try:
-        img = pygame.image.load(path).convert_alpha()
+        img = pygame.image.load(resolved).convert_alpha()
         return pygame.transform.smoothscale(img, size)
-    except Exception:
-        # Retorna None para que o sistema possa usar placeholders
+    except Exception as e:
+        asset_log.error(f"Falha ao carregar imagem '{resolved}': {e}")
         return None
 
 # Carrega recursos visuais - retratos das classes
+# Decodificação em paralelo com tela de progresso; load_image_safe só pega o resultado
+for _path, _size in (("imagens/Guerreiro.jpg", (180, 180)),
+                     ("imagens/Mago.jpg", (180, 180)),
+                     ("imagens/background_medieval.png", (SCREEN_WIDTH, SCREEN_HEIGHT))):
+    asset_loader.request(_path, _size)
+asset_loader.run_loading_screen(screen, "Convocando os heróis...", FONT_HEADER)
+
 portrait_left = load_image_safe("imagens/Guerreiro.jpg", (180, 180))
 portrait_right = load_image_safe("imagens/Mago.jpg", (180, 180))
 bg_image = load_image_safe("imagens/background_medieval.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -457,7 +474,7 @@ def draw_text(surface, text, font, color, position, align="center"):
         position (tuple): Posição (x, y)
         align (str): Tipo de alinhamento
     """
-    text_surface = font.render(text, True, color)
+    text_surface = text_cache.render(font, text, color)
     text_rect = text_surface.get_rect()
     
     # Aplica alinhamento baseado no parâmetro
@@ -503,26 +520,38 @@ def draw_ornate_border(surface, rect, color, inner_color, shadow_color):
         pygame.draw.circle(surface, color, corner, corner_size)
         pygame.draw.circle(surface, HEADER_COLOR, corner, corner_size // 2, 2)
 
+BACKGROUND_SEED = 1347     # Seed da textura procedural: o mesmo fundo em todo frame e execução
+background_cache = None    # (tamanho da tela, fundo já composto)
+
+def build_background(size):
+    """
+    Compõe o fundo completo em uma única superfície opaca
+    
+    Args:
+        size (tuple): (largura, altura) da tela
+    
+    Returns:
+        Surface: Imagem com vinheta, ou textura procedural de pedra/pergaminho
+    """
+    if not bg_image:
+        # Fallback: 150 manchas translúcidas sobre o pergaminho, sempre com o mesmo seed
+        return procedural.blotches(size, BG_LIGHT, BG_DARK, count=150, extent=(50, 200),
+                                   alpha=(5, 15), seed=BACKGROUND_SEED)
+
+    background = pygame.Surface(size).convert()
+    image = bg_image if bg_image.get_size() == size else pygame.transform.smoothscale(bg_image, size)
+    background.blit(image, (0, 0))
+    # Vinheta para focar atenção no centro
+    background.blit(procedural.radial_vignette(size, (0, 0, 0), 180, size[0] / 1.5), (0, 0))
+    return background
+
 def draw_background():
-    """Desenha o fundo temático com imagem ou textura procedural"""
-    if bg_image:
-        # Usa imagem de fundo carregada
-        screen.blit(bg_image, (0, 0))
-        # Adiciona vinhete para focar atenção no centro
-        vignette = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.radial_gradient(vignette, (0,0,0,0), (0,0,0,180), (SCREEN_WIDTH//2, SCREEN_HEIGHT//2), SCREEN_WIDTH//1.5)
-        screen.blit(vignette, (0,0))
-    else:
-        # Fallback: cria textura procedural de pedra/pergaminho
-        screen.fill(BG_LIGHT)
-        for _ in range(150): # Manchas para textura
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT)
-            size = random.randint(50, 200)
-            alpha = random.randint(5, 15)
-            s = pygame.Surface((size, size), pygame.SRCALPHA)
-            s.fill((BG_DARK[0], BG_DARK[1], BG_DARK[2], alpha))
-            screen.blit(s, (x, y))
+    """Desenha o fundo temático (composto uma vez; refeito só quando a resolução muda)"""
+    global background_cache
+    size = screen.get_size()
+    if background_cache is None or background_cache[0] != size:
+        background_cache = (size, build_background(size))
+    screen.blit(background_cache[1], (0, 0))
 
 def draw_header():
     """Desenha o cabeçalho principal com título decorativo"""
@@ -879,6 +908,7 @@ while running:
 
     # Atualiza display
     pygame.display.flip()
+    report_first_frame("Escoher_personagem")
 
 # Limpeza final
 pygame.quit()
@@ -1,5 +1,5 @@
 # rpg_tabletop_enhanced.py
-# Requisitos: pip install pygame
+# Requisitos: pip install pygame numpy
 
 import pygame
 import sys
@@ -9,42 +9,43 @@ import math
 from collections import deque
 from enum import Enum
 
+from render_cache import gradient_cache, text_cache
+from text_layout import TypewriterText
+from particles import ParticleSystem
+from dirty_rects import DirtyState, DirtyRectRenderer
+from hud import Observable, HudLayer
+from profiler import frame_profiler
+from timestep import FixedTimestep
+from assets import asset_index, asset_log
+from asset_loader import asset_loader, report_first_frame
+from texture_atlas import texture_atlases
+from animation import create_demon_animator, frame_cache
+from fonts import font_registry
+from dice import DiceRoller
+import procedural
+import combat_replay
+
 pygame.init()
 pygame.font.init()
-pygame.mixer.init()
 
 # ==================== CONFIGURAÇÕES ====================
 SCREEN_W, SCREEN_H = 1200, 800
-FPS = 60
+FPS = int(os.environ.get("RPG_FPS", 60))          # taxa de renderização
+SIM_HZ = int(os.environ.get("RPG_SIM_HZ", 60))     # passos fixos de simulação por segundo
+MAX_SIM_STEPS = 5  # passos por frame antes de descartar atraso (frame muito lento)
+ENEMY_TURN_DELAY = 1.2  # segundos até o inimigo agir
+# Modo opcional: redesenha só os retângulos alterados (RPG_DIRTY_RECTS=1)
+DIRTY_RECTS = os.environ.get("RPG_DIRTY_RECTS") == "1"
+# Semente dos dados da sessão (RPG_DICE_SEED=42 repete as mesmas rolagens); vazio = aleatória
+DICE_SEED = int(os.environ["RPG_DICE_SEED"]) if os.environ.get("RPG_DICE_SEED") else None
 
 # ==================== SISTEMA DE CAMINHOS DE IMAGEM MELHORADO ====================
 def find_image_path(filename):
-    """Encontra o caminho correto para uma imagem verificando múltiplas localizações"""
-    
-    # Lista de possíveis locais onde as imagens podem estar
-    possible_paths = [
-        # Diretório atual do script
-        os.path.join(os.path.dirname(os.path.abspath(__file__)), filename),
-        # Pasta imagens no diretório atual
-        os.path.join(os.path.dirname(os.path.abspath(__file__)), "imagens", filename),
-        # Pasta assets no diretório atual
-        os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", filename),
-        # Caminho absoluto fornecido pelo usuário
-        r"D:\Segundo ano\Trabalho interdiciplinar\RPG\imagens\Scene Overview.png" if filename == "Scene Overview.png" else "",
-        r"D:\Segundo ano\Trabalho interdiciplinar\RPG\imagens\mestre-removebg-preview.png" if filename == "mestre-removebg-preview.png" else "",
-        # Tentativa com nome em minúsculas
-        os.path.join(os.path.dirname(os.path.abspath(__file__)), filename.lower()),
-        os.path.join(os.path.dirname(os.path.abspath(__file__)), "imagens", filename.lower()),
-    ]
-    
-    # Remove caminhos vazios e verifica qual existe
-    for path in possible_paths:
-        if path and os.path.exists(path):
-            print(f"[SUCESSO] Imagem encontrada: {path}")
-            return path
-    
-    print(f"[AVISO] Imagem não encontrada em nenhum local: {filename}")
-    return None
+    """Encontra o caminho de uma imagem no índice de recursos (nome ou caminho relativo, sem diferenciar maiúsculas)"""
+    path = asset_index.find(filename)
+    if path:
+        asset_log.debug(f"Imagem encontrada: {path}")
+    return path
 
 # ==================== PALETA DE CORES PREMIUM ====================
 COLOR_DEEP_WOOD = (30, 20, 10)
@@ -62,63 +63,6 @@ COLOR_SHADOW = (15, 8, 3)
 COLOR_HIGHLIGHT = (255, 255, 200)
 COLOR_DARK_BORDER = (15, 10, 5)
 
-# Gradientes para efeitos visuais
-def create_gradient(width, height, start_color, end_color):
-    gradient = pygame.Surface((width, height))
-    for y in range(height):
-        ratio = y / height
-        r = max(0, min(255, int(start_color[0] + (end_color[0] - start_color[0]) * ratio)))
-        g = max(0, min(255, int(start_color[1] + (end_color[1] - start_color[1]) * ratio)))
-        b = max(0, min(255, int(start_color[2] + (end_color[2] - start_color[2]) * ratio)))
-        pygame.draw.line(gradient, (r, g, b), (0, y), (width, y))
-    return gradient
-
-# ==================== INICIALIZAÇÃO ====================
-screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
-pygame.display.set_caption("RPG de Mesa — O Conclave de Eldoria: Renascimento das Eras")
-clock = pygame.time.Clock()
-
-# ==================== SISTEMA DE PARTÍCULAS ====================
-class ParticleSystem:
-    def __init__(self):
-        self.particles = []
-        
-    def add_particles(self, x, y, color, count=5, speed=2, size=3, lifetime=1.0):
-        for _ in range(count):
-            angle = random.uniform(0, math.pi * 2)
-            velocity = [math.cos(angle) * speed, math.sin(angle) * speed]
-            self.particles.append({
-                'pos': [x, y],
-                'vel': velocity,
-                'color': color,
-                'size': random.uniform(size * 0.5, size * 1.5),
-                'lifetime': lifetime,
-                'max_lifetime': lifetime
-            })
-    
-    def update(self, dt):
-        for particle in self.particles[:]:
-            particle['pos'][0] += particle['vel'][0]
-            particle['pos'][1] += particle['vel'][1]
-            particle['lifetime'] -= dt
-            particle['vel'][1] += 0.1  # gravidade
-            
-            if particle['lifetime'] <= 0:
-                self.particles.remove(particle)
-    
-    def draw(self, surf):
-        for particle in self.particles:
-            alpha = int(255 * (particle['lifetime'] / particle['max_lifetime']))
-            if alpha > 0:
-                color = particle['color']
-                size = int(particle['size'] * (particle['lifetime'] / particle['max_lifetime']))
-                if size > 0:
-                    particle_surf = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-                    pygame.draw.circle(particle_surf, (*color, alpha), (size, size), size)
-                    surf.blit(particle_surf, (int(particle['pos'][0])-size, int(particle['pos'][1])-size))
-
-particle_system = ParticleSystem()
-
 # ==================== ENUMS ====================
 class StatusMissao(Enum):
     DISPONIVEL = "Disponível"
@@ -140,96 +84,133 @@ class TipoInimigo(Enum):
     DEMONIO = "Demônio"
 
 # ==================== SISTEMA DE IMAGENS ROBUSTO ====================
+# Placeholders e imagens compartilhados: botões, habilidades e inimigos com a mesma aparência
+# recebem a mesma Surface (flyweight). São só de leitura; para alterar, use .copy().
+placeholder_icons = {}
+loaded_images = {}
+
 def create_placeholder_icon(size, color, text=""):
-    """Cria ícones placeholder quando as imagens não são encontradas"""
+    """Ícone placeholder para imagens não encontradas, criado uma vez por (tamanho, cor, texto)"""
+    key = (tuple(size), tuple(color), text)
+    surf = placeholder_icons.get(key)
+    if surf is None:
+        surf = placeholder_icons[key] = render_placeholder_icon(*key)
+    return surf
+
+def render_placeholder_icon(size, color, text=""):
     surf = pygame.Surface(size, pygame.SRCALPHA)
     pygame.draw.rect(surf, color, (0, 0, size[0], size[1]), border_radius=8)
     pygame.draw.rect(surf, COLOR_BRIGHT_GOLD, (0, 0, size[0], size[1]), 2, border_radius=8)
     
     if text:
-        font = pygame.font.SysFont("arial", size[1]//3)
-        text_surf = font.render(text, True, COLOR_GOLDEN_PARCHMENT)
+        font = font_registry.get("arial", size[1]//3)
+        text_surf = font_registry.render(font, text, True, COLOR_GOLDEN_PARCHMENT)
         surf.blit(text_surf, (size[0]//2 - text_surf.get_width()//2, size[1]//2 - text_surf.get_height()//2))
     
     return surf
 
 def load_image_robust(filename, size=None, placeholder_text=""):
-    """Carrega imagens com sistema robusto de fallback"""
+    """Carrega imagens com sistema robusto de fallback (uma vez por arquivo, tamanho e texto)"""
+    key = (filename, tuple(size) if size else None, placeholder_text)
+    img = loaded_images.get(key)
+    if img is None:
+        img = loaded_images[key] = load_image_uncached(filename, size, placeholder_text)
+    return img
+
+def load_image_uncached(filename, size, placeholder_text):
     if not filename:
         return create_placeholder_icon(size or (64, 64), COLOR_DEEP_WOOD, placeholder_text)
 
-    path = find_image_path(filename)
+    # Ícones e quadros empacotados em atlas: sem abrir o arquivo individual
+    atlas = texture_atlases.find(filename)
+    if atlas is not None:
+        img = atlas.get_frame(filename)
+        return pygame.transform.smoothscale(img, size) if size else img
+
+    if asset_loader.has(filename, size):
+        img = asset_loader.get(filename, size)
+        if img is not None:
+            return img
+        path = None  # já procurado no pré-carregamento
+    else:
+        path = find_image_path(filename)
     
     if not path:
-        print(f"[AVISO] Usando placeholder para: {filename}")
+        asset_log.info(f"Usando placeholder para: {filename}")
         return create_placeholder_icon(size or (64, 64), COLOR_DEEP_WOOD, placeholder_text)
 
     try:
-        img = pygame.image.load(path).convert_alpha()
+        img = pygame.image.load(path)
+        # Sem janela (modo headless) não há formato de tela para converter
+        if pygame.display.get_surface():
+            img = img.convert_alpha()
         if size:
             img = pygame.transform.smoothscale(img, size)
-        print(f"[SUCESSO] Imagem carregada: {path}")
+        asset_log.debug(f"Imagem carregada: {path}")
         return img
     except Exception as e:
-        print(f"[ERRO] Falha ao carregar imagem '{path}': {e}")
+        asset_log.error(f"Falha ao carregar imagem '{path}': {e}")
         return create_placeholder_icon(size or (64, 64), COLOR_DEEP_WOOD, placeholder_text)
 
 def load_background_robust():
     """Carrega imagem de fundo com sistema robusto"""
-    path = find_image_path("Scene Overview.png")
+    img = asset_loader.get(BACKGROUND_IMAGE, (SCREEN_W, SCREEN_H))
+    if img is not None:
+        return img
+    path = find_image_path(BACKGROUND_IMAGE)
     
     if not path:
-        print("[AVISO] Criando fundo procedural")
+        asset_log.info("Criando fundo procedural")
         return create_procedural_background()
     
     try:
-        img = pygame.image.load(path).convert()
+        img = pygame.image.load(path)
+        if pygame.display.get_surface():
+            img = img.convert()
         img = pygame.transform.smoothscale(img, (SCREEN_W, SCREEN_H))
-        print(f"[SUCESSO] Fundo carregado: {path}")
+        asset_log.debug(f"Fundo carregado: {path}")
         return img
     except Exception as e:
-        print(f"[ERRO] Falha ao carregar fundo '{path}': {e}")
+        asset_log.error(f"Falha ao carregar fundo '{path}': {e}")
         return create_procedural_background()
 
-def create_procedural_background():
-    """Cria um fundo procedural como fallback"""
-    bg = pygame.Surface((SCREEN_W, SCREEN_H))
-    # Gradiente de céu noturno
-    for y in range(SCREEN_H):
-        ratio = y / SCREEN_H
-        r = max(0, min(255, 10 + int(40 * ratio)))
-        g = max(0, min(255, 5 + int(25 * ratio)))
-        b = max(0, min(255, 20 + int(35 * ratio)))
-        pygame.draw.line(bg, (r, g, b), (0, y), (SCREEN_W, y))
-    
-    # Adiciona algumas estrelas
-    for _ in range(100):
-        x = random.randint(0, SCREEN_W)
-        y = random.randint(0, SCREEN_H // 2)
-        size = random.randint(1, 3)
-        brightness = random.randint(150, 255)
-        pygame.draw.circle(bg, (brightness, brightness, brightness), (x, y), size)
-    
-    return bg
+# Imagens decodificadas em threads antes do primeiro frame: (arquivo, tamanho, alpha)
+BACKGROUND_IMAGE = "Scene Overview.png"
+PRELOAD_IMAGES = [
+    (BACKGROUND_IMAGE, (SCREEN_W, SCREEN_H), False),
+    ("mestre-removebg-preview.png", (80, 80), True),
+    ("icon_accept.png", (32, 32), True),
+    ("icon_decline.png", (32, 32), True),
+    ("icon_dice.png", (32, 32), True),
+    ("icon_quest.png", (32, 32), True),
+    ("icon_potion.png", (32, 32), True),
+    ("icon_mana.png", (32, 32), True),
+]
+
+def preload_images(surf):
+    """Decodifica PRELOAD_IMAGES em paralelo mostrando a tela de carregamento"""
+    for filename, size, alpha in PRELOAD_IMAGES:
+        asset_loader.request(filename, size, alpha)
+    asset_loader.run_loading_screen(surf, "Preparando a mesa...", FONT_LARGE)
+
+def create_procedural_background(seed=None):
+    """Cria um fundo procedural como fallback: céu noturno com estrelas na metade de cima"""
+    return procedural.night_sky((SCREEN_W, SCREEN_H), (10, 5, 20), (50, 30, 55), stars=100, seed=seed)
 
 # ==================== SISTEMA DE FONTES ====================
 def load_themed_font(font_name, size):
-    font_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "font", font_name)
-    if os.path.exists(font_path):
-        try:
-            return pygame.font.Font(font_path, size)
-        except Exception as e:
-            print(f"[ERRO] Fonte {font_name} não pôde ser carregada: {e}")
-    return pygame.font.SysFont("georgia", size)
+    """Fonte do jogo pelo registro compartilhado, com Georgia se o arquivo faltar"""
+    return font_registry.get(f"{font_name},georgia", size)
 
 # Sistema de fontes hierárquico
-FONT_TINY = load_themed_font("MorrisRoman-Black.ttf", 14) or pygame.font.SysFont("georgia", 14)
-FONT_SMALL = load_themed_font("MorrisRoman-Black.ttf", 18) or pygame.font.SysFont("georgia", 18)
-FONT_NORMAL = load_themed_font("MorrisRoman-Black.ttf", 22) or pygame.font.SysFont("georgia", 22)
-FONT_MEDIUM = load_themed_font("MorrisRoman-Black.ttf", 26) or pygame.font.SysFont("georgia", 26)
-FONT_LARGE = load_themed_font("MorrisRoman-Black.ttf", 32) or pygame.font.SysFont("georgia", 32)
-FONT_TITLE = load_themed_font("MorrisRoman-Black.ttf", 42) or pygame.font.SysFont("georgia", 42)
-FONT_HEADER = load_themed_font("MorrisRoman-Black.ttf", 56) or pygame.font.SysFont("georgia", 56)
+FONT_TINY = load_themed_font("MorrisRoman-Black.ttf", 14)
+FONT_SMALL = load_themed_font("MorrisRoman-Black.ttf", 18)
+FONT_NORMAL = load_themed_font("MorrisRoman-Black.ttf", 22)
+FONT_MEDIUM = load_themed_font("MorrisRoman-Black.ttf", 26)
+FONT_LARGE = load_themed_font("MorrisRoman-Black.ttf", 32)
+FONT_TITLE = load_themed_font("MorrisRoman-Black.ttf", 42)
+FONT_HEADER = load_themed_font("MorrisRoman-Black.ttf", 56)
+FONT_DEBUG = font_registry.get(None, 18)  # fonte padrão do pygame, legível para números
 
 # ==================== SISTEMA DE HABILIDADES ====================
 class Ability:
@@ -262,7 +243,11 @@ class Ability:
             self.flash_timer = max(0.0, self.flash_timer - dt)
 
 # ==================== PERSONAGEM DO JOGADOR ====================
-class PlayerCharacter:
+class PlayerCharacter(Observable):
+    # Campos exibidos no painel do personagem: mudar um deles invalida a camada do HUD
+    watched_fields = frozenset({"name", "classe", "level", "hp", "max_hp", "mp", "max_mp",
+                                "exp", "exp_to_next", "portrait"})
+
     def __init__(self, name="Sir Alaric", classe="Guerreiro", level=1, max_hp=120, max_mp=40, forca=18):
         self.name = name
         self.classe = classe
@@ -324,9 +309,12 @@ class PlayerCharacter:
             self.alive = False
             
     def gain_exp(self, amount):
+        """Retorna True se o personagem subiu de nível"""
         self.exp += amount
         if self.exp >= self.exp_to_next:
             self.level_up()
+            return True
+        return False
             
     def level_up(self):
         self.level += 1
@@ -337,9 +325,6 @@ class PlayerCharacter:
         self.max_mp += 10
         self.mp = self.max_mp
         self.forca += 2
-        
-        dialog.push(f"⭐ {self.name} alcançou o nível {self.level}!", "Sistema")
-        dialog.push("Pontos de vida e mana aumentados! Força melhorada!", "Sistema")
     
     def update(self, dt):
         for a in self.abilities: 
@@ -348,8 +333,10 @@ class PlayerCharacter:
             self.damage_flash = max(0.0, self.damage_flash - dt)
 
 # ==================== INIMIGO ====================
-class GameEnemy:
-    def __init__(self, name, max_hp, atk, tipo, fraqueza, color_scheme=None, desc=""):
+class GameEnemy(Observable):
+    watched_fields = frozenset({"name", "hp", "max_hp", "tipo", "fraqueza", "color_scheme", "portrait"})
+
+    def __init__(self, name, max_hp, atk, tipo, fraqueza, color_scheme=None, desc="", animator=None):
         self.name = name
         self.max_hp = max_hp
         self.hp = max_hp
@@ -360,31 +347,35 @@ class GameEnemy:
         self.alive = True
         self.damage_flash = 0.0
         self.color_scheme = color_scheme or COLOR_DEEP_WOOD
+        # Flyweight: inimigos do mesmo tipo e esquema de cores dividem o mesmo retrato
         self.portrait = create_placeholder_icon((80, 80), self.color_scheme, "👹")
+        # Retrato animado (desenhado fora do cache do HUD); None usa o retrato estático
+        self.animator = animator
             
     def take_damage(self, dmg):
         self.hp = max(0, self.hp - dmg)
         self.damage_flash = 0.3
-        particle_system.add_particles(
-            SCREEN_W//2, 150, 
-            self.color_scheme, 
-            count=8, speed=3, size=4
-        )
         if self.hp <= 0: 
             self.alive = False
             
     def update(self, dt):
         if self.damage_flash > 0:
             self.damage_flash = max(0.0, self.damage_flash - dt)
+        if self.animator:
+            self.animator.update(dt)
 
 # ==================== DADOS DE EXEMPLO ====================
-player = PlayerCharacter("Sir Alaric de Eldoria", "Guerreiro", 1, 120, 40, 18)
-
-inimigos_comunidade = [
-    GameEnemy("Líder dos Assaltantes", 60, 12, "Humanoide", "Luz", COLOR_RICH_RED, "Chefe dos bandidos da região"),
-    GameEnemy("Espião do Conselho", 45, 10, "Humanoide", "Verdade", COLOR_MYSTIC_BLUE, "Infiltrado nas altas esferas"),
-    GameEnemy("Guarda Corrompido", 55, 14, "Humanoide", "Honra", COLOR_DEEP_RED, "Ex-membro da guarda real")
-]
+def create_player():
+    return PlayerCharacter("Sir Alaric de Eldoria", "Guerreiro", 1, 120, 40, 18)
+
+def create_enemy_roster():
+    return [
+        GameEnemy("Líder dos Assaltantes", 60, 12, "Humanoide", "Luz", COLOR_RICH_RED, "Chefe dos bandidos da região"),
+        GameEnemy("Espião do Conselho", 45, 10, "Humanoide", "Verdade", COLOR_MYSTIC_BLUE, "Infiltrado nas altas esferas"),
+        GameEnemy("Guarda Corrompido", 55, 14, "Humanoide", "Honra", COLOR_DEEP_RED, "Ex-membro da guarda real"),
+        GameEnemy("Demônio do Abismo", 90, 16, TipoInimigo.DEMONIO.value, "Luz Sagrada", COLOR_DEEP_RED,
+                  "Senhor das chamas que desperta sob as ruínas", animator=create_demon_animator())
+    ]
 
 # ==================== SISTEMA DE DIÁLOGO ====================
 class DialogueBox:
@@ -394,7 +385,10 @@ class DialogueBox:
         self.visible, self.text, self.speaker = True, "", "Mestre do Conclave"
         self.char_index, self.timer, self.speed = 0, 0.0, 0.03
         self.portrait = None
+        self.layout = None
+        self.hint_surf = None
         self.shake_timer = 0.0
+        self.dirty_state = DirtyState()
         
     def push(self, text, speaker="Mestre do Conclave", portrait=None, shake=False):
         self.queue.append((text, speaker, portrait))
@@ -405,12 +399,24 @@ class DialogueBox:
         if self.queue:
             self.text, self.speaker, self.portrait = self.queue.popleft()
             self.char_index, self.timer, self.visible = 0, 0.0, True
+            # Quebra de linhas calculada uma vez para a mensagem inteira
+            text_w = self.rect.w - (140 if self.portrait else 40)
+            self.layout = TypewriterText(self.text, FONT_NORMAL, text_w, COLOR_DARK_TEXT,
+                                         max_lines=4, line_height=28)
         else:
             self.visible, self.text, self.speaker = False, "", ""
+            self.layout = None
             
     def skip(self): 
         self.char_index = len(self.text)
         
+    def advance(self):
+        """Completa a mensagem atual ou passa para a próxima"""
+        if self.char_index < len(self.text):
+            self.skip()
+        else:
+            self.start_next()
+        
     def update(self, dt):
         if not self.visible and self.queue: 
             self.start_next()
@@ -434,14 +440,10 @@ class DialogueBox:
             
         rect = self.rect.move(offset_x, offset_y)
         
-        pygame.draw.rect(surf, COLOR_DEEP_WOOD, rect.inflate(8, 8), border_radius=12)
-        pygame.draw.rect(surf, COLOR_RICH_WOOD, rect, border_radius=10)
-        
-        inner_rect = rect.inflate(-8, -8)
-        gradient = create_gradient(inner_rect.width, inner_rect.height, COLOR_AGED_PARCHMENT, COLOR_GOLDEN_PARCHMENT)
-        surf.blit(gradient, inner_rect.topleft)
-        
-        pygame.draw.rect(surf, COLOR_BRIGHT_GOLD, rect, 3, border_radius=10)
+        # Painel pré-renderizado uma única vez (moldura + pergaminho + borda)
+        skin = gradient_cache.panel_skin(rect.size, COLOR_AGED_PARCHMENT, COLOR_GOLDEN_PARCHMENT,
+                                         COLOR_DEEP_WOOD, COLOR_RICH_WOOD, COLOR_BRIGHT_GOLD)
+        surf.blit(skin, (rect.x - 4, rect.y - 4))
         
         if self.portrait:
             portrait_rect = pygame.Rect(rect.x + 20, rect.y + 20, 80, 80)
@@ -456,45 +458,41 @@ class DialogueBox:
         pygame.draw.rect(surf, COLOR_DEEP_WOOD, name_bg, border_radius=6)
         pygame.draw.rect(surf, COLOR_BRIGHT_GOLD, name_bg, 2, border_radius=6)
         
-        name_txt = FONT_MEDIUM.render(self.speaker, True, COLOR_BRIGHT_GOLD)
+        name_txt = text_cache.render(FONT_MEDIUM, self.speaker, COLOR_BRIGHT_GOLD)
         surf.blit(name_txt, (text_x, rect.y + 15))
         
-        text_to_show = self.text[:self.char_index]
-        lines = wrap_text(text_to_show, rect.w - (text_x - rect.x) - 20, FONT_NORMAL)
-        
-        for i, line in enumerate(lines[:4]):
-            y_pos = rect.y + 60 + i * 28
-            text_surf = FONT_NORMAL.render(line, True, COLOR_DARK_TEXT)
-            surf.blit(text_surf, (text_x, y_pos))
+        if self.layout:
+            self.layout.reveal(self.char_index)
+            self.layout.draw(surf, text_x, rect.y + 60)
             
         if self.char_index >= len(self.text) and self.queue:
-            indicator_y = rect.bottom - 35
             pulse = math.sin(pygame.time.get_ticks() * 0.01) * 0.5 + 0.5
             alpha = int(150 + 105 * pulse)
-            hint_color = (*COLOR_DARK_TEXT, alpha)
-            hint_surf = FONT_SMALL.render("▼ Clique para continuar ▼", True, hint_color)
-            hint_final = pygame.Surface(hint_surf.get_size(), pygame.SRCALPHA)
-            hint_final.blit(hint_surf, (0, 0))
-            surf.blit(hint_final, (rect.centerx - hint_surf.get_width()//2, indicator_y))
-
-def wrap_text(text, max_width, font):
-    words = text.split(' ')
-    lines = []
-    current_line = []
-    
-    for word in words:
-        test_line = ' '.join(current_line + [word])
-        if font.size(test_line)[0] <= max_width:
-            current_line.append(word)
-        else:
-            if current_line:
-                lines.append(' '.join(current_line))
-            current_line = [word]
-    
-    if current_line:
-        lines.append(' '.join(current_line))
-    
-    return lines
+            hint = self.hint()
+            hint.set_alpha(alpha)
+            surf.blit(hint, self.hint_rect(rect))
+
+    def hint(self):
+        """Indicador "continuar" (cópia própria: o alpha muda a cada frame e não pode alterar o cache)"""
+        if self.hint_surf is None:
+            self.hint_surf = text_cache.render(FONT_SMALL, "▼ Clique para continuar ▼", COLOR_DARK_TEXT).copy()
+        return self.hint_surf
+
+    def hint_rect(self, rect):
+        """Onde o indicador é desenhado; a altura é a da superfície (os "▼" vêm de uma fonte reserva)"""
+        return self.hint().get_rect(midtop=(rect.centerx, rect.bottom - 35))
+
+    def dirty_rects(self):
+        """Retângulos alterados desde o último frame (modo retângulos sujos)"""
+        area = self.rect.inflate(14, 12)  # moldura + amplitude do tremor
+        state = (self.visible, self.text, self.speaker, self.char_index, self.shake_timer > 0)
+        rects = self.dirty_state.update(state, area if self.visible else None)
+        if self.visible and self.shake_timer > 0:
+            return [area]
+        if not rects and self.visible and self.char_index >= len(self.text) and self.queue:
+            # Só o indicador pulsante muda
+            rects = [self.hint_rect(self.rect)]
+        return rects
 
 # ==================== BOTÕES PREMIUM ====================
 class Button:
@@ -507,6 +505,7 @@ class Button:
         self.hover = False
         self.click_anim = 0.0
         self.pulse = 0.0
+        self.dirty_state = DirtyState()
         
     def handle_event(self, ev):
         if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1 and self.rect.collidepoint(ev.pos):
@@ -549,7 +548,7 @@ class Button:
             surf.blit(self.icon, icon_rect)
             
         text_color = COLOR_GOLDEN_PARCHMENT if self.hover else COLOR_AGED_PARCHMENT
-        label_surf = FONT_SMALL.render(self.label, True, text_color)
+        label_surf = text_cache.render(FONT_SMALL, self.label, text_color)
         text_y = draw_rect.centery + (15 if self.icon else 0)
         surf.blit(label_surf, (draw_rect.centerx - label_surf.get_width()//2, text_y - label_surf.get_height()//2))
         
@@ -557,12 +556,22 @@ class Button:
             tooltip_rect = pygame.Rect(self.rect.x, self.rect.y - 40, 200, 30)
             pygame.draw.rect(surf, COLOR_DEEP_WOOD, tooltip_rect, border_radius=4)
             pygame.draw.rect(surf, COLOR_BRIGHT_GOLD, tooltip_rect, 1, border_radius=4)
-            tooltip_text = FONT_TINY.render(self.tooltip, True, COLOR_GOLDEN_PARCHMENT)
+            tooltip_text = text_cache.render(FONT_TINY, self.tooltip, COLOR_GOLDEN_PARCHMENT)
             surf.blit(tooltip_text, (tooltip_rect.centerx - tooltip_text.get_width()//2, 
                                    tooltip_rect.centery - tooltip_text.get_height()//2))
 
+    def dirty_rects(self):
+        """Retângulos alterados desde o último frame (modo retângulos sujos)"""
+        area = self.rect.union(self.rect.move(3, 4)).union(self.rect.move(0, 5))  # sombra + clique
+        if self.hover and self.tooltip:
+            area.union_ip(pygame.Rect(self.rect.x, self.rect.y - 40, 200, 30))
+        pulse_alpha = int(50 + 30 * math.sin(self.pulse)) if self.hover else None
+        return self.dirty_state.update((self.hover, int(self.click_anim * 5), pulse_alpha), area)
+
 # ==================== SISTEMA DE MISSÕES ====================
-class Quest:
+class Quest(Observable):
+    watched_fields = frozenset({"title", "steps_completed", "total_steps"})
+
     def __init__(self, title, description, location_name, reward, story_hook=""):
         self.title = title
         self.description = description
@@ -583,8 +592,12 @@ class Quest:
     def get_progress(self):
         return f"{self.steps_completed}/{self.total_steps}"
 
-class QuestLog:
-    def __init__(self):
+class QuestLog(Observable):
+    watched_fields = frozenset({"active_quest"})
+
+    def __init__(self, dialog, particles):
+        self.dialog = dialog
+        self.particles = particles
         self.quests = []
         self.active_quest = None
         
@@ -592,22 +605,22 @@ class QuestLog:
         self.quests.append(quest)
         if not self.active_quest:
             self.active_quest = quest
-        dialog.push(f"📜 Nova Missão: {quest.title}", "Diário de Aventuras")
-        dialog.push(quest.story_hook, "Diário de Aventuras")
-        particle_system.add_particles(SCREEN_W//2, SCREEN_H//2, COLOR_BRIGHT_GOLD, count=20, speed=2)
+        self.dialog.push(f"📜 Nova Missão: {quest.title}", "Diário de Aventuras")
+        self.dialog.push(quest.story_hook, "Diário de Aventuras")
+        self.particles.add_particles(SCREEN_W//2, SCREEN_H//2, COLOR_BRIGHT_GOLD, count=20, speed=120)
         
     def complete_step(self, quest_title):
         for q in self.quests:
             if q.title == quest_title and not q.completed:
                 reward = q.complete_step()
                 if reward:
-                    dialog.push(f"🎉 Missão Concluída: {q.title}!", "Sistema")
-                    dialog.push(f"Recompensa: {reward}", "Sistema")
-                    particle_system.add_particles(SCREEN_W//2, SCREEN_H//2, COLOR_BRIGHT_GOLD, count=30, speed=3)
+                    self.dialog.push(f"🎉 Missão Concluída: {q.title}!", "Sistema")
+                    self.dialog.push(f"Recompensa: {reward}", "Sistema")
+                    self.particles.add_particles(SCREEN_W//2, SCREEN_H//2, COLOR_BRIGHT_GOLD, count=30, speed=180)
                     next_quests = [quest for quest in self.quests if not quest.completed]
                     self.active_quest = next_quests[0] if next_quests else None
                 else:
-                    dialog.push(f"⚡ Progresso em {q.title}: {q.get_progress()}", "Sistema")
+                    self.dialog.push(f"⚡ Progresso em {q.title}: {q.get_progress()}", "Sistema")
                 return True
         return False
     
@@ -617,71 +630,23 @@ class QuestLog:
     def get_completed(self):
         return [q for q in self.quests if q.completed]
 
-quest_log = QuestLog()
-
-area_quests = {
-    "Vila de Eldoria": Quest(
-        "Proteger a Vila", 
-        "Derrote os bandidos que ameaçam a paz da vila",
-        "Vila de Eldoria",
-        "100 moedas de ouro e reputação",
-        "Bandidos têm aterrorizado os comerciantes. A vila precisa de um herói para restaurar a paz."
-    ),
-}
-
-# ==================== FUNÇÕES DE USO GERAL ====================
-def show_quest_log():
-    active = quest_log.get_active()
-    completed = quest_log.get_completed()
-    
-    if not active and not completed:
-        dialog.push("Seu diário de aventuras está vazio. Aceite missões para preenchê-lo!", "Diário de Aventuras")
-        return
-        
-    if active:
-        dialog.push("📜 MISSÕES ATIVAS:", "Diário de Aventuras")
-        for q in active:
-            dialog.push(f"• {q.title} [{q.get_progress()}]", "Diário de Aventuras")
-            dialog.push(f"  {q.description}", "Diário de Aventuras")
-            
-    if completed:
-        dialog.push("✅ MISSÕES CONCLUÍDAS:", "Diário de Aventuras")
-        for q in completed:
-            dialog.push(f"• {q.title} - Recompensa: {q.reward}", "Diário de Aventuras")
-
-def use_potion(potion_type):
-    if player.inventory.get(potion_type, 0) > 0:
-        player.inventory[potion_type] -= 1
-        if potion_type == "Poção de Vida":
-            player.hp = min(player.max_hp, player.hp + 35)
-            dialog.push(f"❤️ {potion_type} restaura 35 de vida!", player.name)
-            particle_system.add_particles(SCREEN_W//4, SCREEN_H//2, COLOR_RICH_RED, count=12, speed=2)
-        elif potion_type == "Poção de Mana":
-            player.mp = min(player.max_mp, player.mp + 25)
-            dialog.push(f"💧 {potion_type} restaura 25 de mana!", player.name)
-            particle_system.add_particles(SCREEN_W//4, SCREEN_H//2, COLOR_MYSTIC_BLUE, count=12, speed=2)
-    else:
-        dialog.push(f"❌ Sem {potion_type} no inventário!", "Sistema")
-
-def on_roll():
-    result = roll_dice(20)
-    dice_anim.start(result)
-
-def accept_mission():
-    quest = area_quests.get("Vila de Eldoria")
-    if quest and quest.title not in [x.title for x in quest_log.quests]:
-        quest_log.add(quest)
-    dialog.push("Você aceita o chamado do destino. Que sua lâmina seja rápida e seu coração, corajoso.", "Mestre do Conclave")
-    enemy = random.choice(inimigos_comunidade)
-    start_combat(enemy)
-
-def decline_mission():
-    dialog.push("O destino aguarda, mas cada herói escolhe seu próprio caminho. Talvez outra hora...", "Mestre do Conclave")
+def create_area_quests():
+    return {
+        "Vila de Eldoria": Quest(
+            "Proteger a Vila", 
+            "Derrote os bandidos que ameaçam a paz da vila",
+            "Vila de Eldoria",
+            "100 moedas de ouro e reputação",
+            "Bandidos têm aterrorizado os comerciantes. A vila precisa de um herói para restaurar a paz."
+        ),
+    }
 
 # ==================== ANIMAÇÃO DE DADOS ====================
 class DiceAnimation:
-    def __init__(self, x, y, size=140):
+    def __init__(self, x, y, particles, narrate, size=140):
         self.rect = pygame.Rect(x, y, size, size)
+        self.particles = particles
+        self.narrate = narrate
         self.rolling = False
         self.timer = 0.0
         self.duration = 1.5
@@ -690,12 +655,19 @@ class DiceAnimation:
         self.font = FONT_HEADER
         self.spin_speed = 0.0
         self.particles_emitted = False
+        self.dirty_state = DirtyState()
+        
+    def spin_value(self):
+        """Número mostrado enquanto o dado gira (cosmético: não usa o fluxo de dados do jogo)"""
+        expr = self.result.expression
+        return random.randint(expr.minimum, expr.maximum)
         
     def start(self, result, callback=None):
+        """Anima uma rolagem já feita (dice.DiceRoll); narrate e callback recebem a rolagem"""
         self.rolling = True
         self.timer = 0.0
         self.result = result
-        self.current_value = random.randint(1, 20)
+        self.current_value = self.spin_value()
         self.spin_speed = 30.0
         self.particles_emitted = False
         self.callback = callback
@@ -708,30 +680,30 @@ class DiceAnimation:
         self.spin_speed = max(5.0, self.spin_speed - dt * 20)
         
         if self.timer < self.duration:
-            self.current_value = random.randint(1, 20)
+            self.current_value = self.spin_value()
             
             if self.timer > self.duration * 0.7 and not self.particles_emitted:
-                particle_system.add_particles(
+                self.particles.add_particles(
                     self.rect.centerx, self.rect.centery,
-                    COLOR_BRIGHT_GOLD, count=15, speed=4, size=5
+                    COLOR_BRIGHT_GOLD, count=15, speed=240, size=5
                 )
                 self.particles_emitted = True
         else:
-            self.current_value = self.result
+            self.current_value = self.result.total
             self.rolling = False
             
-            if self.result == 20:
-                particle_system.add_particles(
+            if self.result.is_critical:
+                self.particles.add_particles(
                     self.rect.centerx, self.rect.centery,
-                    COLOR_BRIGHT_GOLD, count=25, speed=6, size=6, lifetime=2.0
+                    COLOR_BRIGHT_GOLD, count=25, speed=360, size=6, lifetime=2.0
                 )
-            elif self.result == 1:
-                particle_system.add_particles(
+            elif self.result.is_fumble:
+                self.particles.add_particles(
                     self.rect.centerx, self.rect.centery,
-                    COLOR_DEEP_RED, count=15, speed=4, size=4
+                    COLOR_DEEP_RED, count=15, speed=240, size=4
                 )
                 
-            narrate_roll_result(self.result)
+            self.narrate(self.result)
             if callable(self.callback):
                 try:
                     self.callback(self.result)
@@ -745,10 +717,11 @@ class DiceAnimation:
         shadow_rect = self.rect.move(6, 6)
         pygame.draw.rect(surf, COLOR_SHADOW, shadow_rect, border_radius=20)
         
-        if self.current_value == 20:
+        expr = self.result.expression
+        if self.current_value == expr.maximum:
             dice_color = COLOR_BRIGHT_GOLD
             border_color = COLOR_BRIGHT_GOLD
-        elif self.current_value == 1:
+        elif self.current_value == expr.minimum:
             dice_color = COLOR_DEEP_RED
             border_color = COLOR_RICH_RED
         else:
@@ -758,188 +731,36 @@ class DiceAnimation:
         pygame.draw.rect(surf, dice_color, self.rect, border_radius=15)
         pygame.draw.rect(surf, border_color, self.rect, 4, border_radius=15)
         
-        num_surf = FONT_HEADER.render(str(self.current_value), True, COLOR_DARK_TEXT)
+        num_surf = text_cache.render(FONT_HEADER, str(self.current_value), COLOR_DARK_TEXT)
         surf.blit(num_surf, (self.rect.centerx - num_surf.get_width()//2,
                            self.rect.centery - num_surf.get_height()//2))
 
-dice_anim = DiceAnimation(SCREEN_W//2 - 70, SCREEN_H//2 - 70)
+    def dirty_rects(self):
+        """Retângulos alterados desde o último frame (modo retângulos sujos)"""
+        visible = self.rolling or self.result is not None
+        area = self.rect.union(self.rect.move(6, 6)) if visible else None
+        return self.dirty_state.update((visible, self.current_value, self.result), area)
 
 # ==================== SISTEMA DE COMBATE ====================
-GAME_STATE = {"mode":"explore"}
-current_enemy = None
-player_turn = True
-combat_log = deque(maxlen=8)
-combat_background = None
-
-def create_combat_background():
+def create_combat_background(seed=None):
+    """Fundo de combate com 50 pingos; o mesmo seed repete o mesmo fundo"""
+    rng = random.Random(seed)
     bg = pygame.Surface((SCREEN_W, SCREEN_H))
     bg.fill(COLOR_DEEP_WOOD)
     
     for i in range(50):
-        x = random.randint(0, SCREEN_W)
-        y = random.randint(0, SCREEN_H)
-        size = random.randint(2, 6)
-        color = random.choice([COLOR_RICH_RED, COLOR_DEEP_RED, COLOR_DARK_BORDER])
+        x = rng.randint(0, SCREEN_W)
+        y = rng.randint(0, SCREEN_H)
+        size = rng.randint(2, 6)
+        color = rng.choice([COLOR_RICH_RED, COLOR_DEEP_RED, COLOR_DARK_BORDER])
         pygame.draw.circle(bg, color, (x, y), size)
-        
     return bg
 
-def roll_dice(sides=20):
-    return random.randint(1, sides)
-
-def narrate_roll_result(result, difficulty=15):
-    if result == 20:
-        dialog.push("🎯 CRÍTICO! Os deuses sorriem para você!", "Sistema de Dados")
-        dialog.push("Seu ataque é devastador! Efeitos dobrados!", "Sistema de Dados")
-    elif result >= difficulty:
-        dialog.push(f"🎲 Sucesso! {result} supera a dificuldade {difficulty}", "Sistema de Dados")
-    elif result == 1:
-        dialog.push("💀 FALHA CRÍTICA! O destino se volta contra você!", "Sistema de Dados")
-        dialog.push("Algo terrivelmente errado acontece...", "Sistema de Dados")
-    else:
-        dialog.push(f"🎲 Falha... {result} não é suficiente", "Sistema de Dados")
-
-def start_combat(enemy: GameEnemy):
-    GAME_STATE["mode"] = "combat"
-    global current_enemy, player_turn, combat_background
-    current_enemy, player_turn = enemy, True
-    combat_log.clear()
-    combat_background = create_combat_background()
-    
-    dialog.push(f"⚔️ COMBATE INICIADO! {enemy.name} avança!", "Sistema de Batalha")
-    dialog.push(f"Tipo: {enemy.tipo} | Fraqueza: {enemy.fraqueza}", "Sistema de Batalha")
-    particle_system.add_particles(SCREEN_W//2, 100, enemy.color_scheme, count=20, speed=3)
-
-def enemy_action():
-    global current_enemy, player_turn
-    if not current_enemy or not current_enemy.alive: 
-        return
-        
-    roll, total = roll_dice(), roll_dice()
-    dmg = max(1, current_enemy.atk + (total // 10))
-    
-    player.take_damage(dmg)
-    combat_log.appendleft(f"💥 {current_enemy.name} ataca! {dmg} de dano!")
-    
-    particle_system.add_particles(
-        SCREEN_W//4, SCREEN_H//2, 
-        COLOR_DEEP_RED, count=12, speed=2
-    )
-    
-    if player.hp <= 0:
-        dialog.push("☠️ Você foi derrotado... A escuridão consome seu espírito.", "Sistema de Batalha")
-        GAME_STATE["mode"] = "defeated"
-    else:
-        player_turn = True
-
-def player_use_ability(idx):
-    global player_turn, current_enemy
-    a = player.abilities[idx]
-    
-    if not a.ready():
-        dialog.push(f"⏳ {a.name} em recarga: {a.remaining:.1f}s", "Sistema")
-        return
-        
-    if player.mp < a.cost_mp:
-        dialog.push("💧 Energia mística insuficiente!", "Sistema")
-        return
-        
-    if not a.use():
-        return
-        
-    player.mp -= a.cost_mp
-    
-    if GAME_STATE["mode"] != "combat":
-        if a.power < 0:
-            heal_amount = -a.power
-            player.hp = min(player.max_hp, player.hp + heal_amount)
-            dialog.push(f"✨ {a.name} restaura {heal_amount} de vida!", player.name)
-            particle_system.add_particles(
-                SCREEN_W//4, SCREEN_H//2,
-                COLOR_MYSTIC_BLUE, count=15, speed=2
-            )
-        return
-        
-    if not player_turn:
-        dialog.push("🛑 Ainda não é sua vez!", "Sistema")
-        return
-        
-    roll, total = roll_dice(), roll_dice()
-    hit = (roll + player.level) >= 10
-    
-    if hit:
-        dmg = a.power + (player.level // 2) + (total // 12)
-        current_enemy.take_damage(dmg)
-        combat_log.appendleft(f"⭐ {a.name} acerta! {dmg} de dano em {current_enemy.name}")
-        
-        if a.tipo == "Físico":
-            particle_system.add_particles(
-                SCREEN_W*3//4, SCREEN_H//2,
-                player.color_scheme, count=10, speed=3
-            )
-        elif a.tipo == "Magia":
-            particle_system.add_particles(
-                SCREEN_W*3//4, SCREEN_H//2,
-                COLOR_MYSTIC_BLUE, count=15, speed=4
-            )
-    else:
-        combat_log.appendleft(f"💫 {a.name} erra! ({roll}+{player.level})")
-        
-    if not current_enemy.alive:
-        victory_sequence()
-    else:
-        player_turn = False
-        pygame.time.set_timer(pygame.USEREVENT + 1, 1200)
-
-def victory_sequence():
-    global current_enemy
-    exp_gain = current_enemy.max_hp // 3
-    gold_gain = random.randint(20, 60)
-    
-    player.gain_exp(exp_gain)
-    dialog.push(f"🎉 Vitória! {current_enemy.name} foi derrotado!", "Sistema de Batalha")
-    dialog.push(f"⭐ +{exp_gain} EXP | 💰 +{gold_gain} Moedas", "Sistema de Batalha")
-    
-    particle_system.add_particles(
-        SCREEN_W//2, SCREEN_H//2,
-        COLOR_BRIGHT_GOLD, count=40, speed=5, size=6, lifetime=2.0
-    )
-    
-    GAME_STATE["mode"] = "explore"
-    current_enemy = None
-    
-    if quest_log.active_quest:
-        quest_log.complete_step(quest_log.active_quest.title)
-
-# ==================== INTERFACE DO USUÁRIO ====================
-buttons = []
-
-# Botões principais
-btn_accept = Button((SCREEN_W//2 - 240, SCREEN_H - 200, 220, 50), "Aceitar Destino", accept_mission, "icon_accept.png", "Embarque nesta jornada épica")
-btn_decline = Button((SCREEN_W//2 + 20, SCREEN_H - 200, 220, 50), "Recusar Chamado", decline_mission, "icon_decline.png", "Prossiga por outros caminhos")
-buttons.extend([btn_accept, btn_decline])
-
-# Botões de habilidade
-ability_buttons = []
-btn_size = 80
-padding = 15
-start_x = SCREEN_W - (btn_size + 20)
-start_y = SCREEN_H - (btn_size + 20) - 80
-
-for i, ability in enumerate(player.abilities):
-    rect = (start_x - i*(btn_size + padding), start_y, btn_size, btn_size)
-    callback = lambda idx=i: player_use_ability(idx)
-    btn = Button(rect, "", callback, f"skill_{ability.name.lower()}.png", ability.desc)
-    ability_buttons.append(btn)
-    buttons.append(btn)
-
-# Botões de ação
-roll_btn = Button((SCREEN_W - 160, 30, 130, 40), "Rolar d20", on_roll, "icon_dice.png", "Teste sua sorte contra o destino")
-buttons.append(roll_btn)
-
-buttons.append(Button((SCREEN_W - 160, 85, 130, 40), "Missões", show_quest_log, "icon_quest.png", "Revise suas missões e progresso"))
-buttons.append(Button((SCREEN_W - 160, 140, 130, 40), "Poção Vida", lambda: use_potion("Poção de Vida"), "icon_potion.png", "Restaura 35 pontos de vida"))
-buttons.append(Button((SCREEN_W - 160, 195, 130, 40), "Poção Mana", lambda: use_potion("Poção de Mana"), "icon_mana.png", "Restaura 25 pontos de mana"))
+# Expressões de dados (dice.py) usadas pelas regras; combat_sim.py repete as mesmas
+CHECK_ROLL = "1d20"    # botão "Rolar d20": teste contra a dificuldade
+HIT_ROLL = "1d20"      # acerto do jogador: rolagem + nível >= 10
+BONUS_ROLL = "1d20"    # bônus de dano: jogador + rolagem // 12, inimigo + rolagem // 10
+GOLD_RANGE = (20, 60)  # moedas da vitória, uniforme
 
 # ==================== FUNÇÕES DE DESENHO ====================
 def draw_panel(surf, rect, color, border_color, shadow_color, border_radius=8):
@@ -959,7 +780,7 @@ def draw_bar(surf, x, y, w, h, current, maximum, color, label="", show_numbers=T
     
     if show_numbers:
         text = f"{label}{current}/{maximum}"
-        text_surf = FONT_SMALL.render(text, True, COLOR_GOLDEN_PARCHMENT)
+        text_surf = text_cache.render(FONT_SMALL, text, COLOR_GOLDEN_PARCHMENT)
         surf.blit(text_surf, (x + w//2 - text_surf.get_width()//2, y + h//2 - text_surf.get_height()//2))
 
 def draw_character_portrait(surf, rect, character, is_flashing=False):
@@ -967,182 +788,608 @@ def draw_character_portrait(surf, rect, character, is_flashing=False):
     draw_panel(surf, frame_rect, COLOR_RICH_WOOD, COLOR_BRIGHT_GOLD, COLOR_SHADOW, border_radius=12)
     
     if is_flashing:
-        flash_overlay = pygame.Surface(rect.size, pygame.SRCALPHA)
-        flash_overlay.fill((255, 50, 50, 100))
-        surf.blit(flash_overlay, rect.topleft)
+        draw_damage_flash(surf, rect)
     
-    if character.portrait:
+    if character.portrait and not getattr(character, "animator", None):
         surf.blit(character.portrait, rect.topleft)
 
-# ==================== CARREGAR IMAGENS ESPECÍFICAS ====================
-print("[INFO] Iniciando carregamento de imagens...")
-world_map = load_background_robust()
-mestre_portrait = load_image_robust("mestre-removebg-preview.png", (80, 80), "🧙")
-print("[INFO] Carregamento de imagens concluído")
-
-# ==================== DIÁLOGO INICIAL ====================
-dialog = DialogueBox((50, SCREEN_H - 220, SCREEN_W - 100, 180))
-
-sage_portrait = create_placeholder_icon((80, 80), COLOR_MYSTIC_BLUE, "🧙")
-
-# Narrativa introdutória épica
-dialog.push(
-    "Era o Ano da Serpente Prateada, quando as estrelas se alinhavam para o grande Conclave. "
-    "Três luas cheias haviam nascido desde que a Profecia do Renascimento fora revelada...",
-    "Crônicas de Eldoria", None, True
-)
-
-dialog.push(
-    "Você, nobre aventureiro, é convocado para o Conclave de Eldoria. "
-    "Seu nome ecoa nas tavernas, suas façanhas são sussurradas nos ventos. "
-    "O reino precisa de um herói para desvendar os Mistérios das Eras.",
-    "Arquimedes, o Sábio", sage_portrait
-)
-
-dialog.push(
-    "A Vila de Eldoria clama por ajuda. Bandidos têm aterrorizado os comerciantes e a paz está ameaçada. "
-    "Você aceita este chamado do destino?",
-    "Mestre do Conclave", mestre_portrait
-)
-
-# ==================== LOOP PRINCIPAL ====================
-running = True
-print("[INFO] Iniciando loop principal do jogo...")
-
-while running:
-    dt = clock.tick(FPS) / 1000.0
-    mouse_pos = pygame.mouse.get_pos()
-
-    for event in pygame.event.get():
+flash_overlays = {}
+
+def draw_damage_flash(surf, rect):
+    overlay = flash_overlays.get(rect.size)
+    if overlay is None:
+        overlay = flash_overlays[rect.size] = pygame.Surface(rect.size, pygame.SRCALPHA)
+        overlay.fill((255, 50, 50, 100))
+    surf.blit(overlay, rect.topleft)
+
+# ==================== HUD EM CAMADAS ====================
+# Os painéis são desenhados em coordenadas locais da camada e só recompostos
+# quando um campo observado muda; o flash de dano fica fora do cache.
+PLAYER_PORTRAIT_RECT = pygame.Rect(50, 50, 100, 100)
+ENEMY_PORTRAIT_RECT = pygame.Rect(SCREEN_W//2 - 180, 50, 80, 80)
+PROFILER_POS = (SCREEN_W - 330, 250)
+
+# ==================== MOTOR DO JOGO ====================
+class GameEngine:
+    """
+    Estado completo de uma partida: jogador, missões, diálogo, combate e interface.
+    process_events(events) trata a entrada, update(dt) avança a simulação em um passo
+    fixo e render(surf, alpha) desenha o frame interpolando entre os dois últimos
+    passos. Nenhum deles abre janela, então o motor também roda com SDL_VIDEODRIVER=dummy.
+    """
+
+    def __init__(self, dice_seed=DICE_SEED):
+        self.running = True
+        self.mode = "explore"
+        self.mouse_pos = (0, 0)
+        self.profiler = frame_profiler
+        self.show_profiler = False  # overlay alternado com F3
+        self.profiler_dirty = DirtyState()
+        self.particles = ParticleSystem()
+        self.dialog = DialogueBox((50, SCREEN_H - 220, SCREEN_W - 100, 180))
+        self.dice_anim = DiceAnimation(SCREEN_W//2 - 70, SCREEN_H//2 - 70, self.particles, self.narrate_roll_result)
+        
+        # Dados: um fluxo semeado por sessão e um filho dele por combate
+        self.dice = DiceRoller(dice_seed)
+        self.combat_dice = self.dice
+        
+        # Combate
+        self.enemies = create_enemy_roster()
+        self.current_enemy = None
+        self.player_turn = True
+        self.combat_log = deque(maxlen=8)
+        self.combat_background = None
+        self.enemy_timer = 0.0  # contagem até o turno do inimigo
+        # Gravação do combate atual (combat_replay.py); None fora de combate
+        self.recorder = None
+        self.record_dir = combat_replay.RECORD_DIR if combat_replay.ENABLED else None
+        
+        # Imagens específicas
+        print("[INFO] Iniciando carregamento de imagens...")
+        self.world_map = load_background_robust()
+        self.mestre_portrait = load_image_robust("mestre-removebg-preview.png", (80, 80), "🧙")
+        self.sage_portrait = create_placeholder_icon((80, 80), COLOR_MYSTIC_BLUE, "🧙")
+        print("[INFO] Carregamento de imagens concluído")
+        
+        # HUD em camadas (largura extra no painel do personagem: o nome pode passar do painel)
+        self.player_hud = HudLayer((30, 30, 480, 204), self.render_player_hud)
+        self.enemy_hud = HudLayer((SCREEN_W//2 - 300, 30, 600, 180), self.render_enemy_hud)
+        self.log_hud = HudLayer((SCREEN_W//2 - 300, 200, 604, 124), self.render_log_hud)
+        self.mode_dirty = DirtyState()
+        self.enemy_portrait_dirty = DirtyState()
+        
+        self.area_quests = create_area_quests()
+        self.reset_player()
+        self.create_buttons()
+        self.push_intro()
+        
+    def reset_player(self):
+        """Cria um novo personagem e um diário de missões vazio"""
+        self.player = create_player()
+        self.quest_log = QuestLog(self.dialog, self.particles)
+        self.bind_player_hud()
+        
+    def bind_player_hud(self):
+        """Liga o painel do personagem ao jogador e às missões que ele exibe"""
+        self.player.observe(self.player_hud.invalidate)
+        self.quest_log.observe(self.player_hud.invalidate)
+        for quest in self.area_quests.values():
+            quest.observe(self.player_hud.invalidate)
+        self.player_hud.invalidate()
+        
+    # ==================== INTERFACE DO USUÁRIO ====================
+    def create_buttons(self):
+        self.buttons = []
+        
+        # Botões principais
+        self.btn_accept = Button((SCREEN_W//2 - 240, SCREEN_H - 200, 220, 50), "Aceitar Destino", self.accept_mission, "icon_accept.png", "Embarque nesta jornada épica")
+        self.btn_decline = Button((SCREEN_W//2 + 20, SCREEN_H - 200, 220, 50), "Recusar Chamado", self.decline_mission, "icon_decline.png", "Prossiga por outros caminhos")
+        self.buttons.extend([self.btn_accept, self.btn_decline])
+        
+        # Botões de habilidade
+        self.ability_buttons = []
+        btn_size = 80
+        padding = 15
+        start_x = SCREEN_W - (btn_size + 20)
+        start_y = SCREEN_H - (btn_size + 20) - 80
+        
+        for i, ability in enumerate(self.player.abilities):
+            rect = (start_x - i*(btn_size + padding), start_y, btn_size, btn_size)
+            callback = lambda idx=i: self.player_use_ability(idx)
+            btn = Button(rect, "", callback, f"skill_{ability.name.lower()}.png", ability.desc)
+            self.ability_buttons.append(btn)
+            self.buttons.append(btn)
+            
+        # Botões de ação
+        self.roll_btn = Button((SCREEN_W - 160, 30, 130, 40), "Rolar d20", self.on_roll, "icon_dice.png", "Teste sua sorte contra o destino")
+        self.buttons.append(self.roll_btn)
+        
+        self.buttons.append(Button((SCREEN_W - 160, 85, 130, 40), "Missões", self.show_quest_log, "icon_quest.png", "Revise suas missões e progresso"))
+        self.buttons.append(Button((SCREEN_W - 160, 140, 130, 40), "Poção Vida", lambda: self.use_potion("Poção de Vida"), "icon_potion.png", "Restaura 35 pontos de vida"))
+        self.buttons.append(Button((SCREEN_W - 160, 195, 130, 40), "Poção Mana", lambda: self.use_potion("Poção de Mana"), "icon_mana.png", "Restaura 25 pontos de mana"))
+        
+    # ==================== DIÁLOGO INICIAL ====================
+    def push_intro(self):
+        # Narrativa introdutória épica
+        self.dialog.push(
+            "Era o Ano da Serpente Prateada, quando as estrelas se alinhavam para o grande Conclave. "
+            "Três luas cheias haviam nascido desde que a Profecia do Renascimento fora revelada...",
+            "Crônicas de Eldoria", None, True
+        )
+        
+        self.dialog.push(
+            "Você, nobre aventureiro, é convocado para o Conclave de Eldoria. "
+            "Seu nome ecoa nas tavernas, suas façanhas são sussurradas nos ventos. "
+            "O reino precisa de um herói para desvendar os Mistérios das Eras.",
+            "Arquimedes, o Sábio", self.sage_portrait
+        )
+        
+        self.dialog.push(
+            "A Vila de Eldoria clama por ajuda. Bandidos têm aterrorizado os comerciantes e a paz está ameaçada. "
+            "Você aceita este chamado do destino?",
+            "Mestre do Conclave", self.mestre_portrait
+        )
+        
+    def restart(self):
+        self.reset_player()
+        self.mode = "explore"
+        self.current_enemy = None
+        self.dialog.queue.clear()
+        self.dialog.push("Uma nova chance surge das cinzas...", "Renascimento")
+        self.dialog.push("O destino oferece outro caminho. Escolha sabiamente.", "Mestre do Conclave", self.mestre_portrait)
+        
+    # ==================== SIMULAÇÃO ====================
+    def handle_event(self, event):
         if event.type == pygame.QUIT:
-            running = False
+            self.running = False
             
         elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_SPACE and dialog.visible:
-                if dialog.char_index < len(dialog.text):
-                    dialog.skip()
-                else:
-                    dialog.start_next()
-                    
+            if event.key == pygame.K_SPACE and self.dialog.visible:
+                self.dialog.advance()
+            elif event.key == pygame.K_r and self.mode == "defeated":
+                self.restart()
+            elif event.key == pygame.K_F3:
+                self.show_profiler = not self.show_profiler
+                
+        elif event.type == pygame.MOUSEMOTION:
+            self.mouse_pos = event.pos
+            
         elif event.type == pygame.MOUSEBUTTONDOWN:
-            if dialog.visible and dialog.rect.collidepoint(event.pos):
-                if dialog.char_index < len(dialog.text):
-                    dialog.skip()
-                else:
-                    dialog.start_next()
-                    
-            for button in buttons:
+            self.mouse_pos = event.pos
+            if self.dialog.visible and self.dialog.rect.collidepoint(event.pos):
+                self.dialog.advance()
+                
+            for button in self.buttons:
                 button.handle_event(event)
                 
-        elif event.type == pygame.USEREVENT + 1:
-            pygame.time.set_timer(pygame.USEREVENT + 1, 0)
-            if GAME_STATE["mode"] == "combat" and current_enemy and current_enemy.alive:
-                enemy_action()
-
-    player.update(dt)
-    particle_system.update(dt)
-    dialog.update(dt)
-    dice_anim.update(dt)
-    
-    if current_enemy:
-        current_enemy.update(dt)
+    def process_events(self, events):
+        with self.profiler.section("events"):
+            for event in events:
+                self.handle_event(event)
+                
+    def step(self, dt, events=()):
+        """Processa os eventos e avança a simulação em dt segundos; retorna False ao sair"""
+        self.process_events(events)
+        self.update(dt)
+        return self.running
+        
+    def update(self, dt):
+        """Um passo de simulação; no loop principal dt é sempre o passo fixo"""
+        profiler = self.profiler
+        with profiler.section("player.update"):
+            self.advance_combat(dt)
+        with profiler.section("particles.update"):
+            self.particles.update(dt)
+        with profiler.section("dialog.update"):
+            self.dialog.update(dt)
+        with profiler.section("dice_anim.update"):
+            self.dice_anim.update(dt)
+            
+        with profiler.section("ui.update"):
+            if self.current_enemy:
+                self.current_enemy.update(dt)
+            for button in self.buttons:
+                button.update(self.mouse_pos, dt)
+                
+        profiler.count("partículas", len(self.particles))
+        profiler.count("cache de texto %", text_cache.hit_rate() * 100.0)
+        profiler.count("quadros em cache", len(frame_cache))
+        
+    def advance_combat(self, dt):
+        """Parte do passo que decide o combate: turno do inimigo e recargas (a reexecução usa só esta)"""
+        if self.enemy_timer > 0:
+            self.enemy_timer = max(0.0, self.enemy_timer - dt)
+            if self.enemy_timer == 0.0 and self.mode == "combat" and self.current_enemy and self.current_enemy.alive:
+                self.enemy_action()
+        self.player.update(dt)
+        if self.recorder:
+            self.recorder.tick(dt)
+        
+    # ==================== FUNÇÕES DE USO GERAL ====================
+    def show_quest_log(self):
+        active = self.quest_log.get_active()
+        completed = self.quest_log.get_completed()
+        
+        if not active and not completed:
+            self.dialog.push("Seu diário de aventuras está vazio. Aceite missões para preenchê-lo!", "Diário de Aventuras")
+            return
+            
+        if active:
+            self.dialog.push("📜 MISSÕES ATIVAS:", "Diário de Aventuras")
+            for q in active:
+                self.dialog.push(f"• {q.title} [{q.get_progress()}]", "Diário de Aventuras")
+                self.dialog.push(f"  {q.description}", "Diário de Aventuras")
+                
+        if completed:
+            self.dialog.push("✅ MISSÕES CONCLUÍDAS:", "Diário de Aventuras")
+            for q in completed:
+                self.dialog.push(f"• {q.title} - Recompensa: {q.reward}", "Diário de Aventuras")
+                
+    def use_potion(self, potion_type):
+        player = self.player
+        if player.inventory.get(potion_type, 0) > 0:
+            player.inventory[potion_type] -= 1
+            if potion_type == "Poção de Vida":
+                player.hp = min(player.max_hp, player.hp + 35)
+                self.dialog.push(f"❤️ {potion_type} restaura 35 de vida!", player.name)
+                self.particles.add_particles(SCREEN_W//4, SCREEN_H//2, COLOR_RICH_RED, count=12, speed=120)
+            elif potion_type == "Poção de Mana":
+                player.mp = min(player.max_mp, player.mp + 25)
+                self.dialog.push(f"💧 {potion_type} restaura 25 de mana!", player.name)
+                self.particles.add_particles(SCREEN_W//4, SCREEN_H//2, COLOR_MYSTIC_BLUE, count=12, speed=120)
+            if self.recorder and potion_type in combat_replay.POTIONS:
+                self.recorder.potion(potion_type, player.hp, player.mp)
+        else:
+            self.dialog.push(f"❌ Sem {potion_type} no inventário!", "Sistema")
+            
+    def on_roll(self):
+        self.dice_anim.start(self.dice.roll(CHECK_ROLL))
+        
+    def accept_mission(self):
+        quest = self.area_quests.get("Vila de Eldoria")
+        if quest and quest.title not in [x.title for x in self.quest_log.quests]:
+            self.quest_log.add(quest)
+        self.dialog.push("Você aceita o chamado do destino. Que sua lâmina seja rápida e seu coração, corajoso.", "Mestre do Conclave")
+        enemy = random.choice(self.enemies)
+        self.start_combat(enemy)
+        
+    def decline_mission(self):
+        self.dialog.push("O destino aguarda, mas cada herói escolhe seu próprio caminho. Talvez outra hora...", "Mestre do Conclave")
+        
+    # ==================== SISTEMA DE COMBATE ====================
+    def narrate_roll_result(self, result, difficulty=15):
+        """Narra uma dice.DiceRoll; com mais de um dado ou modificador mostra a conta"""
+        shown = result.total if result.natural == result.total else result.describe()
+        if result.is_critical:
+            self.dialog.push("🎯 CRÍTICO! Os deuses sorriem para você!", "Sistema de Dados")
+            self.dialog.push("Seu ataque é devastador! Efeitos dobrados!", "Sistema de Dados")
+        elif result.total >= difficulty:
+            self.dialog.push(f"🎲 Sucesso! {shown} supera a dificuldade {difficulty}", "Sistema de Dados")
+        elif result.is_fumble:
+            self.dialog.push("💀 FALHA CRÍTICA! O destino se volta contra você!", "Sistema de Dados")
+            self.dialog.push("Algo terrivelmente errado acontece...", "Sistema de Dados")
+        else:
+            self.dialog.push(f"🎲 Falha... {shown} não é suficiente", "Sistema de Dados")
+            
+    def start_combat(self, enemy: GameEnemy, dice=None):
+        """Começa um combate; `dice` substitui o fluxo de dados novo (reexecução de combates)"""
+        if self.recorder:
+            self.finish_recording(combat_replay.ABANDONED)
+        self.mode = "combat"
+        self.current_enemy, self.player_turn = enemy, True
+        self.enemy_timer = 0.0  # um turno pendente do combate anterior não passa para este
+        self.combat_log.clear()
+        self.combat_dice = dice or self.dice.spawn()
+        self.recorder = combat_replay.CombatRecorder(self.combat_dice.seed, self.player, enemy)
+        self.combat_background = None  # criado no primeiro frame do combate (a reexecução não desenha)
+        enemy.observe(self.enemy_hud.invalidate)
+        self.enemy_hud.invalidate()
+        self.log_hud.invalidate()
+        if enemy.animator:
+            enemy.animator.play("walk")
+        
+        self.dialog.push(f"⚔️ COMBATE INICIADO! {enemy.name} avança!", "Sistema de Batalha")
+        self.dialog.push(f"Tipo: {enemy.tipo} | Fraqueza: {enemy.fraqueza}", "Sistema de Batalha")
+        self.particles.add_particles(SCREEN_W//2, 100, enemy.color_scheme, count=20, speed=180)
+        
+    def enemy_action(self):
+        enemy = self.current_enemy
+        if not enemy or not enemy.alive: 
+            return
+            
+        total = self.combat_dice.roll(BONUS_ROLL).total
+        dmg = max(1, enemy.atk + (total // 10))
+        
+        self.player.take_damage(dmg)
+        if self.recorder:
+            self.recorder.enemy_attack(total, dmg, self.player.hp)
+        if enemy.animator:
+            enemy.animator.play("cleave")
+        self.combat_log.appendleft(f"💥 {enemy.name} ataca! {dmg} de dano!")
+        self.log_hud.invalidate()
+        
+        self.particles.add_particles(
+            SCREEN_W//4, SCREEN_H//2, 
+            COLOR_DEEP_RED, count=12, speed=120
+        )
+        
+        if self.player.hp <= 0:
+            self.dialog.push("☠️ Você foi derrotado... A escuridão consome seu espírito.", "Sistema de Batalha")
+            self.mode = "defeated"
+            self.finish_recording(combat_replay.DEFEAT)
+        else:
+            self.player_turn = True
+            self.enemy_hud.invalidate()
+            
+    def player_use_ability(self, idx):
+        player = self.player
+        a = player.abilities[idx]
+        
+        if not a.ready():
+            self.dialog.push(f"⏳ {a.name} em recarga: {a.remaining:.1f}s", "Sistema")
+            return
+            
+        if player.mp < a.cost_mp:
+            self.dialog.push("💧 Energia mística insuficiente!", "Sistema")
+            return
+            
+        if not a.use():
+            return
+            
+        player.mp -= a.cost_mp
         
-    for button in buttons:
-        button.update(mouse_pos, dt)
+        if self.mode != "combat":
+            if a.power < 0:
+                heal_amount = -a.power
+                player.hp = min(player.max_hp, player.hp + heal_amount)
+                self.dialog.push(f"✨ {a.name} restaura {heal_amount} de vida!", player.name)
+                self.particles.add_particles(
+                    SCREEN_W//4, SCREEN_H//2,
+                    COLOR_MYSTIC_BLUE, count=15, speed=120
+                )
+            return
+            
+        if not self.player_turn:
+            self.dialog.push("🛑 Ainda não é sua vez!", "Sistema")
+            if self.recorder:
+                self.recorder.ability(idx, combat_replay.OUT_OF_TURN, mp=player.mp)
+            return
+            
+        enemy = self.current_enemy
+        roll = self.combat_dice.roll(HIT_ROLL).total
+        total = self.combat_dice.roll(BONUS_ROLL).total
+        hit = (roll + player.level) >= 10
+        
+        if hit:
+            dmg = a.power + (player.level // 2) + (total // 12)
+            enemy.take_damage(dmg)
+            self.particles.add_particles(SCREEN_W//2, 150, enemy.color_scheme, count=8, speed=180, size=4)
+            self.combat_log.appendleft(f"⭐ {a.name} acerta! {dmg} de dano em {enemy.name}")
+            
+            if a.tipo == "Físico":
+                self.particles.add_particles(
+                    SCREEN_W*3//4, SCREEN_H//2,
+                    player.color_scheme, count=10, speed=180
+                )
+            elif a.tipo == "Magia":
+                self.particles.add_particles(
+                    SCREEN_W*3//4, SCREEN_H//2,
+                    COLOR_MYSTIC_BLUE, count=15, speed=240
+                )
+        else:
+            self.combat_log.appendleft(f"💫 {a.name} erra! ({roll}+{player.level})")
+        if self.recorder:
+            self.recorder.ability(idx, combat_replay.HIT if hit else combat_replay.MISS,
+                                  roll, total, dmg if hit else 0, enemy.hp, player.mp)
+        self.log_hud.invalidate()
+            
+        if not enemy.alive:
+            self.victory_sequence()
+        else:
+            self.player_turn = False
+            self.enemy_hud.invalidate()
+            self.enemy_timer = ENEMY_TURN_DELAY
+            
+    def victory_sequence(self):
+        enemy = self.current_enemy
+        exp_gain = enemy.max_hp // 3
+        gold_gain = self.combat_dice.between(*GOLD_RANGE)
+        
+        if self.player.gain_exp(exp_gain):
+            self.dialog.push(f"⭐ {self.player.name} alcançou o nível {self.player.level}!", "Sistema")
+            self.dialog.push("Pontos de vida e mana aumentados! Força melhorada!", "Sistema")
+        self.dialog.push(f"🎉 Vitória! {enemy.name} foi derrotado!", "Sistema de Batalha")
+        self.dialog.push(f"⭐ +{exp_gain} EXP | 💰 +{gold_gain} Moedas", "Sistema de Batalha")
+        
+        self.particles.add_particles(
+            SCREEN_W//2, SCREEN_H//2,
+            COLOR_BRIGHT_GOLD, count=40, speed=300, size=6, lifetime=2.0
+        )
+        
+        self.finish_recording(combat_replay.VICTORY, gold_gain)
+        self.mode = "explore"
+        self.current_enemy = None
+        
+        if self.quest_log.active_quest:
+            self.quest_log.complete_step(self.quest_log.active_quest.title)
+            
+    def finish_recording(self, result, gold=0):
+        """Fecha a gravação do combate atual e salva o arquivo (se a gravação estiver ligada)"""
+        recorder, self.recorder = self.recorder, None
+        if recorder is None:
+            return
+        recorder.finish(result, self.player, self.current_enemy, gold)
+        if self.record_dir:
+            recorder.save(self.record_dir)
+            
+    # ==================== HUD EM CAMADAS ====================
+    def render_player_hud(self, surf):
+        player = self.player
+        draw_panel(surf, pygame.Rect(0, 0, 360, 200), COLOR_RICH_WOOD, COLOR_WARM_GOLD, COLOR_SHADOW, border_radius=12)
+        draw_character_portrait(surf, PLAYER_PORTRAIT_RECT.move(-30, -30), player)
+        
+        info_x = 140
+        surf.blit(text_cache.render(FONT_LARGE, player.name, COLOR_BRIGHT_GOLD), (info_x, 15))
+        surf.blit(text_cache.render(FONT_SMALL, f"{player.classe} Nv.{player.level}", COLOR_GOLDEN_PARCHMENT), (info_x, 50))
+        
+        draw_bar(surf, info_x, 75, 200, 22, player.hp, player.max_hp, COLOR_RICH_RED, "❤️ ")
+        draw_bar(surf, info_x, 102, 200, 18, player.mp, player.max_mp, COLOR_MYSTIC_BLUE, "💧 ")
+        
+        exp_ratio = player.exp / player.exp_to_next
+        exp_text = f"⭐ EXP: {player.exp}/{player.exp_to_next} ({exp_ratio*100:.1f}%)"
+        surf.blit(text_cache.render(FONT_TINY, exp_text, COLOR_GOLDEN_PARCHMENT), (info_x, 125))
+        
+        exp_bar_rect = pygame.Rect(info_x, 140, 200, 8)
+        pygame.draw.rect(surf, COLOR_DEEP_WOOD, exp_bar_rect, border_radius=4)
+        if exp_ratio > 0:
+            exp_fill = pygame.Rect(info_x, 140, int(200 * exp_ratio), 8)
+            pygame.draw.rect(surf, COLOR_BRIGHT_GOLD, exp_fill, border_radius=4)
+        
+        if self.quest_log.active_quest:
+            quest_text = f"🎯 {self.quest_log.active_quest.title} [{self.quest_log.active_quest.get_progress()}]"
+            surf.blit(text_cache.render(FONT_TINY, quest_text, COLOR_GOLDEN_PARCHMENT), (20, 155))
+
+    def render_enemy_hud(self, surf):
+        # Origem da camada: (SCREEN_W//2 - 300, 30)
+        enemy = self.current_enemy
+        draw_panel(surf, pygame.Rect(100, 0, 400, 140), COLOR_RICH_WOOD, enemy.color_scheme, COLOR_SHADOW, border_radius=12)
+        draw_character_portrait(surf, ENEMY_PORTRAIT_RECT.move(-(SCREEN_W//2 - 300), -30), enemy)
+        
+        surf.blit(text_cache.render(FONT_LARGE, enemy.name, enemy.color_scheme), (220, 15))
+        surf.blit(text_cache.render(FONT_SMALL, f"{enemy.tipo}", COLOR_GOLDEN_PARCHMENT), (220, 50))
+        surf.blit(text_cache.render(FONT_SMALL, f"⚡ Fraqueza: {enemy.fraqueza}", COLOR_GOLDEN_PARCHMENT), (220, 75))
+        
+        draw_bar(surf, 220, 95, 250, 20, enemy.hp, enemy.max_hp, enemy.color_scheme, "❤️ ")
+        
+        turn_text = "🎲 SUA VEZ" if self.player_turn else f"⚡ VEZ DE {enemy.name.upper()}"
+        turn_color = COLOR_BRIGHT_GOLD if self.player_turn else enemy.color_scheme
+        turn_surf = text_cache.render(FONT_MEDIUM, turn_text, turn_color)
+        surf.blit(turn_surf, (300 - turn_surf.get_width()//2, 140))
 
-    # Renderização
-    screen.blit(world_map, (0, 0))
-    
-    if GAME_STATE["mode"] == "combat":
-        combat_overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        combat_overlay.fill((0, 0, 0, 100))
-        screen.blit(combat_overlay, (0, 0))
-        if combat_background:
-            screen.blit(combat_background, (0, 0))
-    
-    # Painel do personagem
-    panel_rect = pygame.Rect(30, 30, 360, 200)
-    draw_panel(screen, panel_rect, COLOR_RICH_WOOD, COLOR_WARM_GOLD, COLOR_SHADOW, border_radius=12)
-    
-    portrait_rect = pygame.Rect(50, 50, 100, 100)
-    draw_character_portrait(screen, portrait_rect, player, player.damage_flash > 0)
-    
-    info_x = 170
-    screen.blit(FONT_LARGE.render(player.name, True, COLOR_BRIGHT_GOLD), (info_x, 45))
-    screen.blit(FONT_SMALL.render(f"{player.classe} Nv.{player.level}", True, COLOR_GOLDEN_PARCHMENT), (info_x, 80))
-    
-    draw_bar(screen, info_x, 105, 200, 22, player.hp, player.max_hp, COLOR_RICH_RED, "❤️ ")
-    draw_bar(screen, info_x, 132, 200, 18, player.mp, player.max_mp, COLOR_MYSTIC_BLUE, "💧 ")
-    
-    exp_ratio = player.exp / player.exp_to_next
-    exp_text = f"⭐ EXP: {player.exp}/{player.exp_to_next} ({exp_ratio*100:.1f}%)"
-    screen.blit(FONT_TINY.render(exp_text, True, COLOR_GOLDEN_PARCHMENT), (info_x, 155))
-    
-    exp_bar_rect = pygame.Rect(info_x, 170, 200, 8)
-    pygame.draw.rect(screen, COLOR_DEEP_WOOD, exp_bar_rect, border_radius=4)
-    if exp_ratio > 0:
-        exp_fill = pygame.Rect(info_x, 170, int(200 * exp_ratio), 8)
-        pygame.draw.rect(screen, COLOR_BRIGHT_GOLD, exp_fill, border_radius=4)
-    
-    if quest_log.active_quest:
-        quest_text = f"🎯 {quest_log.active_quest.title} [{quest_log.active_quest.get_progress()}]"
-        screen.blit(FONT_TINY.render(quest_text, True, COLOR_GOLDEN_PARCHMENT), (50, 185))
-    
-    # Painel de combate
-    if GAME_STATE["mode"] == "combat" and current_enemy:
-        enemy_panel = pygame.Rect(SCREEN_W//2 - 200, 30, 400, 140)
-        draw_panel(screen, enemy_panel, COLOR_RICH_WOOD, current_enemy.color_scheme, COLOR_SHADOW, border_radius=12)
+    def render_log_hud(self, surf):
+        draw_panel(surf, pygame.Rect(0, 0, 600, 120), COLOR_DEEP_WOOD, COLOR_WARM_GOLD, COLOR_SHADOW, border_radius=10)
         
-        enemy_portrait_rect = pygame.Rect(SCREEN_W//2 - 180, 50, 80, 80)
-        draw_character_portrait(screen, enemy_portrait_rect, current_enemy, current_enemy.damage_flash > 0)
+        for i, entry in enumerate(list(self.combat_log)[:5]):
+            log_surf = text_cache.render(FONT_SMALL, entry, COLOR_GOLDEN_PARCHMENT)
+            surf.blit(log_surf, (10, 10 + i * 22))
         
-        screen.blit(FONT_LARGE.render(current_enemy.name, True, current_enemy.color_scheme), (SCREEN_W//2 - 80, 45))
-        screen.blit(FONT_SMALL.render(f"{current_enemy.tipo}", True, COLOR_GOLDEN_PARCHMENT), (SCREEN_W//2 - 80, 80))
-        screen.blit(FONT_SMALL.render(f"⚡ Fraqueza: {current_enemy.fraqueza}", True, COLOR_GOLDEN_PARCHMENT), (SCREEN_W//2 - 80, 105))
+    # ==================== RENDERIZAÇÃO DO FRAME ====================
+    def collect_dirty_rects(self, renderer):
+        """Pergunta a cada widget o que mudou desde o último frame"""
+        renderer.mark(*self.mode_dirty.update((self.mode, id(self.combat_background)), renderer.screen_rect))
         
-        draw_bar(screen, SCREEN_W//2 - 80, 125, 250, 20, current_enemy.hp, current_enemy.max_hp, current_enemy.color_scheme, "❤️ ")
+        renderer.mark(*self.player_hud.dirty_rects(self.player.damage_flash > 0))
+        in_combat = self.mode == "combat" and self.current_enemy is not None
+        enemy_flash = in_combat and self.current_enemy.damage_flash > 0
+        renderer.mark(*self.enemy_hud.dirty_rects(enemy_flash, visible=in_combat))
+        animator = self.current_enemy.animator if in_combat else None
+        renderer.mark(*self.enemy_portrait_dirty.update(animator and animator.frame_key,
+                                                        ENEMY_PORTRAIT_RECT if animator else None))
+        renderer.mark(*self.log_hud.dirty_rects(visible=in_combat))
         
-        turn_text = "🎲 SUA VEZ" if player_turn else f"⚡ VEZ DE {current_enemy.name.upper()}"
-        turn_color = COLOR_BRIGHT_GOLD if player_turn else current_enemy.color_scheme
-        turn_surf = FONT_MEDIUM.render(turn_text, True, turn_color)
-        screen.blit(turn_surf, (SCREEN_W//2 - turn_surf.get_width()//2, 170))
+        for button in self.buttons:
+            renderer.mark(*button.dirty_rects())
+        renderer.mark(*self.dialog.dirty_rects())
+        renderer.mark(*self.dice_anim.dirty_rects())
+        renderer.mark(*self.particles.dirty_rects())
         
-        log_panel = pygame.Rect(SCREEN_W//2 - 300, 200, 600, 120)
-        draw_panel(screen, log_panel, COLOR_DEEP_WOOD, COLOR_WARM_GOLD, COLOR_SHADOW, border_radius=10)
+        area = self.profiler.overlay_rect(PROFILER_POS) if self.show_profiler else None
+        renderer.mark(*self.profiler_dirty.update(self.show_profiler, area))
+        if self.show_profiler:
+            renderer.mark(area or renderer.screen_rect)
         
-        for i, entry in enumerate(list(combat_log)[:5]):
-            log_surf = FONT_SMALL.render(entry, True, COLOR_GOLDEN_PARCHMENT)
-            screen.blit(log_surf, (SCREEN_W//2 - 290, 210 + i * 22))
-    
-    for button in buttons:
-        button.draw(screen)
+    def render(self, surf, alpha=1.0):
+        """Desenha o frame inteiro; no modo retângulos sujos o recorte da superfície limita a área"""
+        profiler = self.profiler
+        with profiler.section("draw.background"):
+            surf.blit(self.world_map, (0, 0))
+            
+            if self.mode == "combat":
+                combat_overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+                combat_overlay.fill((0, 0, 0, 100))
+                surf.blit(combat_overlay, (0, 0))
+                if self.combat_background is None:
+                    self.combat_background = create_combat_background()
+                surf.blit(self.combat_background, (0, 0))
+                    
+        # Painéis do HUD (camadas em cache)
+        with profiler.section("draw.hud"):
+            self.player_hud.draw(surf)
+            if self.player.damage_flash > 0:
+                draw_damage_flash(surf, PLAYER_PORTRAIT_RECT)
+                
+            if self.mode == "combat" and self.current_enemy:
+                self.enemy_hud.draw(surf)
+                if self.current_enemy.animator:
+                    self.current_enemy.animator.draw(surf, ENEMY_PORTRAIT_RECT)
+                if self.current_enemy.damage_flash > 0:
+                    draw_damage_flash(surf, ENEMY_PORTRAIT_RECT)
+                self.log_hud.draw(surf)
+                
+        with profiler.section("draw.buttons"):
+            for button in self.buttons:
+                button.draw(surf)
+                
+        with profiler.section("draw.dialog"):
+            self.dialog.draw(surf)
+        with profiler.section("draw.dice"):
+            self.dice_anim.draw(surf)
+        with profiler.section("draw.particles"):
+            self.particles.draw(surf, alpha)
+            
+        if self.mode == "defeated":
+            defeat_overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+            defeat_overlay.fill((0, 0, 0, 150))
+            surf.blit(defeat_overlay, (0, 0))
+            
+            defeat_text = text_cache.render(FONT_HEADER, "FIM DA JORNADA", COLOR_DEEP_RED)
+            surf.blit(defeat_text, (SCREEN_W//2 - defeat_text.get_width()//2, SCREEN_H//2 - 50))
+            
+            restart_text = text_cache.render(FONT_MEDIUM, "Pressione R para recomeçar", COLOR_GOLDEN_PARCHMENT)
+            surf.blit(restart_text, (SCREEN_W//2 - restart_text.get_width()//2, SCREEN_H//2 + 20))
+            
+        if self.show_profiler:
+            profiler.draw(surf, FONT_DEBUG, PROFILER_POS)
+
+# ==================== LOOP PRINCIPAL ====================
+def main():
+    pygame.mixer.init()
+    screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
+    pygame.display.set_caption("RPG de Mesa — O Conclave de Eldoria: Renascimento das Eras")
+    clock = pygame.time.Clock()
     
-    dialog.draw(screen)
-    dice_anim.draw(screen)
-    particle_system.draw(screen)
+    preload_images(screen)
+    engine = GameEngine()
+    timestep = FixedTimestep(SIM_HZ, MAX_SIM_STEPS)
+    dirty_renderer = DirtyRectRenderer((SCREEN_W, SCREEN_H)) if DIRTY_RECTS else None
+    print("[INFO] Iniciando loop principal do jogo...")
     
-    if GAME_STATE["mode"] == "defeated":
-        defeat_overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        defeat_overlay.fill((0, 0, 0, 150))
-        screen.blit(defeat_overlay, (0, 0))
-        
-        defeat_text = FONT_HEADER.render("FIM DA JORNADA", True, COLOR_DEEP_RED)
-        screen.blit(defeat_text, (SCREEN_W//2 - defeat_text.get_width()//2, SCREEN_H//2 - 50))
-        
-        restart_text = FONT_MEDIUM.render("Pressione R para recomeçar", True, COLOR_GOLDEN_PARCHMENT)
-        screen.blit(restart_text, (SCREEN_W//2 - restart_text.get_width()//2, SCREEN_H//2 + 20))
-        
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_r]:
-            player = PlayerCharacter("Sir Alaric de Eldoria", "Guerreiro", 1, 120, 40, 18)
-            GAME_STATE["mode"] = "explore"
-            current_enemy = None
-            quest_log = QuestLog()
-            dialog.queue.clear()
-            dialog.push("Uma nova chance surge das cinzas...", "Renascimento")
-            dialog.push("O destino oferece outro caminho. Escolha sabiamente.", "Mestre do Conclave", mestre_portrait)
-
-    pygame.display.flip()
+    while engine.running:
+        frame_dt = clock.tick(FPS) / 1000.0
+        engine.process_events(pygame.event.get())
+        
+        # Simulação em passos fixos: a taxa de frames não altera o jogo
+        steps = timestep.advance(frame_dt)
+        for _ in range(steps):
+            engine.update(timestep.dt)
+        engine.profiler.count("passos de simulação", steps)  # >1: recuperando frames atrasados
+        
+        # Renderização
+        if dirty_renderer:
+            engine.collect_dirty_rects(dirty_renderer)
+            if dirty_renderer.begin_frame(screen):
+                engine.render(screen, timestep.alpha)
+                with engine.profiler.section("display.flip"):
+                    dirty_renderer.present(screen)
+        else:
+            engine.render(screen, timestep.alpha)
+            with engine.profiler.section("display.flip"):
+                pygame.display.flip()
+        engine.profiler.end_frame()
+        report_first_frame("RPG_Jogo")
+            
+    pygame.quit()
+    sys.exit()
 
-pygame.quit()
-sys.exit()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
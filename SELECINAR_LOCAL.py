@@ -2,6 +2,10 @@ import pygame
 import sys
 import math
 
+from render_cache import text_cache, gradient_cache
+import procedural
+from fonts import font_registry
+
 pygame.init()
 
 # --------------------
@@ -11,6 +15,7 @@ SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Seletor de Local - Reinos de Eldoria")
+FPS = 60
 
 # CORES APERFEIÇOADAS
 AZUL_FUNDO = (26, 36, 47)
@@ -26,17 +31,11 @@ VERDE_BOTAO = (50, 120, 60)
 VERDE_BOTAO_HOVER = (70, 150, 80)
 BRONZE = (140, 120, 83)
 
-# FONTES
-try:
-    titulo_font = pygame.font.SysFont("timesnewroman", 72, bold=True)
-    sub_font = pygame.font.SysFont("timesnewroman", 32, bold=True)
-    desc_font = pygame.font.SysFont("timesnewroman", 22)
-    botao_font = pygame.font.SysFont("timesnewroman", 28, bold=True)
-except:
-    titulo_font = pygame.font.Font(None, 72)
-    sub_font = pygame.font.Font(None, 32)
-    desc_font = pygame.font.Font(None, 22)
-    botao_font = pygame.font.Font(None, 28)
+# FONTES (sem Times New Roman no sistema, o registro usa a fonte padrão)
+titulo_font = font_registry.get("timesnewroman", 72, bold=True)
+sub_font = font_registry.get("timesnewroman", 32, bold=True)
+desc_font = font_registry.get("timesnewroman", 22)
+botao_font = font_registry.get("timesnewroman", 28, bold=True)
 
 # EFEITOS VISUAIS
 class ParticleSystem:
@@ -113,16 +112,28 @@ locais = [
 # FUNÇÕES APERFEIÇOADAS
 # --------------------
 
+# Camada estática (gradiente, título e subtítulo): montada uma vez, depois só um blit por frame
+fundo_estatico = None
+
+def criar_fundo_estatico():
+    fundo = procedural.vertical_gradient((SCREEN_WIDTH, SCREEN_HEIGHT), AZUL_FUNDO, AZUL_FUNDO_ESCURO)
+
+    # Título principal com efeito
+    titulo_texto = text_cache.render(titulo_font, "SELETOR DE LOCAL", DOURADO_CLARO)
+    titulo_sombra = text_cache.render(titulo_font, "SELETOR DE LOCAL", MARROM_ESCURO)
+    fundo.blit(titulo_sombra, (SCREEN_WIDTH // 2 - titulo_texto.get_width() // 2 + 3, 53))
+    fundo.blit(titulo_texto, (SCREEN_WIDTH // 2 - titulo_texto.get_width() // 2, 50))
+
+    # Subtítulo
+    subtitulo = text_cache.render(desc_font, "Escolha seu destino nos Reinos de Eldoria", CREME)
+    fundo.blit(subtitulo, (SCREEN_WIDTH // 2 - subtitulo.get_width() // 2, 120))
+    return fundo
+
 def desenhar_fundo_decorativo():
-    # Gradiente de fundo
-    for y in range(SCREEN_HEIGHT):
-        alpha = y / SCREEN_HEIGHT
-        cor = (
-            int(AZUL_FUNDO[0] * (1 - alpha) + AZUL_FUNDO_ESCURO[0] * alpha),
-            int(AZUL_FUNDO[1] * (1 - alpha) + AZUL_FUNDO_ESCURO[1] * alpha),
-            int(AZUL_FUNDO[2] * (1 - alpha) + AZUL_FUNDO_ESCURO[2] * alpha)
-        )
-        pygame.draw.line(screen, cor, (0, y), (SCREEN_WIDTH, y))
+    global fundo_estatico
+    if fundo_estatico is None:
+        fundo_estatico = criar_fundo_estatico()
+    screen.blit(fundo_estatico, (0, 0))
     
     # Estrelas cintilantes (CORRIGIDO)
     tempo = pygame.time.get_ticks() / 1000
@@ -147,116 +158,112 @@ def desenhar_borda_medieval():
     ]
     pygame.draw.lines(screen, DOURADO_CLARO, True, pontos, 4)
 
-def desenhar_cartao(local, x, y, largura, altura, selecionado=False, hover=False):
-    # Sombra
-    if selecionado:
-        shadow_surf = pygame.Surface((largura, altura), pygame.SRCALPHA)
-        shadow_surf.fill((0, 0, 0, 50))
-        screen.blit(shadow_surf, (x + 8, y + 8))
-    
-    # Fundo do cartão com gradiente
+def criar_cartao(local, largura, altura, selecionado, hover):
+    """Cartão completo em uma superfície própria (coordenadas relativas ao canto do cartão)"""
+    cartao = pygame.Surface((largura, altura), pygame.SRCALPHA)
+
+    # Fundo do cartão: mistura de 30% da cor do local com o creme
     cor_base = local["cor_destaque"]
-    for i in range(altura):
-        alpha = i / altura
-        cor = (
-            int(cor_base[0] * 0.3 + CREME[0] * 0.7),
-            int(cor_base[1] * 0.3 + CREME[1] * 0.7),
-            int(cor_base[2] * 0.3 + CREME[2] * 0.7)
-        )
-        pygame.draw.line(screen, cor, (x, y + i), (x + largura, y + i))
+    cartao.fill((
+        int(cor_base[0] * 0.3 + CREME[0] * 0.7),
+        int(cor_base[1] * 0.3 + CREME[1] * 0.7),
+        int(cor_base[2] * 0.3 + CREME[2] * 0.7)
+    ))
     
     # Borda destacada para selecionado/hover
     cor_borda = DOURADO_BRILLHANTE if selecionado else (DOURADO_CLARO if hover else BRONZE)
     espessura_borda = 4 if selecionado else (3 if hover else 2)
     
-    pygame.draw.rect(screen, cor_borda, (x, y, largura, altura), espessura_borda, border_radius=12)
+    pygame.draw.rect(cartao, cor_borda, (0, 0, largura, altura), espessura_borda, border_radius=12)
     
     # Título com sombra
-    titulo_texto = sub_font.render(local["titulo"], True, MARROM_ESCURO)
-    titulo_sombra = sub_font.render(local["titulo"], True, (0, 0, 0))
-    screen.blit(titulo_sombra, (x + 22, y + 22))
-    screen.blit(titulo_texto, (x + 20, y + 20))
+    titulo_texto = text_cache.render(sub_font, local["titulo"], MARROM_ESCURO)
+    titulo_sombra = text_cache.render(sub_font, local["titulo"], (0, 0, 0))
+    cartao.blit(titulo_sombra, (22, 22))
+    cartao.blit(titulo_texto, (20, 20))
 
     # Área da imagem
-    img_rect = pygame.Rect(x + 15, y + 60, largura - 30, 120)
-    pygame.draw.rect(screen, local["cor_destaque"], img_rect, border_radius=8)
-    pygame.draw.rect(screen, MARROM_ESCURO, img_rect, 2, border_radius=8)
+    img_rect = pygame.Rect(15, 60, largura - 30, 120)
+    pygame.draw.rect(cartao, local["cor_destaque"], img_rect, border_radius=8)
+    pygame.draw.rect(cartao, MARROM_ESCURO, img_rect, 2, border_radius=8)
     
     # Ícone representativo
     if selecionado:
-        pygame.draw.polygon(screen, DOURADO_CLARO, [
-            (x + largura//2, y + 90),
-            (x + largura//2 - 20, y + 130),
-            (x + largura//2 + 20, y + 130)
+        pygame.draw.polygon(cartao, DOURADO_CLARO, [
+            (largura//2, 90),
+            (largura//2 - 20, 130),
+            (largura//2 + 20, 130)
         ])
 
     # Descrição
     descricao = quebrar_texto(local["descricao"], desc_font, largura - 40)
     offset_y = 190
     for linha in descricao:
-        texto = desc_font.render(linha, True, MARROM_ESCURO)
-        screen.blit(texto, (x + 20, y + offset_y))
+        texto = text_cache.render(desc_font, linha, MARROM_ESCURO)
+        cartao.blit(texto, (20, offset_y))
         offset_y += 22
 
     # Detalhes (apenas para selecionado)
     if selecionado:
         detalhes = quebrar_texto(local["detalhes"], desc_font, largura - 40)
         offset_y += 10
-        pygame.draw.line(screen, BRONZE, (x + 20, y + offset_y), (x + largura - 20, y + offset_y), 1)
+        pygame.draw.line(cartao, BRONZE, (20, offset_y), (largura - 20, offset_y), 1)
         offset_y += 15
         for linha in detalhes:
-            texto = desc_font.render(linha, True, VERMELHO_ESCURO)
-            screen.blit(texto, (x + 20, y + offset_y))
+            texto = text_cache.render(desc_font, linha, VERMELHO_ESCURO)
+            cartao.blit(texto, (20, offset_y))
             offset_y += 20
+    return cartao
 
-def desenhar_botao_start(hover=False):
-    x, y = SCREEN_WIDTH // 2 - 120, SCREEN_HEIGHT - 100
-    largura, altura = 240, 60
-    
+def desenhar_cartao(local, x, y, largura, altura, selecionado=False, hover=False):
     # Sombra
+    if selecionado:
+        shadow_surf = gradient_cache.surface(("sombra", largura, altura), lambda: criar_sombra(largura, altura))
+        screen.blit(shadow_surf, (x + 8, y + 8))
+
+    # O cartão só muda com o estado (selecionado/hover): renderizado uma vez por estado
+    chave = ("cartao", local["titulo"], largura, altura, selecionado, hover)
+    screen.blit(gradient_cache.surface(chave, lambda: criar_cartao(local, largura, altura, selecionado, hover)), (x, y))
+
+def criar_sombra(largura, altura):
     shadow_surf = pygame.Surface((largura, altura), pygame.SRCALPHA)
     shadow_surf.fill((0, 0, 0, 50))
-    screen.blit(shadow_surf, (x + 5, y + 5))
+    return shadow_surf
+
+def desenhar_botao_start(rect, hover=False):
+    x, y, largura, altura = rect
+    
+    # Sombra
+    screen.blit(gradient_cache.surface(("sombra", largura, altura), lambda: criar_sombra(largura, altura)), (x + 5, y + 5))
     
     # Gradiente do botão
     cor_base = VERDE_BOTAO_HOVER if hover else VERDE_BOTAO
-    for i in range(altura):
-        alpha = i / altura
-        cor = (
-            int(cor_base[0] * (1 - alpha) + DOURADO_CLARO[0] * alpha),
-            int(cor_base[1] * (1 - alpha) + DOURADO_CLARO[1] * alpha),
-            int(cor_base[2] * (1 - alpha) + DOURADO_CLARO[2] * alpha)
-        )
-        pygame.draw.line(screen, cor, (x, y + i), (x + largura, y + i))
+    screen.blit(gradient_cache.gradient((largura, altura), cor_base, DOURADO_CLARO), (x, y))
     
     # Borda
     cor_borda = DOURADO_BRILLHANTE if hover else DOURADO_CLARO
     pygame.draw.rect(screen, cor_borda, (x, y, largura, altura), 3, border_radius=15)
     
     # Texto
-    texto = botao_font.render("ENTRAR NO LOCAL", True, CREME)
-    sombra = botao_font.render("ENTRAR NO LOCAL", True, MARROM_ESCURO)
+    texto = text_cache.render(botao_font, "ENTRAR NO LOCAL", CREME)
+    sombra = text_cache.render(botao_font, "ENTRAR NO LOCAL", MARROM_ESCURO)
     screen.blit(sombra, (SCREEN_WIDTH // 2 - texto.get_width() // 2 + 2, y + 22))
     screen.blit(texto, (SCREEN_WIDTH // 2 - texto.get_width() // 2, y + 20))
-    
-    return pygame.Rect(x, y, largura, altura)
+
+def seta_navegacao_pontos(x, y, direita=False):
+    if direita:
+        return [(x, y), (x - 30, y - 20), (x - 30, y + 20)]
+    return [(x, y), (x + 30, y - 20), (x + 30, y + 20)]
 
 def desenhar_seta_navegacao(x, y, direita=False, ativa=True):
     cor = DOURADO_BRILLHANTE if ativa else BRONZE
-    pontos = []
-    
-    if direita:
-        pontos = [(x, y), (x - 30, y - 20), (x - 30, y + 20)]
-    else:
-        pontos = [(x, y), (x + 30, y - 20), (x + 30, y + 20)]
+    pontos = seta_navegacao_pontos(x, y, direita)
     
     pygame.draw.polygon(screen, cor, pontos)
     
     # Brilho para setas ativas
     if ativa:
         pygame.draw.polygon(screen, DOURADO_CLARO, pontos, 2)
-    
-    return pygame.Rect(min(p[0] for p in pontos), y - 20, 30, 40)
 
 def quebrar_texto(texto, fonte, largura_max):
     palavras = texto.split(' ')
@@ -273,49 +280,58 @@ def quebrar_texto(texto, fonte, largura_max):
         linhas.append(atual.strip())
     return linhas
 
-def desenhar_interface(indice, mouse_pos):
-    screen.fill(AZUL_FUNDO)
-    
-    # Elementos decorativos de fundo
-    desenhar_fundo_decorativo()
-    
-    # Título principal com efeito
-    titulo_texto = titulo_font.render("SELETOR DE LOCAL", True, DOURADO_CLARO)
-    titulo_sombra = titulo_font.render("SELETOR DE LOCAL", True, MARROM_ESCURO)
-    
-    screen.blit(titulo_sombra, (SCREEN_WIDTH // 2 - titulo_texto.get_width() // 2 + 3, 53))
-    screen.blit(titulo_texto, (SCREEN_WIDTH // 2 - titulo_texto.get_width() // 2, 50))
-    
-    # Subtítulo
-    subtitulo = desc_font.render("Escolha seu destino nos Reinos de Eldoria", True, CREME)
-    screen.blit(subtitulo, (SCREEN_WIDTH // 2 - subtitulo.get_width() // 2, 120))
-    
-    # Cartões com navegação horizontal
-    cartao_largura = 280
-    cartao_altura = 380
-    espacamento = 50
-    total_largura = len(locais) * (cartao_largura + espacamento) - espacamento
+# --------------------
+# LAYOUT (separado do desenho)
+# --------------------
+CARTAO_LARGURA = 280
+CARTAO_ALTURA = 380
+ESPACAMENTO = 50
+SETA_Y = 370
+
+def calcular_layout(indice):
+    """Retângulos de cartões, setas e botão para o índice atual; só muda quando o índice muda"""
+    total_largura = len(locais) * (CARTAO_LARGURA + ESPACAMENTO) - ESPACAMENTO
     start_x = (SCREEN_WIDTH - total_largura) // 2
     
     # Calcular posição base para efeito de parallax suave
-    offset_base = -indice * (cartao_largura + espacamento)
+    offset_base = -indice * (CARTAO_LARGURA + ESPACAMENTO)
     
     retangulos_cartoes = []
-    for i, local in enumerate(locais):
-        x = start_x + i * (cartao_largura + espacamento) + offset_base
+    for i in range(len(locais)):
+        x = start_x + i * (CARTAO_LARGURA + ESPACAMENTO) + offset_base
         y = 180
         
         # Efeito de elevação para cartão selecionado
         if i == indice:
             y -= 10
-        
-        hover = pygame.Rect(x, y, cartao_largura, cartao_altura).collidepoint(mouse_pos)
-        desenhar_cartao(local, x, y, cartao_largura, cartao_altura, i == indice, hover)
-        retangulos_cartoes.append((pygame.Rect(x, y, cartao_largura, cartao_altura), i))
+        retangulos_cartoes.append((pygame.Rect(x, y, CARTAO_LARGURA, CARTAO_ALTURA), i))
+    
+    def rect_seta(pontos):
+        return pygame.Rect(min(p[0] for p in pontos), SETA_Y - 20, 30, 40)
+    
+    return {
+        "indice": indice,
+        "cartoes": retangulos_cartoes,
+        "seta_esquerda": rect_seta(seta_navegacao_pontos(80, SETA_Y, False)),
+        "seta_direita": rect_seta(seta_navegacao_pontos(SCREEN_WIDTH - 80, SETA_Y, True)),
+        "botao_start": pygame.Rect(SCREEN_WIDTH // 2 - 120, SCREEN_HEIGHT - 100, 240, 60),
+    }
+
+def desenhar_interface(layout, mouse_pos):
+    indice = layout["indice"]
+    
+    # Elementos decorativos de fundo (gradiente, título e subtítulo já prontos)
+    desenhar_fundo_decorativo()
+    
+    # Cartões com navegação horizontal (os que estão fora da tela são pulados)
+    tela = screen.get_rect()
+    for rect, i in layout["cartoes"]:
+        if rect.move(8, 8).union(rect).colliderect(tela):
+            desenhar_cartao(locais[i], rect.x, rect.y, rect.width, rect.height, i == indice, rect.collidepoint(mouse_pos))
     
     # Setas de navegação
-    seta_esquerda = desenhar_seta_navegacao(80, 370, False, indice > 0)
-    seta_direita = desenhar_seta_navegacao(SCREEN_WIDTH - 80, 370, True, indice < len(locais) - 1)
+    desenhar_seta_navegacao(80, SETA_Y, False, indice > 0)
+    desenhar_seta_navegacao(SCREEN_WIDTH - 80, SETA_Y, True, indice < len(locais) - 1)
     
     # Indicador de posição
     indicador_y = 580
@@ -325,83 +341,91 @@ def desenhar_interface(indice, mouse_pos):
         pygame.draw.circle(screen, cor, (SCREEN_WIDTH // 2 - (len(locais) - 1) * 10 + i * 20, indicador_y), raio)
     
     # Botão START
-    botao_start_rect = pygame.Rect(SCREEN_WIDTH // 2 - 120, SCREEN_HEIGHT - 100, 240, 60)
-    botao_start = desenhar_botao_start(botao_start_rect.collidepoint(mouse_pos))
+    botao_start = layout["botao_start"]
+    desenhar_botao_start(botao_start, botao_start.collidepoint(mouse_pos))
     
     # Bordas decorativas
     desenhar_borda_medieval()
     
-    # Atualizar e desenhar partículas
-    particles.update()
+    # Partículas
     particles.draw(screen)
-    
-    return retangulos_cartoes, seta_esquerda, seta_direita, botao_start
 
 # --------------------
 # LOOP PRINCIPAL APERFEIÇOADO
 # --------------------
-indice_local = 0
-rodando = True
-ultimo_clique = 0
+def main():
+    indice_local = 0
+    layout = calcular_layout(indice_local)
+    rodando = True
+    ultimo_clique = 0
+    relogio = pygame.time.Clock()
 
-while rodando:
-    mouse_pos = pygame.mouse.get_pos()
-    tempo_atual = pygame.time.get_ticks()
-    
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            rodando = False
+    while rodando:
+        mouse_pos = pygame.mouse.get_pos()
+        tempo_atual = pygame.time.get_ticks()
         
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_RIGHT and indice_local < len(locais) - 1:
-                indice_local += 1
-                particles.add_particles(SCREEN_WIDTH - 80, 370, DOURADO_BRILLHANTE)
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                rodando = False
             
-            elif event.key == pygame.K_LEFT and indice_local > 0:
-                indice_local -= 1
-                particles.add_particles(80, 370, DOURADO_BRILLHANTE)
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_RIGHT and indice_local < len(locais) - 1:
+                    indice_local += 1
+                    particles.add_particles(SCREEN_WIDTH - 80, SETA_Y, DOURADO_BRILLHANTE)
+                
+                elif event.key == pygame.K_LEFT and indice_local > 0:
+                    indice_local -= 1
+                    particles.add_particles(80, SETA_Y, DOURADO_BRILLHANTE)
+                
+                elif event.key == pygame.K_RETURN:
+                    if tempo_atual - ultimo_clique > 500:  # Prevenir clique rápido
+                        print(f"🎮 Entrando em {locais[indice_local]['titulo']}...")
+                        ultimo_clique = tempo_atual
             
-            elif event.key == pygame.K_RETURN:
-                if tempo_atual - ultimo_clique > 500:  # Prevenir clique rápido
-                    print(f"🎮 Entrando em {locais[indice_local]['titulo']}...")
-                    ultimo_clique = tempo_atual
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                # Testa o clique nos retângulos do último layout, sem redesenhar nada
+                pos = event.pos
+                if layout["seta_esquerda"].collidepoint(pos) and indice_local > 0:
+                    indice_local -= 1
+                    particles.add_particles(80, SETA_Y, DOURADO_BRILLHANTE, 10)
+                
+                elif layout["seta_direita"].collidepoint(pos) and indice_local < len(locais) - 1:
+                    indice_local += 1
+                    particles.add_particles(SCREEN_WIDTH - 80, SETA_Y, DOURADO_BRILLHANTE, 10)
+                
+                elif layout["botao_start"].collidepoint(pos):
+                    if tempo_atual - ultimo_clique > 500:
+                        print(f"🎮 Entrando em {locais[indice_local]['titulo']}...")
+                        ultimo_clique = tempo_atual
+                
+                # Clique direto nos cartões
+                for rect, indice in layout["cartoes"]:
+                    if rect.collidepoint(pos) and indice != indice_local:
+                        indice_local = indice
+                        particles.add_particles(rect.centerx, rect.centery, locais[indice]["cor_destaque"], 15)
+                        break
+
+            if indice_local != layout["indice"]:
+                layout = calcular_layout(indice_local)
         
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            retangulos_cartoes, seta_esquerda, seta_direita, botao_start = desenhar_interface(indice_local, mouse_pos)
-            
-            if seta_esquerda.collidepoint(mouse_pos) and indice_local > 0:
-                indice_local -= 1
-                particles.add_particles(80, 370, DOURADO_BRILLHANTE, 10)
-            
-            elif seta_direita.collidepoint(mouse_pos) and indice_local < len(locais) - 1:
-                indice_local += 1
-                particles.add_particles(SCREEN_WIDTH - 80, 370, DOURADO_BRILLHANTE, 10)
-            
-            elif botao_start.collidepoint(mouse_pos):
-                if tempo_atual - ultimo_clique > 500:
-                    print(f"🎮 Entrando em {locais[indice_local]['titulo']}...")
-                    ultimo_clique = tempo_atual
-            
-            # Clique direto nos cartões
-            for rect, indice in retangulos_cartoes:
-                if rect.collidepoint(mouse_pos) and indice != indice_local:
-                    indice_local = indice
-                    particles.add_particles(rect.centerx, rect.centery, locais[indice]["cor_destaque"], 15)
-    
-    # Efeitos de hover contínuos
-    if tempo_atual % 2000 < 1000 and indice_local < len(locais):
-        particles.add_particles(
-            SCREEN_WIDTH // 2, 
-            200, 
-            locais[indice_local]["cor_destaque"], 
-            1
-        )
-    
-    # Desenhar interface
-    desenhar_interface(indice_local, mouse_pos)
-    
-    pygame.display.flip()
-    pygame.time.Clock().tick(60)
+        # Efeitos de hover contínuos
+        if tempo_atual % 2000 < 1000 and indice_local < len(locais):
+            particles.add_particles(
+                SCREEN_WIDTH // 2, 
+                200, 
+                locais[indice_local]["cor_destaque"], 
+                1
+            )
+        particles.update()
+        
+        # Desenhar interface
+        desenhar_interface(layout, mouse_pos)
+        
+        pygame.display.flip()
+        relogio.tick(FPS)
+
+    pygame.quit()
+    sys.exit()
 
-pygame.quit()
-sys.exit()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+# animation.py
+# Animação por quadros: clipes, máquina de estados e cache limitado de quadros decodificados
+# Requisitos: pip install pygame
+
+import re
+from collections import OrderedDict
+
+import pygame
+
+from assets import asset_index, asset_log
+from texture_atlas import texture_atlases, sprite_key
+
+# ==================== CACHE DE QUADROS ====================
+class FrameCache:
+    """
+    LRU de quadros já recortados e redimensionados, limitado em número de quadros.
+    Quadros fora do cache são decodificados de novo sob demanda, então um chefe com
+    muitos quadros não precisa manter todos na memória.
+    """
+
+    def __init__(self, max_frames=96):
+        self.max_frames = max_frames
+        self._frames = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, build):
+        surf = self._frames.get(key)
+        if surf is not None:
+            self._frames.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = self._frames[key] = build()
+        if len(self._frames) > self.max_frames:
+            self._frames.popitem(last=False)
+            self.evictions += 1
+        return surf
+
+    def clear(self):
+        self._frames.clear()
+
+    def __len__(self):
+        return len(self._frames)
+
+    def memory_bytes(self):
+        """Memória de pixels ocupada pelos quadros em cache"""
+        return sum(s.get_width() * s.get_height() * s.get_bytesize() for s in self._frames.values())
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+frame_cache = FrameCache()
+
+# ==================== FONTES DE QUADROS ====================
+def _frame_number(name):
+    match = re.search(r"(\d+)(?:\.\w+)?$", name)
+    return int(match.group(1)) if match else 0
+
+def frame_sequence(prefix, count=None):
+    """Nomes 'prefix_1' .. 'prefix_N' do atlas, em ordem numérica (não alfabética)"""
+    atlas = texture_atlases.find(f"{prefix}_1")
+    names = [n for n in (atlas.names() if atlas else []) if re.fullmatch(rf"{re.escape(prefix)}_\d+", n)]
+    if not names and count:
+        names = [f"{prefix}_{i}" for i in range(1, count + 1)]
+    return sorted(names, key=_frame_number)
+
+def frame_bounds(names):
+    """
+    Retângulo (nas coordenadas do quadro original) que contém o conteúdo visível de
+    todos os quadros. Recortar todos pelo mesmo retângulo evita que o sprite "pule".
+    """
+    bounds = None
+    for name in names:
+        atlas = texture_atlases.find(name)
+        if atlas is None:
+            return None
+        rect, offset, _ = atlas.frames[sprite_key(name)]
+        visible = pygame.Rect(offset, rect.size)
+        bounds = visible if bounds is None else bounds.union(visible)
+    return bounds
+
+def decode_frame(name, crop=None):
+    """Quadro recortado em `crop`: da folha do atlas se houver, senão do arquivo avulso"""
+    atlas = texture_atlases.find(name)
+    if atlas is not None:
+        rect, offset, source_size = atlas.frames[sprite_key(name)]
+        crop = crop or pygame.Rect((0, 0), source_size)
+        surf = pygame.Surface(crop.size, pygame.SRCALPHA)
+        surf.blit(atlas.sheet, (offset[0] - crop.x, offset[1] - crop.y), rect)
+        return surf
+    path = asset_index.find(f"{name}.png")
+    if not path:
+        raise FileNotFoundError(name)
+    img = pygame.image.load(path)
+    return img.subsurface(crop).copy() if crop else img
+
+def fit_size(src_size, box):
+    """Maior tamanho com a proporção de src_size que cabe em box"""
+    scale = min(box[0] / src_size[0], box[1] / src_size[1])
+    return max(1, int(src_size[0] * scale)), max(1, int(src_size[1] * scale))
+
+# ==================== CLIPES ====================
+class Clip:
+    """Sequência de quadros com taxa própria; sem loop, segue para `next_state` ao terminar"""
+
+    def __init__(self, name, frames, fps=10, loop=True, next_state=None):
+        self.name = name
+        self.frames = list(frames)
+        self.fps = fps
+        self.loop = loop
+        self.next_state = next_state
+
+    @property
+    def duration(self):
+        return len(self.frames) / self.fps
+
+# ==================== MÁQUINA DE ESTADOS ====================
+class Animator:
+    """
+    Toca um clipe por vez. play() troca de estado na hora; queue() toca depois que
+    o clipe atual (sem loop) termina. image(size) devolve o quadro atual pelo cache.
+    """
+
+    def __init__(self, clips, initial, cache=frame_cache, transitions=None):
+        self.clips = {clip.name: clip for clip in clips}
+        self.cache = cache
+        # Transições permitidas (estado -> estados); None libera todas
+        self.transitions = transitions
+        self.crop = frame_bounds([f for clip in clips for f in clip.frames])
+        self.state = None
+        self.pending = None
+        self.play(initial, force=True)
+
+    def play(self, name, force=False):
+        if name not in self.clips:
+            raise KeyError(f"clipe desconhecido: {name}")
+        if not force and self.transitions is not None and name != self.state \
+                and name not in self.transitions.get(self.state, ()):
+            asset_log.debug(f"Transição ignorada: {self.state} -> {name}")
+            return False
+        self.state = name
+        self.clip = self.clips[name]
+        self.time = 0.0
+        self.index = 0
+        return True
+
+    def queue(self, name):
+        """Toca `name` quando o clipe atual terminar (ou já, se ele for em loop)"""
+        if self.clip.loop:
+            self.play(name)
+        else:
+            self.pending = name
+
+    def update(self, dt):
+        clip = self.clip
+        self.time += dt
+        index = int(self.time * clip.fps)
+        if index >= len(clip.frames):
+            if clip.loop:
+                self.time %= clip.duration
+                index = int(self.time * clip.fps) % len(clip.frames)
+            else:
+                following, self.pending = self.pending or clip.next_state, None
+                if following:
+                    self.play(following, force=True)
+                    return
+                index = len(clip.frames) - 1
+        self.index = index
+
+    @property
+    def frame_name(self):
+        return self.clip.frames[self.index]
+
+    @property
+    def frame_key(self):
+        """Identifica o quadro visível (usado no modo retângulos sujos)"""
+        return (self.state, self.index)
+
+    def image(self, size, flip=False):
+        """Quadro atual recortado e ajustado (com proporção) dentro de size"""
+        name, crop = self.frame_name, self.crop
+
+        def build():
+            frame = decode_frame(name, crop)
+            frame = pygame.transform.smoothscale(frame, fit_size(frame.get_size(), size))
+            return pygame.transform.flip(frame, True, False) if flip else frame
+
+        return self.cache.get((name, tuple(size), flip, crop and tuple(crop)), build)
+
+    def draw(self, surf, rect, flip=False):
+        """Desenha o quadro atual centralizado em rect"""
+        rect = pygame.Rect(rect)
+        img = self.image(rect.size, flip)
+        surf.blit(img, img.get_rect(center=rect.center))
+
+# ==================== CLIPES DO DEMÔNIO ====================
+DEMON_TRANSITIONS = {
+    "idle": ("walk", "cleave"),
+    "walk": ("idle", "cleave"),
+    "cleave": ("idle",),
+}
+
+def demon_clips():
+    return [
+        Clip("idle", frame_sequence("demon_idle", 6), fps=8),
+        Clip("walk", frame_sequence("demon_walk", 12), fps=12, loop=False, next_state="idle"),
+        Clip("cleave", frame_sequence("demon_cleave", 14), fps=16, loop=False, next_state="idle"),
+    ]
+
+def create_demon_animator(cache=frame_cache):
+    return Animator(demon_clips(), "idle", cache, DEMON_TRANSITIONS)
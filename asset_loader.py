@@ -0,0 +1,171 @@
+# asset_loader.py
+# Pré-carregamento de imagens em threads com tela de progresso
+# Requisitos: pip install pygame
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import pygame
+
+import scaled_cache
+from assets import asset_index, asset_log
+from fonts import font_registry
+
+STARTED_AT = time.perf_counter()  # referência para o tempo até o primeiro frame
+
+# ==================== CARREGADOR EM THREADS ====================
+def _decode(path, size, smooth):
+    """
+    Executado no pool: lê do cache de imagens escaladas ou decodifica e
+    redimensiona (o pygame libera o GIL nas duas etapas). Retorna (Surface, veio_do_cache).
+    """
+    digest = None
+    if size:
+        digest = scaled_cache.source_hash(path)
+        img = scaled_cache.load(digest, size, smooth)
+        if img is not None:
+            return img, True
+    img = pygame.image.load(path)
+    if size and img.get_size() != tuple(size):
+        if smooth and img.get_bitsize() >= 24:
+            img = pygame.transform.smoothscale(img, size)
+        elif not smooth:
+            img = pygame.transform.scale(img, size)
+        # Imagens paletizadas ficam para depois da conversão (smoothscale exige 24/32 bits)
+    if digest and img.get_size() == tuple(size):
+        scaled_cache.store(digest, img, smooth)
+    return img, False
+
+class AssetLoader:
+    """
+    Decodifica imagens em um pool de threads. A conversão para o formato da
+    tela (convert/convert_alpha) fica na thread principal, em poll(), porque
+    mexe no estado do vídeo. As superfícies prontas ficam em cache por
+    (nome, tamanho) para get().
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.surfaces = {}   # (nome, tamanho) -> Surface (ou None se falhou)
+        self.pending = {}    # Future -> (chave, alpha, smooth)
+        self.total = 0
+        self.cache_hits = 0
+        self.load_ms = None
+        self._executor = None
+        self._started = None
+
+    @staticmethod
+    def _key(name, size):
+        return (name, tuple(size) if size else None)
+
+    def request(self, name, size=None, alpha=True, smooth=True):
+        """Agenda o carregamento; arquivos ausentes do índice viram None na hora"""
+        key = self._key(name, size)
+        if key in self.surfaces or any(k == key for k, _, _ in self.pending.values()):
+            return
+        asset_index.load()  # monta o índice aqui, não em paralelo nas threads
+        path = asset_index.find(name)
+        self.total += 1
+        if not path:
+            self.surfaces[key] = None
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="assets")
+            self._started = time.perf_counter()
+        future = self._executor.submit(_decode, path, key[1], smooth)
+        self.pending[future] = (key, alpha, smooth)
+
+    def poll(self, timeout=0.0):
+        """Converte na thread principal o que já foi decodificado; retorna o progresso (0..1)"""
+        if self.pending:
+            done, _ = wait(list(self.pending), timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                key, alpha, smooth = self.pending.pop(future)
+                self.surfaces[key] = self._finish(key, future, alpha, smooth)
+            if not self.pending:
+                self.load_ms = (time.perf_counter() - self._started) * 1000.0
+                self._executor.shutdown(wait=False)
+                self._executor = None
+        return self.progress
+
+    def _finish(self, key, future, alpha, smooth):
+        name, size = key
+        try:
+            img, cached = future.result()
+            self.cache_hits += cached
+        except Exception as e:
+            asset_log.error(f"Falha ao carregar imagem '{name}': {e}")
+            return None
+        # Sem janela (modo headless) não há formato de tela para converter
+        if pygame.display.get_surface():
+            img = img.convert_alpha() if alpha else img.convert()
+        if size and img.get_size() != size:
+            img = pygame.transform.smoothscale(img, size) if smooth else pygame.transform.scale(img, size)
+        asset_log.debug(f"Imagem pré-carregada: {name} {size or ''}")
+        return img
+
+    @property
+    def progress(self):
+        return 1.0 if not self.total else 1.0 - len(self.pending) / self.total
+
+    @property
+    def done(self):
+        return not self.pending
+
+    def has(self, name, size=None):
+        return self._key(name, size) in self.surfaces
+
+    def get(self, name, size=None):
+        """Superfície pré-carregada ou None (não carregada ou arquivo ausente)"""
+        return self.surfaces.get(self._key(name, size))
+
+    def finish(self):
+        """Espera tudo terminar sem desenhar nada"""
+        while self.pending:
+            self.poll(timeout=None)
+
+    def run_loading_screen(self, surf, title="Carregando...", font=None):
+        """Mostra uma barra de progresso até terminar; só retorna quando tudo estiver pronto"""
+        font = font or font_registry.get(None, 40)
+        while self.pending:
+            self.poll(timeout=1 / 60)
+            pygame.event.pump()
+            if pygame.event.peek(pygame.QUIT):
+                pygame.quit()
+                sys.exit()
+            draw_loading_screen(surf, font, title, self.progress)
+            pygame.display.flip()
+        if self.load_ms is not None:
+            asset_log.info(f"{self.total} imagens pré-carregadas em {self.load_ms:.0f} ms "
+                           f"({self.workers} threads, {self.cache_hits} do cache em disco)")
+
+# ==================== TELA DE CARREGAMENTO ====================
+def draw_loading_screen(surf, font, title, progress):
+    w, h = surf.get_size()
+    surf.fill((30, 20, 10))
+    text = font.render(title, True, (252, 240, 200))
+    surf.blit(text, (w // 2 - text.get_width() // 2, h // 2 - 60))
+
+    bar = pygame.Rect(w // 4, h // 2, w // 2, 24)
+    pygame.draw.rect(surf, (15, 10, 5), bar, border_radius=6)
+    fill = bar.inflate(-6, -6)
+    fill.width = max(0, int(fill.width * progress))
+    if fill.width:
+        pygame.draw.rect(surf, (255, 215, 0), fill, border_radius=4)
+    pygame.draw.rect(surf, (255, 190, 30), bar, 2, border_radius=6)
+
+# ==================== TEMPO ATÉ O PRIMEIRO FRAME ====================
+first_frame_ms = None
+
+def report_first_frame(label):
+    """Chamar depois de cada flip: registra e imprime só na primeira vez"""
+    global first_frame_ms
+    if first_frame_ms is not None:
+        return first_frame_ms
+    first_frame_ms = (time.perf_counter() - STARTED_AT) * 1000.0
+    print(f"[INFO] {label}: primeiro frame em {first_frame_ms:.0f} ms")
+    return first_frame_ms
+
+asset_loader = AssetLoader()
@@ -0,0 +1,141 @@
+# assets.py
+# Índice de arquivos de recursos (imagens, ícones, fontes) montado uma vez e salvo em disco
+# Requisitos: nenhum
+
+import json
+import logging
+import os
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+# Pastas indexadas, em ordem de prioridade quando dois arquivos têm o mesmo nome.
+# A raiz é lida sem descer nas subpastas; as demais, recursivamente.
+ASSET_DIRS = ("", "imagens", "images", "assets", "rpg_icons_free", "boss", "font")
+# Cache em subpasta: gravar direto na raiz mudaria o mtime dela e invalidaria o próprio cache
+CACHE_DIR = os.path.join(ROOT, ".cache")
+CACHE_FILE = os.path.join(CACHE_DIR, "asset_index.json")
+CACHE_VERSION = 1
+
+# ==================== LOG ====================
+# Nível pelo ambiente: RPG_LOG_LEVEL=DEBUG mostra cada busca; o padrão só avisa problemas
+_LEVEL_NAMES = {"DEBUG": "DEBUG", "INFO": "INFO", "WARNING": "AVISO", "ERROR": "ERRO", "CRITICAL": "ERRO"}
+
+class _Formatter(logging.Formatter):
+    def format(self, record):
+        return f"[{_LEVEL_NAMES.get(record.levelname, record.levelname)}] {record.getMessage()}"
+
+asset_log = logging.getLogger("rpg.assets")
+if not asset_log.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(_Formatter())
+    asset_log.addHandler(_handler)
+    asset_log.propagate = False
+asset_log.setLevel(os.environ.get("RPG_LOG_LEVEL", "WARNING").upper())
+
+# ==================== ÍNDICE DE RECURSOS ====================
+class AssetIndex:
+    """
+    Mapeia nome de arquivo e caminho relativo (sem diferenciar maiúsculas) para o
+    caminho real. O índice é salvo em CACHE_FILE junto com o mtime de cada pasta
+    lida; na próxima execução basta um stat por pasta para saber se ainda vale.
+    """
+
+    def __init__(self, root=ROOT, dirs=ASSET_DIRS, cache_file=CACHE_FILE):
+        self.root = root
+        self.dirs = dirs
+        self.cache_file = cache_file
+        self.by_name = {}      # "arquivo.png" -> "pasta/Arquivo.png"
+        self.by_path = {}      # "pasta/arquivo.png" -> "pasta/Arquivo.png"
+        self.dir_mtimes = {}   # pasta relativa -> mtime quando foi lida
+        self.loaded = False
+
+    @staticmethod
+    def _key(path):
+        return path.replace("\\", "/").strip("/").lower()
+
+    def _scan(self):
+        by_name, by_path, mtimes = {}, {}, {}
+        for top in self.dirs:
+            base = os.path.join(self.root, top)
+            if not os.path.isdir(base):
+                continue
+            for dirpath, dirnames, filenames in os.walk(base):
+                rel_dir = os.path.relpath(dirpath, self.root)
+                rel_dir = "" if rel_dir == "." else rel_dir.replace(os.sep, "/")
+                mtimes[rel_dir] = os.stat(dirpath).st_mtime
+                if not top:
+                    dirnames[:] = []  # raiz: só os arquivos soltos
+                else:
+                    dirnames.sort()
+                for filename in sorted(filenames):
+                    rel = f"{rel_dir}/{filename}" if rel_dir else filename
+                    by_path.setdefault(self._key(rel), rel)
+                    by_name.setdefault(filename.lower(), rel)
+        self.by_name, self.by_path, self.dir_mtimes = by_name, by_path, mtimes
+
+    def _cache_valid(self, data):
+        if data.get("version") != CACHE_VERSION or data.get("dirs") != list(self.dirs):
+            return False
+        for rel_dir, mtime in data.get("mtimes", {}).items():
+            try:
+                if os.stat(os.path.join(self.root, rel_dir)).st_mtime != mtime:
+                    return False
+            except OSError:
+                return False
+        # Uma pasta indexável criada depois do cache também invalida
+        missing = [d for d in self.dirs if d not in data["mtimes"]]
+        return not any(os.path.isdir(os.path.join(self.root, d)) for d in missing)
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not self._cache_valid(data):
+            return False
+        self.by_name, self.by_path, self.dir_mtimes = data["by_name"], data["by_path"], data["mtimes"]
+        return True
+
+    def _save_cache(self):
+        data = {"version": CACHE_VERSION, "dirs": list(self.dirs), "mtimes": self.dir_mtimes,
+                "by_name": self.by_name, "by_path": self.by_path}
+        tmp = f"{self.cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, self.cache_file)
+        except OSError as e:
+            asset_log.debug(f"Índice de recursos não foi salvo em disco: {e}")
+
+    def load(self, force=False):
+        """Carrega o índice do disco ou relê as pastas se algo mudou"""
+        if self.loaded and not force:
+            return
+        if force or not self._load_cache():
+            self._scan()
+            self._save_cache()
+            asset_log.info(f"Índice de recursos montado: {len(self.by_path)} arquivos")
+        self.loaded = True
+
+    def find(self, name):
+        """
+        Caminho absoluto de `name` (nome do arquivo ou caminho relativo à raiz), ou None.
+        Tenta o caminho relativo exato e, se não houver, qualquer arquivo com o mesmo nome.
+        """
+        if not name:
+            return None
+        if os.path.isabs(name):
+            return name if os.path.exists(name) else None
+        self.load()
+        rel = self.by_path.get(self._key(name)) or self.by_name.get(os.path.basename(self._key(name)))
+        if rel is None:
+            asset_log.debug(f"Recurso não indexado: {name}")
+            return None
+        return os.path.join(self.root, rel)
+
+    def __len__(self):
+        self.load()
+        return len(self.by_path)
+
+asset_index = AssetIndex()
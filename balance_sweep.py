@@ -0,0 +1,236 @@
+# balance_sweep.py
+# Varredura de balanceamento: poder/recarga/custo de cada habilidade x cada inimigo do banco,
+# simulada em paralelo (um processo por núcleo) com combat_sim, com relatório retomável
+# Requisitos: pip install numpy
+#
+# Uso:
+#     python balance_sweep.py                                   # relatório em balance_sweep.db
+#     python balance_sweep.py --out sweep.csv --fights 200000
+#     python balance_sweep.py --power-scales 0.5,0.75,1,1.25,1.5 --workers 16
+#
+# Cada ponto da grade muda UMA habilidade (as outras ficam como no jogo) e simula a
+# luta contra um inimigo da tabela Inimigo. Só entram habilidades de ataque (poder > 0):
+# combat_sim não modela cura nem defesa, então variá-las não mudaria nada. O relatório
+# é também o checkpoint: ao rodar de novo com o mesmo arquivo, os pontos já presentes
+# são pulados.
+
+import argparse
+import csv
+import os
+import sqlite3
+import sys
+import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import combat_sim
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.path.join(BASE_DIR, "Banco", "rpg.db")
+CLASSES = ("Guerreiro", "Mago")
+POWER_SCALES = (0.6, 0.8, 1.0, 1.2, 1.4)
+COOLDOWN_SCALES = (0.5, 1.0, 1.5)
+COST_SCALES = (0.5, 1.0, 1.5)
+
+COLUMNS = ["key", "classe", "level", "habilidade", "power", "cooldown", "cost_mp",
+           "id_inimigo", "inimigo", "fights", "seed", "max_turns", "win_rate", "loss_rate", "draw_rate",
+           "hit_rate", "turns_mean", "turns_p50", "turns_p90", "damage_dealt_mean",
+           "fight_damage_taken_mean", "fight_damage_taken_p95", "hp_left_mean", "seconds"]
+
+# ==================== ENTRADAS ====================
+def load_enemies(db_path=DB_PATH):
+    """Inimigos da tabela Inimigo como combat_sim.EnemySpec (id em .id_inimigo)"""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        rows = conn.execute("SELECT id_inimigo, nome, tipo, pontos_vida_max, ataque "
+                            "FROM Inimigo ORDER BY id_inimigo").fetchall()
+    finally:
+        conn.close()
+    enemies = []
+    for row in rows:
+        enemy = combat_sim.EnemySpec(row["nome"], row["pontos_vida_max"], row["ataque"], row["tipo"])
+        enemy.id_inimigo = row["id_inimigo"]
+        enemies.append(enemy)
+    return enemies
+
+def load_builds(classes, level, max_hp, max_mp):
+    """Habilidades de PlayerCharacter._load_abilities para cada classe (importa RPG_Jogo sem janela)"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    import RPG_Jogo
+    return [combat_sim.PlayerBuild.from_character(RPG_Jogo.PlayerCharacter(classe, classe, level, max_hp, max_mp))
+            for classe in classes]
+
+def scaled(value, scale, integer):
+    return round(value * scale) if integer else round(value * scale, 2)
+
+def build_grid(builds, enemies, power_scales, cooldown_scales, cost_scales):
+    """Pontos da grade: (chave, PlayerBuild com uma habilidade alterada, índice da habilidade, inimigo)"""
+    points = []
+    for build in builds:
+        for index, ability in enumerate(build.abilities):
+            if ability.power <= 0:
+                continue  # cura/defesa: ignoradas por combat_sim
+            variants = {(scaled(ability.power, p, True), scaled(ability.cooldown, c, False),
+                         scaled(ability.cost_mp, m, True))
+                        for p in power_scales for c in cooldown_scales for m in cost_scales}
+            for power, cooldown, cost_mp in sorted(variants):
+                abilities = list(build.abilities)
+                abilities[index] = combat_sim.AbilitySpec(ability.name, power, cooldown, cost_mp)
+                variant = combat_sim.PlayerBuild(build.name, build.level, build.max_hp, build.max_mp, abilities)
+                for enemy in enemies:
+                    key = (f"{build.name}|{build.level}|{build.max_hp}|{build.max_mp}|{ability.name}"
+                           f"|{power}|{cooldown}|{cost_mp}|{enemy.id_inimigo}")
+                    points.append((key, variant, index, enemy))
+    return points
+
+# ==================== RELATÓRIO ====================
+class SqliteReport:
+    """Resultados na tabela Varredura; a chave primária (ponto, lutas, seed, turnos) faz o checkpoint"""
+
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path)
+        columns = ", ".join(COLUMNS)
+        self.conn.execute(f"CREATE TABLE IF NOT EXISTS Varredura ({columns}, "
+                          f"PRIMARY KEY (key, fights, seed, max_turns))")
+        self.insert = (f"INSERT OR REPLACE INTO Varredura ({columns}) "
+                       f"VALUES ({', '.join('?' * len(COLUMNS))})")
+
+    def done(self, fights, seed, max_turns):
+        rows = self.conn.execute("SELECT key FROM Varredura WHERE fights = ? AND seed = ? AND max_turns = ?",
+                                 (fights, seed, max_turns))
+        return {key for (key,) in rows}
+
+    def write(self, row):
+        self.conn.execute(self.insert, [row[c] for c in COLUMNS])
+
+    def flush(self):
+        self.conn.commit()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+class CsvReport:
+    """Resultados acrescentados a um CSV; as linhas já gravadas fazem o checkpoint"""
+
+    def __init__(self, path):
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self.path = path
+        self.file = open(path, "a", newline="", encoding="utf-8")
+        self.writer = csv.DictWriter(self.file, COLUMNS)
+        if not exists:
+            self.writer.writeheader()
+
+    def done(self, fights, seed, max_turns):
+        with open(self.path, newline="", encoding="utf-8") as f:
+            return {row["key"] for row in csv.DictReader(f)
+                    if row["fights"] == str(fights) and row["seed"] == str(seed)
+                    and row["max_turns"] == str(max_turns)}
+
+    def write(self, row):
+        self.writer.writerow(row)
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+def open_report(path):
+    return CsvReport(path) if path.lower().endswith(".csv") else SqliteReport(path)
+
+# ==================== EXECUÇÃO ====================
+def run_point(key, build, index, enemy, fights, seed, max_turns):
+    """Executado nos processos filhos: simula um ponto e devolve a linha do relatório"""
+    # Semente derivada da chave: o mesmo ponto dá o mesmo resultado, em qualquer ordem
+    stats = combat_sim.simulate(build, enemy, fights, seed=[seed, zlib.crc32(key.encode())],
+                                max_turns=max_turns)
+    ability = build.abilities[index]
+    row = stats.summary()
+    row.update(key=key, classe=build.name, habilidade=ability.name, power=ability.power,
+               cooldown=ability.cooldown, cost_mp=ability.cost_mp, id_inimigo=enemy.id_inimigo,
+               inimigo=enemy.name, seed=seed, max_turns=max_turns)
+    return {c: row[c] for c in COLUMNS}
+
+def sweep(points, report, fights, seed, max_turns=combat_sim.MAX_TURNS, workers=None):
+    """Distribui os pontos pendentes entre os processos e grava cada resultado ao chegar"""
+    done = report.done(fights, seed, max_turns)
+    pending = [p for p in points if p[0] not in done]
+    print(f"[INFO] {len(points)} pontos na grade, {len(points) - len(pending)} já no relatório, "
+          f"{len(pending)} a simular")
+    if not pending:
+        return 0
+
+    workers = workers or os.cpu_count() or 1
+    start = last_report = time.perf_counter()
+    finished = 0
+    todo = iter(pending)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        running = set()
+        try:
+            while True:
+                # Poucas tarefas em voo: memória constante mesmo em grades enormes
+                for point in todo:
+                    running.add(pool.submit(run_point, *point, fights, seed, max_turns))
+                    if len(running) >= workers * 4:
+                        break
+                if not running:
+                    break
+                completed, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    report.write(future.result())
+                    finished += 1
+                now = time.perf_counter()
+                if now - last_report >= 5.0:
+                    report.flush()
+                    last_report = now
+                    print(f"[INFO] {finished}/{len(pending)} pontos ({finished / (now - start):.1f}/s)")
+        except KeyboardInterrupt:
+            for future in running:
+                future.cancel()
+            print(f"[AVISO] Interrompido: {finished} pontos gravados; rode de novo para continuar")
+            raise
+        finally:
+            report.flush()
+    print(f"[INFO] {finished} pontos em {time.perf_counter() - start:.1f} s com {workers} processos")
+    return finished
+
+def parse_scales(text):
+    return tuple(float(v) for v in text.split(","))
+
+def main():
+    parser = argparse.ArgumentParser(description="Varredura de balanceamento de habilidades x inimigos")
+    parser.add_argument("--out", default="balance_sweep.db", help="relatório .db (SQLite) ou .csv")
+    parser.add_argument("--db", default=DB_PATH, help="banco do jogo com a tabela Inimigo")
+    parser.add_argument("--classes", default=",".join(CLASSES))
+    parser.add_argument("--level", type=int, default=1)
+    parser.add_argument("--hp", type=int, default=120)
+    parser.add_argument("--mp", type=int, default=40)
+    parser.add_argument("--power-scales", type=parse_scales, default=POWER_SCALES)
+    parser.add_argument("--cooldown-scales", type=parse_scales, default=COOLDOWN_SCALES)
+    parser.add_argument("--cost-scales", type=parse_scales, default=COST_SCALES)
+    parser.add_argument("--fights", type=int, default=100_000, help="lutas por ponto da grade")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-turns", type=int, default=combat_sim.MAX_TURNS)
+    parser.add_argument("--workers", type=int, help="processos (padrão: um por núcleo)")
+    args = parser.parse_args()
+
+    enemies = load_enemies(args.db)
+    builds = load_builds([c.strip() for c in args.classes.split(",") if c.strip()],
+                         args.level, args.hp, args.mp)
+    points = build_grid(builds, enemies, args.power_scales, args.cooldown_scales, args.cost_scales)
+
+    report = open_report(args.out)
+    try:
+        sweep(points, report, args.fights, args.seed, args.max_turns, args.workers)
+    except KeyboardInterrupt:
+        sys.exit(130)
+    finally:
+        report.close()
+    print(f"[INFO] Relatório: {args.out}")
+
+if __name__ == "__main__":
+    main()
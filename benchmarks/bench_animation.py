@@ -0,0 +1,71 @@
+# bench_animation.py
+# Custo por frame e memória de vários inimigos animados (quadros do demônio) com o
+# cache limitado de quadros, comparado a manter todos os quadros pré-carregados.
+# Uso: python benchmarks/bench_animation.py [frames]
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from animation import FrameCache, create_demon_animator
+
+ENEMY_COUNTS = [1, 4, 16, 64]
+CACHE_SIZES = [16, 48, 96]
+# Cada inimigo em um tamanho de retrato diferente, como em HUDs e no campo
+PORTRAIT_SIZES = [(80, 80), (120, 120), (160, 96), (200, 200)]
+
+def run(enemy_count, cache, frames, screen):
+    rng = random.Random(1)
+    enemies = []
+    for i in range(enemy_count):
+        animator = create_demon_animator(cache)
+        animator.update(rng.uniform(0, 1))  # fases diferentes
+        size = PORTRAIT_SIZES[i % len(PORTRAIT_SIZES)]
+        rect = pygame.Rect(rng.randrange(0, 1000), rng.randrange(0, 600), *size)
+        enemies.append((animator, rect))
+
+    dt = 1.0 / 60
+    start = time.perf_counter()
+    for f in range(frames):
+        for animator, rect in enemies:
+            if animator.state == "idle" and rng.random() < 0.01:
+                animator.play(rng.choice(("walk", "cleave")))
+            animator.update(dt)
+            animator.draw(screen, rect)
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    pygame.init()
+    screen = pygame.display.set_mode((1200, 800))
+
+    # Referência: todos os quadros decodificados em todos os tamanhos usados
+    clips = create_demon_animator(FrameCache(max_frames=10 ** 6)).clips.values()
+    all_frames = sum(len(c.frames) for c in clips)
+    preload = FrameCache(max_frames=10 ** 6)
+    for size in PORTRAIT_SIZES:
+        animator = create_demon_animator(preload)
+        for clip in clips:
+            animator.play(clip.name, force=True)
+            for index in range(len(clip.frames)):
+                animator.index = index
+                animator.image(size)
+    print(f"[BENCH] Quadros pré-carregados ({all_frames} quadros x {len(PORTRAIT_SIZES)} tamanhos): "
+          f"{preload.memory_bytes() / 1024:.0f} KB")
+
+    print(f"[BENCH] Inimigos animados ({frames} frames)")
+    print(f"  {'inimigos':>8} | {'cache':>5} | {'ms/frame':>8} | {'acertos':>7} | {'descartes':>9} | {'memória KB':>10}")
+    for count in ENEMY_COUNTS:
+        for max_frames in CACHE_SIZES:
+            cache = FrameCache(max_frames)
+            ms = run(count, cache, frames, screen)
+            print(f"  {count:8d} | {max_frames:5d} | {ms:8.3f} | {cache.hit_rate() * 100:6.1f}% | "
+                  f"{cache.evictions:9d} | {cache.memory_bytes() / 1024:10.0f}")
+
+if __name__ == "__main__":
+    main()
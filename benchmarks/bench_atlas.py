@@ -0,0 +1,75 @@
+# bench_atlas.py
+# Compara arquivos soltos com as folhas de textura: carregamento (arquivos abertos e tempo)
+# e desenho de muitos sprites (blit a blit de superfícies separadas vs. Surface.blits da folha).
+# Uso: python benchmarks/bench_atlas.py [frames]
+
+import glob
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame
+from texture_atlas import ATLAS_SOURCES, AtlasSet, sprite_key
+
+SPRITES_PER_FRAME = 500
+
+def source_files():
+    files = []
+    for folders in ATLAS_SOURCES.values():
+        for folder in folders:
+            files += sorted(glob.glob(os.path.join(ROOT, folder, "*.png")))
+    return files
+
+def load_loose(files):
+    return {sprite_key(f): pygame.image.load(f).convert_alpha() for f in files}
+
+def load_atlases():
+    atlases = AtlasSet()
+    for atlas in atlases.atlases.values():
+        atlas.sheet  # força a leitura da folha
+    return atlases
+
+def draw_loose(screen, surfaces, items):
+    for name, pos in items:
+        screen.blit(surfaces[name], pos)
+
+def draw_atlas(screen, atlases, groups):
+    for atlas, items in groups:
+        atlas.draw_batch(screen, items)
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    pygame.init()
+    screen = pygame.display.set_mode((1200, 800))
+    files = source_files()
+
+    start = time.perf_counter()
+    surfaces = load_loose(files)
+    loose_ms = (time.perf_counter() - start) * 1000.0
+    start = time.perf_counter()
+    atlases = load_atlases()
+    atlas_ms = (time.perf_counter() - start) * 1000.0
+    sheets = len(atlases.atlases)
+    print(f"[BENCH] Carregamento: {len(files)} arquivos em {loose_ms:.1f} ms | "
+          f"{sheets} folhas + {sheets} índices em {atlas_ms:.1f} ms")
+
+    names = sorted(surfaces)
+    items = [(names[i % len(names)], ((i * 37) % 1100, (i * 53) % 700)) for i in range(SPRITES_PER_FRAME)]
+    groups = {}
+    for name, pos in items:
+        groups.setdefault(id(atlases.find(name)), (atlases.find(name), []))[1].append((name, pos))
+    groups = list(groups.values())
+
+    print(f"[BENCH] Desenho ({SPRITES_PER_FRAME} sprites por frame, {frames} frames)")
+    for label, fn, arg in (("arquivos soltos", draw_loose, surfaces), ("atlas + blits", draw_atlas, atlases)):
+        start = time.perf_counter()
+        for _ in range(frames):
+            fn(screen, arg, items if fn is draw_loose else groups)
+        print(f"  {label:<16} {(time.perf_counter() - start) * 1000.0 / frames:8.3f} ms/frame")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# bench_combat_sim.py
+# Lutas simuladas uma a uma em Python (mesmas regras) vs. em lote com NumPy (combat_sim.py).
+# As taxas de vitória das duas versões devem coincidir dentro do erro amostral.
+# Uso: python benchmarks/bench_combat_sim.py [lutas]
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import combat_sim
+
+def scalar_fight(player, enemy, rng, max_turns=combat_sim.MAX_TURNS, think_time=combat_sim.THINK_TIME):
+    """Uma luta com a mesma política de combat_sim.simulate; devolve (resultado, turnos)"""
+    attacks = sorted((a for a in player.abilities if a.power > 0), key=lambda a: -a.power)
+    player_hp, enemy_hp, mp = player.max_hp, enemy.max_hp, player.max_mp
+    cd = [0.0] * len(attacks)
+    for turn in range(1, max_turns + 1):
+        options = [i for i, a in enumerate(attacks) if mp >= a.cost_mp]
+        if not options:
+            return "draw", turn
+        wait = min(cd[i] for i in options)
+        cd = [max(0.0, c - wait) for c in cd]
+        choice = next(i for i in options if cd[i] <= 0.0)
+        cd[choice] = attacks[choice].cooldown
+        mp -= attacks[choice].cost_mp
+
+        roll, total = rng.randint(1, 20), rng.randint(1, 20)
+        if roll + player.level >= combat_sim.HIT_TARGET:
+            enemy_hp = max(0, enemy_hp - (attacks[choice].power + player.level // 2 + total // 12))
+        if enemy_hp <= 0:
+            return "win", turn
+
+        player_hp = max(0, player_hp - max(1, enemy.atk + rng.randint(1, 20) // 10))
+        if player_hp <= 0:
+            return "loss", turn
+        cd = [max(0.0, c - combat_sim.ENEMY_TURN_DELAY - think_time) for c in cd]
+    return "draw", max_turns
+
+def main():
+    fights = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    player, enemies = combat_sim.load_game_roster("Guerreiro", 1, 120, 40)
+    rng = random.Random(1)
+
+    print(f"[BENCH] Simulação de combate: {fights} lutas por inimigo ({player.name})")
+    print(f"  {'inimigo':<24} | {'python lutas/s':>14} | {'numpy lutas/s':>13} | {'ganho':>6} | "
+          f"{'vitória py':>10} | {'vitória np':>10}")
+    for enemy in enemies:
+        start = time.perf_counter()
+        wins = sum(scalar_fight(player, enemy, rng)[0] == "win" for _ in range(fights))
+        old_rate = fights / (time.perf_counter() - start)
+
+        combat_sim.simulate(player, enemy, 1000, seed=0)  # aquecimento
+        stats = combat_sim.simulate(player, enemy, fights, seed=1)
+        new_rate = fights / stats.elapsed
+        print(f"  {enemy.name:<24} | {old_rate:14,.0f} | {new_rate:13,.0f} | {new_rate / old_rate:5.1f}x | "
+              f"{wins / fights * 100:9.2f}% | {stats.win_rate * 100:9.2f}%")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# bench_dialogue.py
+# Mede o custo por frame do DialogueBox: fundo (cache de gradientes) e texto (layout incremental).
+# Uso: python benchmarks/bench_dialogue.py [frames]
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from render_cache import GradientCache
+from text_layout import wrap_text, TypewriterText
+from fonts import font_registry
+
+COLOR_DEEP_WOOD = (30, 20, 10)
+COLOR_RICH_WOOD = (101, 67, 33)
+COLOR_GOLDEN_PARCHMENT = (252, 240, 200)
+COLOR_AGED_PARCHMENT = (222, 207, 172)
+COLOR_BRIGHT_GOLD = (255, 215, 0)
+COLOR_DARK_TEXT = (40, 30, 20)
+
+# Mesmo retângulo usado pelo RPG_Jogo.py
+DIALOG_RECT = pygame.Rect(50, 800 - 220, 1200 - 100, 180)
+
+def legacy_gradient(width, height, start_color, end_color):
+    """Gradiente como era antes do cache: uma linha desenhada por y"""
+    gradient = pygame.Surface((width, height))
+    for y in range(height):
+        ratio = y / height
+        r = max(0, min(255, int(start_color[0] + (end_color[0] - start_color[0]) * ratio)))
+        g = max(0, min(255, int(start_color[1] + (end_color[1] - start_color[1]) * ratio)))
+        b = max(0, min(255, int(start_color[2] + (end_color[2] - start_color[2]) * ratio)))
+        pygame.draw.line(gradient, (r, g, b), (0, y), (width, y))
+    return gradient
+
+def draw_uncached(surf, rect):
+    """Versão antiga: reconstrói o gradiente a cada frame"""
+    pygame.draw.rect(surf, COLOR_DEEP_WOOD, rect.inflate(8, 8), border_radius=12)
+    pygame.draw.rect(surf, COLOR_RICH_WOOD, rect, border_radius=10)
+    inner_rect = rect.inflate(-8, -8)
+    gradient = legacy_gradient(inner_rect.width, inner_rect.height, COLOR_AGED_PARCHMENT, COLOR_GOLDEN_PARCHMENT)
+    surf.blit(gradient, inner_rect.topleft)
+    pygame.draw.rect(surf, COLOR_BRIGHT_GOLD, rect, 3, border_radius=10)
+
+def draw_cached(surf, rect, cache):
+    """Versão nova: apenas blita o painel pré-renderizado"""
+    skin = cache.panel_skin(rect.size, COLOR_AGED_PARCHMENT, COLOR_GOLDEN_PARCHMENT,
+                            COLOR_DEEP_WOOD, COLOR_RICH_WOOD, COLOR_BRIGHT_GOLD)
+    surf.blit(skin, (rect.x - 4, rect.y - 4))
+
+def reveal_uncached(surf, font, text, char_index, width):
+    """Versão antiga: quebra e renderiza o prefixo revelado a cada frame"""
+    lines = wrap_text(text[:char_index], width, font)
+    for i, line in enumerate(lines[:4]):
+        surf.blit(font.render(line, True, COLOR_DARK_TEXT), (70, 640 + i * 28))
+
+def bench_typewriter(screen, font, text, width):
+    """Revela a mensagem inteira, um caractere por frame, nas duas versões"""
+    frames = len(text)
+    start = time.perf_counter()
+    for i in range(1, frames + 1):
+        reveal_uncached(screen, font, text, i, width)
+    before = (time.perf_counter() - start) * 1000.0 / frames
+
+    start = time.perf_counter()
+    layout = TypewriterText(text, font, width, COLOR_DARK_TEXT, max_lines=4, line_height=28)
+    for i in range(1, frames + 1):
+        layout.reveal(i)
+        layout.draw(screen, 70, 640)
+    after = (time.perf_counter() - start) * 1000.0 / frames
+    return before, after
+
+def measure(fn, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        fn()
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    pygame.init()
+    screen = pygame.display.set_mode((1200, 800))
+    cache = GradientCache()
+
+    before = measure(lambda: draw_uncached(screen, DIALOG_RECT), frames)
+    after = measure(lambda: draw_cached(screen, DIALOG_RECT, cache), frames)
+
+    print(f"[BENCH] Fundo do diálogo ({frames} frames)")
+    print(f"  antes : {before:.4f} ms/frame")
+    print(f"  depois: {after:.4f} ms/frame")
+    print(f"  ganho : {before / after:.1f}x  (hits={cache.hits}, misses={cache.misses})")
+
+    font = font_registry.get("MorrisRoman-Black.ttf", 22)
+    sentence = "A Vila de Eldoria clama por ajuda e os bandidos aterrorizam os comerciantes. "
+    for repeats in (1, 2, 4):
+        text = sentence * repeats
+        before, after = bench_typewriter(screen, font, text, DIALOG_RECT.w - 40)
+        print(f"[BENCH] Texto do diálogo ({len(text)} caracteres)")
+        print(f"  antes : {before:.4f} ms/frame")
+        print(f"  depois: {after:.4f} ms/frame")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
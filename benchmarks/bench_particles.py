@@ -0,0 +1,92 @@
+# bench_particles.py
+# Compara o ParticleSystem antigo (lista de dicts) com o novo (arrays NumPy).
+# Uso: python benchmarks/bench_particles.py [frames]
+
+import os
+import sys
+import math
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from particles import ParticleSystem
+
+COLORS = [(255, 215, 0), (170, 30, 30), (50, 100, 180)]
+COUNTS = [100, 1000, 5000, 20000, 50000]
+LEGACY_LIMIT = 5000  # acima disso a versão antiga leva minutos
+
+class LegacyParticleSystem:
+    """Cópia da implementação original do RPG_Jogo.py, usada como referência"""
+
+    def __init__(self):
+        self.particles = []
+
+    def add_particles(self, x, y, color, count=5, speed=2, size=3, lifetime=1.0):
+        for _ in range(count):
+            angle = random.uniform(0, math.pi * 2)
+            velocity = [math.cos(angle) * speed, math.sin(angle) * speed]
+            self.particles.append({
+                'pos': [x, y],
+                'vel': velocity,
+                'color': color,
+                'size': random.uniform(size * 0.5, size * 1.5),
+                'lifetime': lifetime,
+                'max_lifetime': lifetime
+            })
+
+    def update(self, dt):
+        for particle in self.particles[:]:
+            particle['pos'][0] += particle['vel'][0]
+            particle['pos'][1] += particle['vel'][1]
+            particle['lifetime'] -= dt
+            particle['vel'][1] += 0.1
+
+            if particle['lifetime'] <= 0:
+                self.particles.remove(particle)
+
+    def draw(self, surf):
+        for particle in self.particles:
+            alpha = int(255 * (particle['lifetime'] / particle['max_lifetime']))
+            if alpha > 0:
+                color = particle['color']
+                size = int(particle['size'] * (particle['lifetime'] / particle['max_lifetime']))
+                if size > 0:
+                    particle_surf = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
+                    pygame.draw.circle(particle_surf, (*color, alpha), (size, size), size)
+                    surf.blit(particle_surf, (int(particle['pos'][0])-size, int(particle['pos'][1])-size))
+
+def run(system, count, frames, screen):
+    """Mantém aproximadamente `count` partículas vivas e mede update + draw"""
+    dt = 1.0 / 60
+    per_frame = max(1, count // 60)
+    # O sistema antigo usa px/frame; o atual, px/s
+    speed = 3 if isinstance(system, LegacyParticleSystem) else 3 * 60
+    for i in range(0, count, 1000):
+        system.add_particles(600, 400, COLORS[i % 3], count=min(1000, count - i), speed=speed, size=5, lifetime=1.0)
+
+    start = time.perf_counter()
+    for f in range(frames):
+        system.add_particles(600, 400, COLORS[f % 3], count=per_frame, speed=speed, size=5, lifetime=1.0)
+        system.update(dt)
+        system.draw(screen)
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    pygame.init()
+    screen = pygame.display.set_mode((1200, 800))
+
+    print(f"[BENCH] Partículas ({frames} frames, update + draw)")
+    print(f"  {'partículas':>10} | {'antigo ms':>10} | {'novo ms':>10}")
+    for count in COUNTS:
+        legacy = run(LegacyParticleSystem(), count, frames, screen) if count <= LEGACY_LIMIT else None
+        new = run(ParticleSystem(), count, frames, screen)
+        legacy_txt = f"{legacy:10.3f}" if legacy is not None else f"{'-':>10}"
+        print(f"  {count:>10} | {legacy_txt} | {new:10.3f}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# bench_placeholders.py
+# Tempo e memória para criar muitos inimigos, botões e personagens com retratos/ícones
+# placeholder: criando uma Surface por objeto (caches limpos) vs. superfícies compartilhadas.
+# Uso: python benchmarks/bench_placeholders.py
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import RPG_Jogo as game
+
+COUNTS = [10, 100, 1000]
+COLORS = [game.COLOR_RICH_RED, game.COLOR_MYSTIC_BLUE, game.COLOR_DEEP_RED, game.COLOR_DEEP_WOOD]
+LABELS = ["Aceitar", "Recusar", "Dados", "Missões", "Poção", "Mana"]
+
+def build(count, shared):
+    """Cria `count` inimigos, botões e personagens; devolve (ms, KB em superfícies distintas)"""
+    surfaces = {}
+    start = time.perf_counter()
+    for i in range(count):
+        if not shared:
+            game.placeholder_icons.clear()
+            game.loaded_images.clear()
+        enemy = game.GameEnemy(f"Bandido {i}", 40, 8, "Humanoide", "Luz", COLORS[i % len(COLORS)])
+        button = game.Button(pygame.Rect(0, 0, 120, 60), LABELS[i % len(LABELS)], icon=f"icon_{i % 6}.png")
+        player = game.create_player()
+        for surf in [enemy.portrait, button.icon, player.portrait] + [a.icon for a in player.abilities]:
+            surfaces[id(surf)] = surf
+    ms = (time.perf_counter() - start) * 1000.0
+    kb = sum(s.get_width() * s.get_height() * s.get_bytesize() for s in surfaces.values()) / 1024
+    return ms, kb
+
+def main():
+    print("[BENCH] Retratos e ícones placeholder (inimigos + botões + personagens)")
+    print(f"  {'objetos':>7} | {'uma surface por objeto':>24} | {'compartilhadas':>22}")
+    for count in COUNTS:
+        old_ms, old_kb = build(count, shared=False)
+        game.placeholder_icons.clear()
+        game.loaded_images.clear()
+        new_ms, new_kb = build(count, shared=True)
+        print(f"  {count:7d} | {old_ms:9.1f} ms {old_kb:9.0f} KB | {new_ms:7.1f} ms {new_kb:9.0f} KB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# bench_procedural.py
+# Geração das texturas de fundo: laços com pygame.draw (versão antiga) vs. arrays NumPy (procedural.py)
+# Uso: python benchmarks/bench_procedural.py [repetições]
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+import procedural
+
+W, H = 1200, 800
+LIGHT, DARK = (70, 60, 50), (35, 30, 25)
+
+# ==================== VERSÕES ANTIGAS ====================
+def legacy_stone():
+    texture = pygame.Surface((W, H))
+    for x in range(0, W, 4):
+        for y in range(0, H, 4):
+            shade = random.randint(80, 120)
+            pygame.draw.rect(texture, (shade, shade - 10, shade - 20), (x, y, 4, 4))
+    return texture
+
+def legacy_gradient(start=(10, 5, 20), end=(50, 30, 55)):
+    surf = pygame.Surface((W, H))
+    for y in range(H):
+        ratio = y / H
+        color = [int(s + (e - s) * ratio) for s, e in zip(start, end)]
+        pygame.draw.line(surf, color, (0, y), (W, y))
+    return surf
+
+def legacy_sky():
+    bg = legacy_gradient()
+    for _ in range(100):
+        brightness = random.randint(150, 255)
+        pygame.draw.circle(bg, (brightness,) * 3, (random.randint(0, W), random.randint(0, H // 2)),
+                           random.randint(1, 3))
+    return bg
+
+def legacy_blotches():
+    bg = pygame.Surface((W, H))
+    bg.fill(LIGHT)
+    for _ in range(150):
+        size = random.randint(50, 200)
+        s = pygame.Surface((size, size), pygame.SRCALPHA)
+        s.fill((*DARK, random.randint(5, 15)))
+        bg.blit(s, (random.randint(0, W), random.randint(0, H)))
+    return bg
+
+CASES = [
+    ("pedra (MENU)", legacy_stone, lambda: procedural.stone_texture((W, H), seed=1)),
+    ("gradiente", legacy_gradient, lambda: procedural.vertical_gradient((W, H), (10, 5, 20), (50, 30, 55))),
+    ("céu noturno", legacy_sky, lambda: procedural.night_sky((W, H), (10, 5, 20), (50, 30, 55), seed=1)),
+    ("manchas (seleção)", legacy_blotches, lambda: procedural.blotches((W, H), LIGHT, DARK, seed=1)),
+]
+
+def timed(fn, repeat):
+    fn()  # aquecimento (imports e caches do numpy)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000.0 / repeat
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    pygame.init()
+    pygame.display.set_mode((W, H))
+
+    print(f"[BENCH] Texturas {W}x{H} (média de {repeat} execuções)")
+    print(f"  {'textura':<18} | {'laços ms':>9} | {'numpy ms':>9} | {'ganho':>6}")
+    for label, legacy, fast in CASES:
+        old_ms, new_ms = timed(legacy, repeat), timed(fast, repeat)
+        print(f"  {label:<18} | {old_ms:9.2f} | {new_ms:9.2f} | {old_ms / new_ms:5.1f}x")
+
+    # Mesmo seed -> mesma textura
+    same = all(np.array_equal(pygame.surfarray.array3d(fast()), pygame.surfarray.array3d(fast()))
+               for _, _, fast in CASES)
+    print(f"[BENCH] Reprodutível com seed fixo: {'sim' if same else 'NÃO'}")
+
+if __name__ == "__main__":
+    main()
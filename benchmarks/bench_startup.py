@@ -0,0 +1,115 @@
+# bench_startup.py
+# Mede o custo de carregar as imagens pré-carregadas pelas telas com e sem o cache de
+# imagens escaladas (decodificar + redimensionar vs. mapear o arquivo cru) e o tempo até
+# o primeiro frame de cada tela com o cache frio e quente. O cache usado fica num
+# diretório temporário: o .cache/scaled do desenvolvedor não é tocado.
+# Uso: python benchmarks/bench_startup.py [repetições]
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame
+import scaled_cache
+from assets import asset_index
+
+# Os mesmos pedidos de asset_loader.request() de cada tela: (arquivo, tamanho, smooth)
+PRELOAD_SETS = {
+    "rpg": [("Scene Overview.png", (1200, 800), True), ("mestre-removebg-preview.png", (80, 80), True)]
+           + [(f"icon_{name}.png", (32, 32), True)
+              for name in ("accept", "decline", "dice", "quest", "potion", "mana")],
+    "personagem": [("imagens/Guerreiro.jpg", (180, 180), True), ("imagens/Mago.jpg", (180, 180), True),
+                   ("imagens/background_medieval.png", (1100, 700), True)],
+    "login": [("imagens/tela_fundo.jpg", (1100, 700), False)],
+}
+SCREENS = {"rpg": "RPG_Jogo.py", "personagem": "Escoher_personagem.py", "login": "Login_Rpg"}
+
+def decode_and_scale(path, size, smooth):
+    img = pygame.image.load(path).convert_alpha()
+    return pygame.transform.smoothscale(img, size) if smooth else pygame.transform.scale(img, size)
+
+def load_cached(path, size, smooth):
+    """Como asset_loader._decode com o cache quente: hash do arquivo + mapeamento"""
+    return scaled_cache.load(scaled_cache.source_hash(path), size, smooth).convert_alpha()
+
+def time_ms(fn, repeats):
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(samples)
+
+def bench_images(repeats):
+    asset_index.load()
+    print(f"[BENCH] Imagens pré-carregadas por tela (mediana de {repeats})")
+    print(f"  {'tela':<11} | {'imagens':>7} | {'decodificar+escalar ms':>22} | {'cache ms':>9} | {'ganho':>6}")
+    for name, requests in PRELOAD_SETS.items():
+        images = []
+        for rel, size, smooth in requests:
+            path = asset_index.find(rel)
+            if not path:
+                print(f"[AVISO] Ignorando {rel}: não encontrado")
+                continue
+            # Preenche o cache antes de medir
+            scaled_cache.store(scaled_cache.source_hash(path), decode_and_scale(path, size, smooth), smooth)
+            images.append((path, size, smooth))
+        if not images:
+            print(f"  {name:<11} | {0:7} | nenhuma imagem encontrada")
+            continue
+        cold = time_ms(lambda: [decode_and_scale(*image) for image in images], repeats)
+        warm = time_ms(lambda: [load_cached(*image) for image in images], repeats)
+        print(f"  {name:<11} | {len(images):7} | {cold:22.2f} | {warm:9.2f} | "
+              f"{cold / warm if warm else 0:5.1f}x")
+
+def first_frame_ms(script):
+    """Roda a tela até ela relatar o primeiro frame e a encerra"""
+    env = dict(os.environ, PYTHONUNBUFFERED="1")
+    proc = subprocess.Popen([sys.executable, script], cwd=ROOT, env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    start = time.perf_counter()
+    try:
+        for line in proc.stdout:
+            if "primeiro frame" in line:
+                return (time.perf_counter() - start) * 1000.0
+        return None
+    finally:
+        proc.kill()
+        proc.wait()
+
+def bench_first_frame(repeats):
+    print(f"[BENCH] Tempo até o primeiro frame (processo inteiro, mediana de {repeats})")
+    print(f"  {'tela':<11} | {'cache frio ms':>13} | {'cache quente ms':>15}")
+    for name, script in SCREENS.items():
+        cold, warm = [], []
+        for _ in range(repeats):
+            scaled_cache.clear()
+            cold.append(first_frame_ms(script))
+            warm.append(first_frame_ms(script))
+        cold = [c for c in cold if c is not None]
+        warm = [w for w in warm if w is not None]
+        if not cold or not warm:
+            print(f"  {name:<11} | falhou")
+            continue
+        print(f"  {name:<11} | {statistics.median(cold):13.1f} | {statistics.median(warm):15.1f}")
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    pygame.init()
+    pygame.display.set_mode((1200, 800))
+    with tempfile.TemporaryDirectory(prefix="rpg_scaled_") as cache_dir:
+        # Este processo e as telas abertas em first_frame_ms usam o cache temporário
+        scaled_cache.SCALED_DIR = os.environ["RPG_SCALED_CACHE_DIR"] = cache_dir
+        bench_images(repeats)
+        bench_first_frame(max(1, repeats // 2))
+
+if __name__ == "__main__":
+    main()
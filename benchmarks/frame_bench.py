@@ -0,0 +1,358 @@
+# frame_bench.py
+# Mede o custo por frame de cada tela do jogo rodando sem janela, com entrada roteirizada.
+# Cada tela roda em um subprocesso próprio; o relógio e a entrada do pygame são
+# substituídos para que o loop original da tela rode sem esperar o vsync.
+#
+# Uso:
+#   python benchmarks/frame_bench.py [--frames 600] [--screens rpg,menu]
+#                                    [--json resultado.json] [--baseline anterior.json]
+#                                    [--max-regression 0.15] [--thresholds limites.json]
+#
+# Sai com código 1 se algum limite for ultrapassado.
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_THRESHOLDS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frame_thresholds.json")
+METRICS = ("p50_ms", "p95_ms", "p99_ms")
+
+# ==================== ROTEIROS DE ENTRADA ====================
+# (período em frames, [(frame dentro do período, ação, argumento)])
+# Ações: "move" (mouse), "click" (mouse), "key" (nome da tecla), "type" (texto)
+SCREENS = {
+    "rpg": ("RPG_Jogo.py", 600, [
+        (20, "click", (600, 680)),      # diálogo de abertura
+        (40, "click", (600, 680)),
+        (60, "click", (600, 680)),
+        (90, "click", (470, 625)),      # aceitar a missão -> combate
+        (120, "move", (1140, 660)),     # hover na habilidade
+        (150, "click", (1140, 660)),    # rodada de combate
+        (200, "click", (600, 680)),
+        (230, "click", (1045, 660)),
+        (300, "click", (1095, 50)),     # rolagem de dado
+        (330, "click", (600, 680)),
+        (380, "click", (950, 660)),
+        (450, "click", (855, 660)),
+        (500, "key", "r"),              # recomeça se foi derrotado
+        (540, "move", (600, 400)),
+    ]),
+    "personagem": ("Escoher_personagem.py", 240, [
+        (20, "move", (320, 380)),       # hover no Guerreiro
+        (40, "click", (320, 380)),      # escolhe a classe
+        (60, "type", "Aldric"),
+        (80, "key", "backspace"),
+        (100, "key", "return"),         # tela final
+        (160, "key", "escape"),         # volta para a seleção
+        (180, "move", (780, 380)),      # hover no Mago
+        (220, "move", (550, 650)),
+    ]),
+    "local": ("SELECINAR_LOCAL.py", 300, [
+        (20, "key", "right"),           # carrossel
+        (60, "key", "right"),
+        (100, "move", (600, 370)),
+        (120, "click", (1120, 370)),    # seta direita
+        (160, "key", "left"),
+        (200, "click", (80, 370)),      # seta esquerda
+        (240, "move", (600, 730)),      # hover no botão START
+        (280, "key", "left"),
+    ]),
+    "menu": ("MENU", 240, [
+        (20, "key", "down"),
+        (50, "key", "down"),
+        (80, "key", "up"),
+        (110, "key", "down"),
+        (120, "key", "down"),
+        (130, "key", "down"),
+        (150, "key", "return"),         # confirmação de saída
+        (200, "key", "escape"),
+    ]),
+    "login": ("Login_Rpg", 360, [
+        (20, "click", (520, 272)),      # campo de usuário
+        (30, "type", "cavaleiro"),
+        (60, "click", (520, 352)),      # campo de senha
+        (70, "type", "segredo"),
+        (100, "move", (520, 447)),      # hover em "Entrar no Reino"
+        (120, "key", "backspace"),
+        (160, "click", (520, 517)),     # tela de cadastro
+        (180, "click", (520, 210)),
+        (190, "type", "novo_heroi"),
+        (240, "click", (520, 555)),     # volta ao login
+        (300, "move", (200, 650)),
+    ]),
+}
+
+# ==================== EXECUÇÃO DE UMA TELA (SUBPROCESSO) ====================
+class BenchDone(BaseException):
+    """Interrompe o loop da tela; BaseException para escapar de `except Exception`"""
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+def run_worker(name, frames, warmup, alloc):
+    """Roda o loop original da tela com relógio e entrada roteirizados"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("RPG_NO_COMBAT_LOG", "1")  # os combates do roteiro não vão para combates/
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+
+    import runpy
+    import tracemalloc
+    import pygame
+
+    path, period, actions = SCREENS[name]
+    total = warmup + frames
+    state = {"frame": 0, "mouse": (0, 0), "last": None, "mem": None}
+    times, alloc_kb, blocks = [], [], []
+
+    def key_code(name):
+        try:
+            return pygame.key.key_code(name)
+        except ValueError:
+            return 0
+
+    def make_events(frame):
+        events = []
+        for offset, action, arg in actions:
+            if frame % period != offset:
+                continue
+            if action == "move":
+                state["mouse"] = arg
+                events.append(pygame.event.Event(pygame.MOUSEMOTION, pos=arg, rel=(0, 0), buttons=(0, 0, 0)))
+            elif action == "click":
+                state["mouse"] = arg
+                events.append(pygame.event.Event(pygame.MOUSEMOTION, pos=arg, rel=(0, 0), buttons=(0, 0, 0)))
+                events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=arg, button=1))
+                events.append(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=arg, button=1))
+            elif action == "key":
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=key_code(arg), unicode="", mod=0))
+            elif action == "type":
+                for ch in arg:
+                    events.append(pygame.event.Event(pygame.KEYDOWN, key=key_code(ch), unicode=ch, mod=0))
+        return events
+
+    real_get = pygame.event.get
+
+    def scripted_get(*args, **kwargs):
+        real_get()  # esvazia a fila real (janela dummy)
+        return make_events(state["frame"])
+
+    def frame_boundary():
+        """Chamado uma vez por frame (Clock.tick): fecha a medição do frame anterior"""
+        now = time.perf_counter()
+        frame = state["frame"]
+        if state["last"] is not None and frame > warmup:
+            times.append((now - state["last"]) * 1000.0)
+            if alloc:
+                current, peak = tracemalloc.get_traced_memory()
+                alloc_kb.append(max(0, peak - state["mem"]) / 1024.0)
+                blocks.append(sys.getallocatedblocks() - state["blocks"])
+        if frame >= total:
+            raise BenchDone()
+        if frame == warmup and "profiler" in sys.modules:
+            # Seções do profiler do jogo contam só os frames medidos
+            sys.modules["profiler"].frame_profiler.reset()
+        if alloc and frame >= warmup:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            state["mem"] = tracemalloc.get_traced_memory()[0]
+            state["blocks"] = sys.getallocatedblocks()
+        state["frame"] = frame + 1
+        state["last"] = time.perf_counter()
+
+    class BenchClock:
+        """Relógio sem espera: cada tick vale exatamente um frame a 60 FPS"""
+
+        def tick(self, framerate=0):
+            frame_boundary()
+            return 16
+
+        tick_busy_loop = tick
+
+        def get_time(self):
+            return 16
+
+        def get_rawtime(self):
+            return 16
+
+        def get_fps(self):
+            return 60.0
+
+    pygame.time.Clock = BenchClock
+    pygame.time.get_ticks = lambda: int(state["frame"] * 1000 / 60)
+    pygame.event.get = scripted_get
+    pygame.mouse.get_pos = lambda: state["mouse"]
+
+    try:
+        runpy.run_path(os.path.join(ROOT, path), run_name="__main__")
+    except (BenchDone, SystemExit):
+        pass
+
+    result = {"frames": len(times)}
+    if times:
+        result.update({
+            "mean_ms": statistics.fmean(times),
+            "p50_ms": percentile(times, 50),
+            "p95_ms": percentile(times, 95),
+            "p99_ms": percentile(times, 99),
+            "max_ms": max(times),
+        })
+    if alloc_kb:
+        result.update({
+            "alloc_kb_per_frame": statistics.fmean(alloc_kb),
+            "alloc_kb_p95": percentile(alloc_kb, 95),
+            "blocks_per_frame": statistics.fmean(blocks),
+        })
+    if not alloc and "profiler" in sys.modules:
+        result["profiler"] = sys.modules["profiler"].frame_profiler.summary()
+    return result
+
+# ==================== ORQUESTRAÇÃO ====================
+def bench_screen(name, frames, warmup, alloc):
+    """Roda a tela em um subprocesso e devolve as métricas"""
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, "result.json")
+        cmd = [sys.executable, os.path.abspath(__file__), "--worker", name,
+               "--frames", str(frames), "--warmup", str(warmup), "--out", out]
+        if alloc:
+            cmd.append("--alloc")
+        proc = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True)
+        if proc.returncode != 0 or not os.path.exists(out):
+            tail = "\n".join((proc.stderr or proc.stdout).strip().splitlines()[-15:])
+            raise RuntimeError(f"tela '{name}' falhou:\n{tail}")
+        with open(out, encoding="utf-8") as f:
+            return json.load(f)
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+def check_limits(results, thresholds, baseline, max_regression):
+    """Lista as violações de limites absolutos e de regressão contra a linha de base"""
+    failures = []
+    for name, metrics in results.items():
+        limits = dict(thresholds.get("*", {}))
+        limits.update(thresholds.get(name, {}))
+        for metric, limit in limits.items():
+            value = metrics.get(metric)
+            if value is not None and value > limit:
+                failures.append(f"{name}: {metric} = {value:.3f} > limite {limit:.3f}")
+
+        base = baseline.get(name) if baseline else None
+        if base:
+            for metric in METRICS:
+                old, new = base.get(metric), metrics.get(metric)
+                if old and new and new > old * (1.0 + max_regression):
+                    failures.append(f"{name}: {metric} {old:.3f} -> {new:.3f} "
+                                    f"(+{(new / old - 1) * 100:.1f}%, tolerância {max_regression * 100:.0f}%)")
+    return failures
+
+def print_table(results, baseline):
+    print(f"  {'tela':<11} | {'p50 ms':>8} | {'p95 ms':>8} | {'p99 ms':>8} | {'KB/frame':>9} | {'blocos':>7} | {'Δp95':>7}")
+    for name, m in results.items():
+        delta = ""
+        base = baseline.get(name) if baseline else None
+        if base and base.get("p95_ms"):
+            delta = f"{(m['p95_ms'] / base['p95_ms'] - 1) * 100:+.1f}%"
+        print(f"  {name:<11} | {m.get('p50_ms', 0):8.3f} | {m.get('p95_ms', 0):8.3f} | {m.get('p99_ms', 0):8.3f} | "
+              f"{m.get('alloc_kb_per_frame', 0):9.1f} | {m.get('blocks_per_frame', 0):7.1f} | {delta:>7}")
+
+def print_sections(results):
+    """Detalha o tempo médio por subsistema das telas instrumentadas com o profiler"""
+    for name, m in results.items():
+        sections = m.get("profiler", {}).get("sections_ms")
+        if not sections:
+            continue
+        print(f"  [{name}] ms/frame por seção:")
+        for section, ms in sorted(sections.items(), key=lambda item: -item[1]):
+            print(f"    {section:<20} {ms:8.3f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de tempo de frame das telas do jogo")
+    parser.add_argument("--frames", type=int, default=600, help="frames medidos por tela")
+    parser.add_argument("--warmup", type=int, default=60, help="frames descartados no início")
+    parser.add_argument("--screens", default=",".join(SCREENS), help="telas separadas por vírgula")
+    parser.add_argument("--json", help="grava o resultado neste arquivo")
+    parser.add_argument("--baseline", help="resultado anterior para comparar")
+    parser.add_argument("--max-regression", type=float, default=0.15,
+                        help="aumento máximo tolerado em p50/p95/p99 contra a linha de base (0.15 = 15%%)")
+    parser.add_argument("--thresholds", default=DEFAULT_THRESHOLDS, help="limites absolutos por tela (JSON)")
+    parser.add_argument("--no-alloc", action="store_true", help="não mede alocações (mais rápido)")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--out", help=argparse.SUPPRESS)
+    parser.add_argument("--alloc", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        result = run_worker(args.worker, args.frames, args.warmup, args.alloc)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f)
+        return 0
+
+    names = [n.strip() for n in args.screens.split(",") if n.strip()]
+    unknown = [n for n in names if n not in SCREENS]
+    if unknown:
+        parser.error(f"telas desconhecidas: {', '.join(unknown)} (disponíveis: {', '.join(SCREENS)})")
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f).get("screens", {})
+    thresholds = {}
+    if args.thresholds and os.path.exists(args.thresholds):
+        with open(args.thresholds, encoding="utf-8") as f:
+            thresholds = json.load(f)
+
+    print(f"[BENCH] Tempo de frame ({args.frames} frames por tela, {args.warmup} de aquecimento)")
+    results = {}
+    for name in names:
+        # Tempo e alocações em execuções separadas: o tracemalloc distorce o tempo
+        metrics = bench_screen(name, args.frames, args.warmup, alloc=False)
+        if not args.no_alloc:
+            mem = bench_screen(name, args.frames, args.warmup, alloc=True)
+            metrics.update({k: v for k, v in mem.items() if k.startswith(("alloc", "blocks"))})
+        results[name] = metrics
+    print_table(results, baseline)
+    print_sections(results)
+
+    if args.json:
+        report = {
+            "meta": {
+                "revision": git_revision(),
+                "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "frames": args.frames,
+                "warmup": args.warmup,
+            },
+            "screens": results,
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"[INFO] Resultado gravado em {args.json}")
+
+    failures = check_limits(results, thresholds, baseline, args.max_regression)
+    for failure in failures:
+        print(f"[ERRO] {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
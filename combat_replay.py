@@ -0,0 +1,402 @@
+# combat_replay.py
+# Gravação de cada combate em um log binário compacto e reexecução sem janela para conferir
+# se as regras chegam ao mesmo resultado (reprodução de bugs, testes de regressão)
+# Requisitos: pip install pygame numpy
+#
+# Uso:
+#     python combat_replay.py                         # reexecuta todos os combates gravados
+#     python combat_replay.py .cache/combates/x.rpgc --dump
+#     python combat_replay.py --repeat 50             # mede a velocidade de reexecução
+#
+# O jogo grava em .cache/combates/ (RPG_NO_COMBAT_LOG=1 desliga) e mantém só os
+# KEEP_RECORDS combates mais recentes. Cada arquivo guarda o
+# seed do fluxo de dados do combate, o estado inicial de jogador e inimigo e os eventos:
+# habilidades usadas, poções, ataques do inimigo (com rolagens e dano) e o resultado.
+# Os instantes são contados em passos de simulação, então a reexecução não espera nada.
+
+import argparse
+import glob
+import itertools
+import os
+import struct
+import sys
+import time
+
+import numpy as np
+
+from assets import CACHE_DIR, asset_log
+
+RECORD_DIR = os.path.join(CACHE_DIR, "combates")
+ENABLED = os.environ.get("RPG_NO_COMBAT_LOG") != "1"
+KEEP_RECORDS = 200   # combates gravados mantidos; os mais antigos são apagados a cada gravação
+
+# Cabeçalho: marca, versão, duração do passo de simulação (s)
+_HEADER = struct.Struct("<4sHd")
+_MAGIC = b"RPGC"
+_VERSION = 1
+_PLAYER = struct.Struct("<Hhhhhii")   # nível, vida, vida máx., mana, mana máx., exp, exp p/ próximo
+_ABILITY = struct.Struct("<hddh")     # poder, recarga, recarga restante, custo de mana
+_ENEMY = struct.Struct("<hhh")        # vida máx., vida, ataque
+_COUNT = struct.Struct("<H")
+
+# Eventos: tipo e passo (número de passos de simulação desde o início do combate) + dados
+EV_ABILITY, EV_ENEMY, EV_POTION, EV_DT, EV_END = range(1, 6)
+EVENTS = {
+    EV_ABILITY: struct.Struct("<BIBBBBhhh"),  # índice, resultado, rolagem, bônus, dano, vida do inimigo, mana
+    EV_ENEMY: struct.Struct("<BIBhh"),        # bônus, dano, vida do jogador
+    EV_POTION: struct.Struct("<BIBhh"),       # poção (índice em POTIONS), vida, mana
+    EV_DT: struct.Struct("<BId"),             # novo passo de simulação (s)
+    EV_END: struct.Struct("<BIBhHihhh"),      # resultado, ouro, nível, exp, vida, mana, vida do inimigo
+}
+MISS, HIT, OUT_OF_TURN = range(3)             # resultado de EV_ABILITY
+VICTORY, DEFEAT, ABANDONED = range(1, 4)      # resultado de EV_END
+POTIONS = ("Poção de Vida", "Poção de Mana")
+RESULT_NAMES = {VICTORY: "vitória", DEFEAT: "derrota", ABANDONED: "abandonado"}
+
+# ==================== GRAVAÇÃO ====================
+class CombatRecorder:
+    """
+    Eventos de um combate, guardados em memória e gravados de uma vez no fim
+    (save). Criado por GameEngine.start_combat com o jogador e o inimigo ainda
+    intactos; `seed` é DiceRoller.seed do fluxo de dados do combate.
+    """
+
+    def __init__(self, seed, player, enemy, dt=0.0):
+        entropy, spawn_key = seed
+        if not isinstance(entropy, int):
+            raise ValueError("só fluxos de dados com seed inteiro podem ser gravados")
+        self.entropy = entropy
+        self.spawn_key = tuple(spawn_key)
+        self.player = {
+            "name": player.name, "classe": player.classe,
+            "stats": (player.level, player.hp, player.max_hp, player.mp, player.max_mp,
+                      player.exp, player.exp_to_next),
+            "abilities": [(a.name, a.power, a.cooldown, a.remaining, a.cost_mp) for a in player.abilities],
+            "inventory": dict(player.inventory),
+        }
+        self.enemy = {"name": enemy.name, "tipo": enemy.tipo, "fraqueza": enemy.fraqueza,
+                      "stats": (enemy.max_hp, enemy.hp, enemy.atk)}
+        self.dt = dt
+        self.ticks = 0
+        self.events = []
+        self.result = None
+
+    def tick(self, dt):
+        """Um passo de simulação dentro do combate"""
+        if not self.dt:
+            self.dt = dt
+        elif dt != self.dt:
+            self.dt = dt
+            self.events.append((EV_DT, self.ticks, dt))
+        self.ticks += 1
+
+    def ability(self, index, outcome, roll=0, bonus=0, damage=0, enemy_hp=0, mp=0):
+        self.events.append((EV_ABILITY, self.ticks, index, outcome, roll, bonus, damage, enemy_hp, mp))
+
+    def enemy_attack(self, bonus, damage, player_hp):
+        self.events.append((EV_ENEMY, self.ticks, bonus, damage, player_hp))
+
+    def potion(self, potion_type, hp, mp):
+        self.events.append((EV_POTION, self.ticks, POTIONS.index(potion_type), hp, mp))
+
+    def finish(self, result, player, enemy, gold=0):
+        self.result = result
+        self.events.append((EV_END, self.ticks, result, gold, player.level, player.exp,
+                            player.hp, player.mp, enemy.hp if enemy else 0))
+
+    # ---------- formato binário ----------
+    def to_bytes(self):
+        out = bytearray(_HEADER.pack(_MAGIC, _VERSION, self.dt))
+        entropy = self.entropy.to_bytes(max(1, (self.entropy.bit_length() + 7) // 8), "little")
+        out += bytes([len(entropy)]) + entropy
+        out += bytes([len(self.spawn_key)]) + struct.pack(f"<{len(self.spawn_key)}I", *self.spawn_key)
+
+        p = self.player
+        _pack_str(out, p["name"])
+        _pack_str(out, p["classe"])
+        out += _PLAYER.pack(*p["stats"])
+        out += _COUNT.pack(len(p["abilities"]))
+        for name, *values in p["abilities"]:
+            _pack_str(out, name)
+            out += _ABILITY.pack(*values)
+        out += _COUNT.pack(len(p["inventory"]))
+        for item, count in p["inventory"].items():
+            _pack_str(out, item)
+            out += _COUNT.pack(count)
+
+        e = self.enemy
+        for text in (e["name"], e["tipo"], e["fraqueza"]):
+            _pack_str(out, text)
+        out += _ENEMY.pack(*e["stats"])
+
+        for event in self.events:
+            out += EVENTS[event[0]].pack(*event)
+        return bytes(out)
+
+    def save(self, directory=RECORD_DIR, keep=KEEP_RECORDS):
+        """Grava o combate em `directory`, deixa só os `keep` mais recentes e devolve o caminho (None se não deu)"""
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(directory, f"combate_{stamp}_{os.getpid()}_{next(_save_counter)}.rpgc")
+        tmp = f"{path}.tmp"
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(self.to_bytes())
+            os.replace(tmp, path)
+        except OSError as e:
+            asset_log.warning(f"Combate não foi gravado: {e}")
+            return None
+        asset_log.debug(f"Combate gravado em {path}")
+        if keep:
+            prune_records(directory, keep)
+        return path
+
+_save_counter = itertools.count(1)
+
+def prune_records(directory=RECORD_DIR, keep=KEEP_RECORDS):
+    """Apaga os combates gravados mais antigos além dos `keep` mais recentes; retorna quantos"""
+    def mtime(path):
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return 0.0
+
+    paths = sorted(glob.glob(os.path.join(directory, "*.rpgc")), key=mtime, reverse=True)
+    removed = 0
+    for path in paths[keep:]:
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError as e:
+            asset_log.warning(f"Não foi possível remover {path}: {e}")
+    return removed
+
+def _pack_str(out, text):
+    data = text.encode("utf-8")
+    out += _COUNT.pack(len(data)) + data
+
+# ==================== LEITURA ====================
+class _Reader:
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def take(self, fmt):
+        values = fmt.unpack_from(self.data, self.pos)
+        self.pos += fmt.size
+        return values
+
+    def raw(self, size):
+        if self.pos + size > len(self.data):
+            raise ValueError("arquivo truncado")
+        chunk = self.data[self.pos:self.pos + size]
+        self.pos += size
+        return chunk
+
+    def string(self):
+        (size,) = self.take(_COUNT)
+        return self.raw(size).decode("utf-8")
+
+def load_record(path):
+    """Lê um arquivo .rpgc como CombatRecorder; ValueError se o arquivo não for válido"""
+    with open(path, "rb") as f:
+        data = f.read()
+    reader = _Reader(data)
+    try:
+        magic, version, dt = reader.take(_HEADER)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"não é um combate gravado (versão {_VERSION})")
+        entropy = int.from_bytes(reader.raw(reader.raw(1)[0]), "little")
+        key_size = reader.raw(1)[0]
+        spawn_key = struct.unpack(f"<{key_size}I", reader.raw(4 * key_size))
+
+        record = CombatRecorder.__new__(CombatRecorder)
+        record.entropy, record.spawn_key, record.dt = entropy, spawn_key, dt
+        name, classe = reader.string(), reader.string()
+        stats = reader.take(_PLAYER)
+        abilities = [(reader.string(), *reader.take(_ABILITY)) for _ in range(reader.take(_COUNT)[0])]
+        inventory = {}
+        for _ in range(reader.take(_COUNT)[0]):
+            item = reader.string()
+            inventory[item] = reader.take(_COUNT)[0]
+        record.player = {"name": name, "classe": classe, "stats": stats,
+                         "abilities": abilities, "inventory": inventory}
+        record.enemy = {"name": reader.string(), "tipo": reader.string(), "fraqueza": reader.string(),
+                        "stats": reader.take(_ENEMY)}
+
+        record.events, record.result, record.ticks = [], None, 0
+        while reader.pos < len(data):
+            fmt = EVENTS.get(data[reader.pos])
+            if fmt is None:
+                raise ValueError(f"evento desconhecido ({data[reader.pos]}) na posição {reader.pos}")
+            event = reader.take(fmt)
+            record.events.append(event)
+            record.ticks = event[1]
+            if event[0] == EV_END:
+                record.result = event[2]
+    except struct.error as e:
+        raise ValueError(f"arquivo truncado ({e})") from None
+    return record
+
+def describe_event(event):
+    kind, tick = event[0], event[1]
+    if kind == EV_ABILITY:
+        _, _, index, outcome, roll, bonus, damage, enemy_hp, mp = event
+        if outcome == OUT_OF_TURN:
+            text = f"habilidade {index} fora do turno (mana {mp})"
+        else:
+            text = (f"habilidade {index}: d20 {roll}, bônus {bonus}, "
+                    f"{'acerto ' + str(damage) if outcome == HIT else 'erro'}; inimigo {enemy_hp}, mana {mp}")
+    elif kind == EV_ENEMY:
+        text = f"inimigo ataca: bônus {event[2]}, dano {event[3]}; jogador {event[4]}"
+    elif kind == EV_POTION:
+        text = f"{POTIONS[event[2]]}: vida {event[3]}, mana {event[4]}"
+    elif kind == EV_DT:
+        text = f"passo de simulação {event[2]:.5f} s"
+    else:
+        _, _, result, gold, level, exp, hp, mp, enemy_hp = event
+        text = (f"fim: {RESULT_NAMES.get(result, result)}, ouro {gold}, nível {level}, exp {exp}, "
+                f"vida {hp}, mana {mp}, inimigo {enemy_hp}")
+    return f"[{tick:6d}] {text}"
+
+# ==================== REEXECUÇÃO ====================
+def create_replay_engine():
+    """GameEngine sem janela para reexecutar combates (reutilizável entre várias reexecuções)"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    import RPG_Jogo
+    engine = RPG_Jogo.GameEngine(dice_seed=0)
+    engine.record_dir = None  # a reexecução não grava arquivos
+    return engine
+
+def replay(record, engine):
+    """
+    Recria o estado inicial gravado, reaplica as entradas do jogador (habilidades e
+    poções, cada uma no seu passo) e deixa GameEngine.advance_combat decidir o resto:
+    recargas, turno do inimigo, rolagens. Devolve o CombatRecorder da reexecução,
+    para comparar evento a evento com o original.
+    """
+    import RPG_Jogo
+    from dice import DiceRoller
+
+    p = record.player
+    level, hp, max_hp, mp, max_mp, exp, exp_to_next = p["stats"]
+    player = RPG_Jogo.PlayerCharacter(p["name"], p["classe"], level, max_hp, max_mp)
+    player.hp, player.mp, player.exp, player.exp_to_next = hp, mp, exp, exp_to_next
+    player.inventory = dict(p["inventory"])
+    if len(player.abilities) != len(p["abilities"]):
+        raise ValueError(f"a classe {p['classe']} não tem mais {len(p['abilities'])} habilidades")
+    for ability, (_, power, cooldown, remaining, cost_mp) in zip(player.abilities, p["abilities"]):
+        ability.power, ability.cooldown, ability.remaining, ability.cost_mp = power, cooldown, remaining, cost_mp
+    engine.player = player
+
+    e = record.enemy
+    max_hp, hp, atk = e["stats"]
+    enemy = RPG_Jogo.GameEnemy(e["name"], max_hp, atk, e["tipo"], e["fraqueza"])
+    enemy.hp = hp
+
+    engine.mode = "explore"
+    engine.start_combat(enemy, DiceRoller(np.random.SeedSequence(record.entropy, spawn_key=record.spawn_key)))
+    recorder = engine.recorder
+    dt = record.dt
+    for index, event in enumerate(record.events):
+        kind, tick = event[0], event[1]
+        while engine.recorder is recorder and recorder.ticks < tick:
+            if engine.enemy_timer == 0.0 and all(a.remaining <= 0.0 for a in player.abilities):
+                # Nada pendente: os passos até o evento só mexem em efeitos visuais
+                recorder.ticks = tick
+                break
+            engine.advance_combat(dt)
+        if engine.recorder is not recorder:
+            break  # o combate da reexecução já terminou
+        if kind == EV_ABILITY:
+            engine.player_use_ability(event[2])
+        elif kind == EV_POTION:
+            engine.use_potion(POTIONS[event[2]])
+        elif kind == EV_ENEMY and len(recorder.events) <= index:
+            # O inimigo age no começo do passo seguinte, se o temporizador dele zerar
+            engine.advance_combat(dt)
+        elif kind == EV_DT:
+            dt = event[2]
+            engine.advance_combat(dt)  # o passo que trocou o dt (e o registrou)
+
+    # Sem acúmulo entre reexecuções: mensagens e partículas não interessam aqui
+    engine.dialog.queue.clear()
+    engine.particles.update(60.0)
+    if engine.recorder is recorder:
+        engine.finish_recording(ABANDONED)
+    return recorder
+
+def first_difference(expected, got):
+    """Índice do primeiro evento diferente, ou None se as sequências forem iguais"""
+    for i, (a, b) in enumerate(zip(expected, got)):
+        if a != b:
+            return i
+    if len(expected) != len(got):
+        return min(len(expected), len(got))
+    return None
+
+# ==================== LINHA DE COMANDO ====================
+def collect_paths(targets):
+    paths = []
+    for target in targets or [RECORD_DIR]:
+        if os.path.isdir(target):
+            paths.extend(sorted(glob.glob(os.path.join(target, "*.rpgc"))))
+        else:
+            paths.append(target)
+    return paths
+
+def main():
+    parser = argparse.ArgumentParser(description="Reexecuta combates gravados e confere o resultado")
+    parser.add_argument("paths", nargs="*", help=f"arquivos .rpgc ou pastas (padrão: {RECORD_DIR})")
+    parser.add_argument("--dump", action="store_true", help="lista os eventos de cada combate")
+    parser.add_argument("--repeat", type=int, default=1, help="reexecuções por arquivo (medição)")
+    args = parser.parse_args()
+
+    paths = collect_paths(args.paths)
+    if not paths:
+        print(f"[AVISO] Nenhum combate gravado em {RECORD_DIR}")
+        return
+
+    engine = create_replay_engine()
+    failures = replays = events = 0
+    elapsed = 0.0
+    for path in paths:
+        try:
+            record = load_record(path)
+        except (OSError, ValueError) as e:
+            print(f"[ERRO] {path}: {e}")
+            failures += 1
+            continue
+        if args.dump:
+            print(f"{path}: {record.player['name']} ({record.player['classe']}) x {record.enemy['name']}")
+            for event in record.events:
+                print("  " + describe_event(event))
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            result = replay(record, engine)
+        elapsed += time.perf_counter() - start
+        replays += args.repeat
+        events += args.repeat * len(record.events)
+
+        index = first_difference(record.events, result.events)
+        name = os.path.basename(path)
+        if index is None:
+            print(f"[INFO] {name}: ok ({RESULT_NAMES.get(record.result, 'incompleto')}, "
+                  f"{len(record.events)} eventos)")
+        else:
+            failures += 1
+            print(f"[ERRO] {name}: diverge no evento {index}")
+            for label, stream in (("gravado", record.events), ("reexecução", result.events)):
+                shown = describe_event(stream[index]) if index < len(stream) else "(nenhum)"
+                print(f"    {label:>10}: {shown}")
+
+    if elapsed:
+        print(f"[INFO] {replays} reexecuções em {elapsed * 1000:.1f} ms "
+              f"({replays / elapsed:,.0f} combates/s, {events / elapsed:,.0f} eventos/s)")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
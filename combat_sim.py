@@ -0,0 +1,303 @@
+# combat_sim.py
+# Simulação de combates em lote (Monte Carlo) com NumPy, sem pygame, para balanceamento
+# Requisitos: pip install numpy
+#
+# Regras (as mesmas de RPG_Jogo.GameEngine):
+#   jogador: acerta se d20 + nível >= 10; dano = poder + nível // 2 + d20 // 12
+#   inimigo: sempre acerta; dano = max(1, ataque + d20 // 10)
+#   o inimigo age ENEMY_TURN_DELAY s depois do jogador; recargas contam em segundos
+#
+# Uso:
+#     python combat_sim.py                                  # personagem e inimigos padrão do jogo
+#     python combat_sim.py --classe Mago --level 3 --fights 2000000 --seed 7
+#     python combat_sim.py --json                           # resumo em JSON
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from dice import DiceRoller
+
+ENEMY_TURN_DELAY = 1.2   # mesmo valor de RPG_Jogo.ENEMY_TURN_DELAY
+THINK_TIME = 1.0         # segundos que o jogador leva para escolher a próxima habilidade
+HIT_TARGET = 10          # d20 + nível precisa alcançar este valor
+HIT_ROLL = "1d20"        # mesmas expressões de RPG_Jogo (HIT_ROLL, BONUS_ROLL)
+BONUS_ROLL = "1d20"
+MAX_TURNS = 200          # lutas mais longas contam como empate
+CHUNK_SIZE = 1_000_000   # lutas simuladas por vez (limita a memória)
+
+# ==================== DADOS DE ENTRADA ====================
+class AbilitySpec:
+    """Parte de uma Ability que importa para o combate"""
+
+    def __init__(self, name, power, cooldown=0.0, cost_mp=0):
+        self.name = name
+        self.power = power
+        self.cooldown = cooldown
+        self.cost_mp = cost_mp
+
+    @classmethod
+    def from_ability(cls, ability):
+        return cls(ability.name, ability.power, ability.cooldown, ability.cost_mp)
+
+class PlayerBuild:
+    """Personagem a simular: nível, vida e mana máximas e habilidades"""
+
+    def __init__(self, name, level, max_hp, max_mp, abilities):
+        self.name = name
+        self.level = level
+        self.max_hp = max_hp
+        self.max_mp = max_mp
+        self.abilities = list(abilities)
+
+    @classmethod
+    def from_character(cls, player):
+        """A partir de um RPG_Jogo.PlayerCharacter (a luta começa com vida e mana cheias)"""
+        return cls(player.name, player.level, player.max_hp, player.max_mp,
+                   [AbilitySpec.from_ability(a) for a in player.abilities])
+
+class EnemySpec:
+    def __init__(self, name, max_hp, atk, tipo=""):
+        self.name = name
+        self.max_hp = max_hp
+        self.atk = atk
+        self.tipo = tipo
+
+    @classmethod
+    def from_enemy(cls, enemy):
+        """A partir de um RPG_Jogo.GameEnemy"""
+        return cls(enemy.name, enemy.max_hp, enemy.atk, enemy.tipo)
+
+# ==================== RESULTADO ====================
+def _accumulate(hist, values):
+    """Soma np.bincount(values) ao histograma, aumentando-o se preciso"""
+    if len(values) == 0:
+        return hist
+    counts = np.bincount(values)
+    if len(counts) > len(hist):
+        hist = np.concatenate([hist, np.zeros(len(counts) - len(hist), dtype=np.int64)])
+    hist[:len(counts)] += counts
+    return hist
+
+def hist_percentile(hist, q):
+    """Percentil q (0-100) de um histograma em que o índice é o valor"""
+    total = hist.sum()
+    if not total:
+        return 0
+    return int(np.searchsorted(np.cumsum(hist), total * q / 100.0))
+
+def hist_mean(hist):
+    total = hist.sum()
+    return float((np.arange(len(hist)) * hist).sum() / total) if total else 0.0
+
+class CombatStats:
+    """
+    Resultado de simulate(). As distribuições são histogramas (índice = valor):
+    turns (turnos até vencer), damage_dealt (dano por acerto do jogador),
+    damage_taken (dano por ataque do inimigo), fight_damage_taken (dano total
+    recebido por luta) e hp_left (vida restante nas vitórias).
+    """
+
+    def __init__(self, player, enemy):
+        self.player = player
+        self.enemy = enemy
+        self.fights = self.wins = self.losses = self.draws = 0
+        self.attacks = self.hits = 0
+        self.turns = np.zeros(1, dtype=np.int64)
+        self.damage_dealt = np.zeros(1, dtype=np.int64)
+        self.damage_taken = np.zeros(1, dtype=np.int64)
+        self.fight_damage_taken = np.zeros(1, dtype=np.int64)
+        self.hp_left = np.zeros(1, dtype=np.int64)
+        self.elapsed = 0.0
+
+    @property
+    def win_rate(self):
+        return self.wins / self.fights if self.fights else 0.0
+
+    @property
+    def hit_rate(self):
+        return self.hits / self.attacks if self.attacks else 0.0
+
+    def summary(self):
+        """Números principais em um dicionário (para tabelas, JSON e relatórios)"""
+        return {
+            "player": self.player.name,
+            "level": self.player.level,
+            "enemy": self.enemy.name,
+            "fights": self.fights,
+            "win_rate": self.win_rate,
+            "loss_rate": self.losses / self.fights if self.fights else 0.0,
+            "draw_rate": self.draws / self.fights if self.fights else 0.0,
+            "hit_rate": self.hit_rate,
+            "turns_mean": hist_mean(self.turns),
+            "turns_p50": hist_percentile(self.turns, 50),
+            "turns_p90": hist_percentile(self.turns, 90),
+            "damage_dealt_mean": hist_mean(self.damage_dealt),
+            "damage_dealt_p95": hist_percentile(self.damage_dealt, 95),
+            "damage_taken_mean": hist_mean(self.damage_taken),
+            "fight_damage_taken_mean": hist_mean(self.fight_damage_taken),
+            "fight_damage_taken_p95": hist_percentile(self.fight_damage_taken, 95),
+            "hp_left_mean": hist_mean(self.hp_left),
+            "exp_per_win": self.enemy.max_hp // 3,
+            "seconds": self.elapsed,
+        }
+
+# ==================== SIMULAÇÃO ====================
+def simulate(player, enemy, fights=1_000_000, seed=None, max_turns=MAX_TURNS,
+             think_time=THINK_TIME, chunk_size=CHUNK_SIZE):
+    """
+    Simula `fights` lutas independentes de `player` (PlayerBuild) contra `enemy`
+    (EnemySpec). A cada turno o jogador usa a habilidade de ataque de maior poder que
+    esteja pronta e caiba na mana; se nenhuma estiver pronta, espera a recarga (o
+    inimigo só age depois de uma habilidade). Habilidades de poder <= 0 (cura, defesa)
+    não são usadas: no combate do jogo elas não causam dano útil.
+    `seed` pode ser um inteiro, uma lista de inteiros ou um dice.DiceRoller.
+    """
+    dice = seed if isinstance(seed, DiceRoller) else DiceRoller(seed)
+    stats = CombatStats(player, enemy)
+    start = time.perf_counter()
+    for first in range(0, fights, chunk_size):
+        _simulate_chunk(stats, min(chunk_size, fights - first), dice, max_turns, think_time)
+    stats.elapsed = time.perf_counter() - start
+    return stats
+
+def _simulate_chunk(stats, n, dice, max_turns, think_time):
+    player, enemy = stats.player, stats.enemy
+    stats.fights += n
+    attacks = sorted((a for a in player.abilities if a.power > 0), key=lambda a: -a.power)
+    if not attacks:
+        stats.draws += n
+        return
+
+    # Habilidades em ordem de preferência (maior poder primeiro)
+    powers = np.array([a.power for a in attacks], dtype=np.int32)
+    cooldowns = np.array([a.cooldown for a in attacks], dtype=np.float32)
+    costs = np.array([a.cost_mp for a in attacks], dtype=np.int32)
+    level = player.level
+    round_time = ENEMY_TURN_DELAY + think_time
+
+    # Estado de cada luta ainda em andamento
+    player_hp = np.full(n, player.max_hp, dtype=np.int32)
+    enemy_hp = np.full(n, enemy.max_hp, dtype=np.int32)
+    mp = np.full(n, player.max_mp, dtype=np.int32)
+    taken = np.zeros(n, dtype=np.int32)
+    cd = np.zeros((n, len(attacks)), dtype=np.float32)
+
+    for turn in range(1, max_turns + 1):
+        # Sem mana para nenhum ataque: a luta não termina
+        affordable = mp[:, None] >= costs[None, :]
+        stuck = ~affordable.any(axis=1)
+        if stuck.any():
+            stats.draws += int(stuck.sum())
+            keep = ~stuck
+            player_hp, enemy_hp, mp, taken, cd, affordable = (
+                player_hp[keep], enemy_hp[keep], mp[keep], taken[keep], cd[keep], affordable[keep])
+            if not len(mp):
+                return
+
+        # Espera a recarga mais curta entre as habilidades pagáveis (0 se já há uma pronta)
+        wait = np.where(affordable, cd, np.inf).min(axis=1)
+        cd = np.maximum(cd - wait[:, None], 0.0)
+        choice = (affordable & (cd <= 0.0)).argmax(axis=1)
+        rows = np.arange(len(choice))
+        cd[rows, choice] = cooldowns[choice]
+        mp -= costs[choice]
+
+        # Turno do jogador
+        roll, total = dice.roll_many(HIT_ROLL, len(choice)), dice.roll_many(BONUS_ROLL, len(choice))
+        hit = roll + level >= HIT_TARGET
+        dmg = powers[choice] + level // 2 + total // 12
+        stats.attacks += len(choice)
+        stats.hits += int(hit.sum())
+        stats.damage_dealt = _accumulate(stats.damage_dealt, dmg[hit])
+        enemy_hp = np.where(hit, np.maximum(0, enemy_hp - dmg), enemy_hp)
+
+        won = enemy_hp <= 0
+        if won.any():
+            stats.wins += int(won.sum())
+            stats.turns = _accumulate(stats.turns, np.full(int(won.sum()), turn))
+            stats.hp_left = _accumulate(stats.hp_left, player_hp[won])
+            stats.fight_damage_taken = _accumulate(stats.fight_damage_taken, taken[won])
+
+        # Turno do inimigo (só nas lutas que continuam)
+        alive = ~won
+        edmg = np.maximum(1, enemy.atk + dice.roll_many(BONUS_ROLL, len(choice)) // 10)
+        stats.damage_taken = _accumulate(stats.damage_taken, edmg[alive])
+        player_hp = np.where(alive, np.maximum(0, player_hp - edmg), player_hp)
+        taken = np.where(alive, taken + edmg, taken)
+
+        lost = alive & (player_hp <= 0)
+        if lost.any():
+            stats.losses += int(lost.sum())
+            stats.fight_damage_taken = _accumulate(stats.fight_damage_taken, taken[lost])
+
+        # Tempo até a próxima ação do jogador
+        keep = alive & ~lost
+        player_hp, enemy_hp, mp, taken = player_hp[keep], enemy_hp[keep], mp[keep], taken[keep]
+        cd = np.maximum(cd[keep] - round_time, 0.0)
+        if not len(mp):
+            return
+
+    stats.draws += len(mp)
+
+# ==================== LINHA DE COMANDO ====================
+def load_game_roster(classe, level, max_hp, max_mp):
+    """Personagem e inimigos do jogo (importa RPG_Jogo sem abrir janela)"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # stdout limpo para --json
+    import RPG_Jogo
+    player = RPG_Jogo.PlayerCharacter(f"{classe} Nv.{level}", classe, level, max_hp, max_mp)
+    enemies = RPG_Jogo.create_enemy_roster()
+    return PlayerBuild.from_character(player), [EnemySpec.from_enemy(e) for e in enemies]
+
+def print_table(results):
+    print(f"  {'inimigo':<24} | {'vitória':>7} | {'derrota':>7} | {'turnos':>6} | {'p90':>4} | "
+          f"{'dano/acerto':>11} | {'dano recebido':>13} | {'vida final':>10}")
+    for s in results:
+        r = s.summary()
+        print(f"  {r['enemy']:<24} | {r['win_rate'] * 100:6.1f}% | {r['loss_rate'] * 100:6.1f}% | "
+              f"{r['turns_mean']:6.2f} | {r['turns_p90']:4d} | {r['damage_dealt_mean']:11.2f} | "
+              f"{r['fight_damage_taken_mean']:13.1f} | {r['hp_left_mean']:10.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulação de combates em lote para balanceamento")
+    parser.add_argument("--fights", type=int, default=1_000_000, help="lutas por inimigo")
+    parser.add_argument("--classe", default="Guerreiro", help="Guerreiro, Mago ou outra (Arqueiro)")
+    parser.add_argument("--level", type=int, default=1)
+    parser.add_argument("--hp", type=int, default=120, help="vida máxima do personagem")
+    parser.add_argument("--mp", type=int, default=40, help="mana máxima do personagem")
+    parser.add_argument("--enemy", help="simula só os inimigos cujo nome contém este texto")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--max-turns", type=int, default=MAX_TURNS)
+    parser.add_argument("--think-time", type=float, default=THINK_TIME,
+                        help="segundos entre o turno do inimigo e a próxima ação do jogador")
+    parser.add_argument("--json", action="store_true", help="imprime os resumos em JSON")
+    args = parser.parse_args()
+
+    player, enemies = load_game_roster(args.classe, args.level, args.hp, args.mp)
+    if args.enemy:
+        enemies = [e for e in enemies if args.enemy.lower() in e.name.lower()]
+        if not enemies:
+            parser.error(f"nenhum inimigo com '{args.enemy}' no nome")
+
+    # Um fluxo de dados por inimigo, todos derivados do --seed
+    session = DiceRoller(args.seed)
+    results = [simulate(player, enemy, args.fights, session.spawn(), args.max_turns, args.think_time)
+               for enemy in enemies]
+
+    if args.json:
+        json.dump([s.summary() for s in results], sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return
+    total = sum(s.elapsed for s in results)
+    print(f"[INFO] {player.name}: {args.fights} lutas por inimigo, "
+          f"{args.fights * len(results) / total / 1e6:.2f} milhões de lutas/s")
+    print_table(results)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+# dice.py
+# Dados em notação NdM ("d20", "4d6kh3+2", "2d20kl1-1") com fluxos de números aleatórios
+# semeados (reprodutíveis) e rolagem em lote com NumPy para simulações
+# Requisitos: pip install numpy
+#
+# Uso:
+#     from dice import DiceRoller
+#     dice = DiceRoller(seed=42)            # um por sessão
+#     combat = dice.spawn()                 # fluxo independente para um combate
+#     combat.roll("4d6kh3+2").total         # uma rolagem, com os dados guardados
+#     combat.roll_many("1d20", 1_000_000)   # array com os totais de um milhão de rolagens
+
+import re
+
+import numpy as np
+
+# Espaços só em volta dos operadores: "1d20 + 3" vale, "1d20 3" e "4 d 6" não
+TERM_PATTERN = re.compile(r"\s*([+-]?)\s*(?:(\d*)d(\d+)(?:(kh|kl|k)(\d+))?|(\d+))\s*", re.IGNORECASE)
+
+# ==================== EXPRESSÕES ====================
+class DiceTerm:
+    """`count` dados de `sides` faces, mantendo os `keep` maiores (kh) ou menores (kl)"""
+
+    def __init__(self, count, sides, keep=None, lowest=False, sign=1):
+        if count < 1 or sides < 1:
+            raise ValueError(f"Dados inválidos: {count}d{sides}")
+        if keep is not None and not 1 <= keep <= count:
+            raise ValueError(f"Não dá para manter {keep} de {count} dados")
+        self.count = count
+        self.sides = sides
+        self.keep = count if keep is None else keep
+        self.lowest = lowest
+        self.sign = sign
+
+    def __str__(self):
+        keep = f"k{'l' if self.lowest else 'h'}{self.keep}" if self.keep != self.count else ""
+        return f"{self.count}d{self.sides}{keep}"
+
+class DiceExpression:
+    """Soma de termos de dados mais um modificador fixo"""
+
+    def __init__(self, text, terms, modifier=0):
+        self.text = text
+        self.terms = terms
+        self.modifier = modifier
+
+    @property
+    def minimum(self):
+        return self.modifier + sum(t.sign * (t.keep if t.sign > 0 else t.keep * t.sides) for t in self.terms)
+
+    @property
+    def maximum(self):
+        return self.modifier + sum(t.sign * (t.keep * t.sides if t.sign > 0 else t.keep) for t in self.terms)
+
+    def __str__(self):
+        return self.text
+
+parsed_expressions = {}
+
+def parse_dice(text):
+    """Converte "4d6kh3+2" em DiceExpression (memorizado por texto); ValueError se inválido"""
+    expr = parsed_expressions.get(text)
+    if expr is not None:
+        return expr
+
+    source = text.lower()
+    terms, modifier, pos = [], 0, 0
+    while pos < len(source):
+        match = TERM_PATTERN.match(source, pos)
+        if not match or match.end() == pos or (pos > 0 and not match.group(1)):
+            raise ValueError(f"Expressão de dados inválida: '{text}'")
+        sign = -1 if match.group(1) == "-" else 1
+        count, sides, mode, keep, flat = match.group(2, 3, 4, 5, 6)
+        if flat is not None:
+            modifier += sign * int(flat)
+        else:
+            terms.append(DiceTerm(int(count or 1), int(sides), int(keep) if keep else None,
+                                  mode == "kl", sign))
+        pos = match.end()
+    if not terms:
+        raise ValueError(f"Expressão sem dados: '{text}'")
+
+    expr = parsed_expressions[text] = DiceExpression(text, terms, modifier)
+    return expr
+
+# ==================== RESULTADOS ====================
+class DiceRoll:
+    """Uma rolagem: total, todos os dados de cada termo e quais foram mantidos"""
+
+    def __init__(self, expression, rolls, kept, total):
+        self.expression = expression
+        self.rolls = rolls      # por termo: lista com os valores de todos os dados
+        self.kept = kept        # por termo: valores mantidos (kh/kl)
+        self.total = total
+
+    @property
+    def natural(self):
+        """Valor do dado quando a expressão é um único dado somado ("d20", "1d20+3"), senão None"""
+        terms = self.expression.terms
+        if len(terms) == 1 and terms[0].keep == 1 and terms[0].sign > 0:
+            return self.kept[0][0]
+        return None
+
+    @property
+    def is_critical(self):
+        return self.natural is not None and self.natural == self.expression.terms[0].sides
+
+    @property
+    def is_fumble(self):
+        return self.natural == 1
+
+    def describe(self):
+        """Texto com os dados, ex.: "4d6kh3+2: [6, 5, (1), 4] + 2 = 17" (descartados entre parênteses)"""
+        parts = []
+        for term, rolls, kept in zip(self.expression.terms, self.rolls, self.kept):
+            remaining = list(kept)
+            shown = []
+            for value in rolls:
+                if value in remaining:
+                    remaining.remove(value)
+                    shown.append(str(value))
+                else:
+                    shown.append(f"({value})")
+            parts.append(("- " if term.sign < 0 else "+ ") + f"[{', '.join(shown)}]")
+        if self.expression.modifier:
+            parts.append(f"{'-' if self.expression.modifier < 0 else '+'} {abs(self.expression.modifier)}")
+        return f"{self.expression}: {' '.join(parts).lstrip('+ ')} = {self.total}"
+
+    def __int__(self):
+        return self.total
+
+# ==================== ROLADOR ====================
+class DiceRoller:
+    """
+    Fluxo de números aleatórios próprio (numpy Generator). Com o mesmo seed, a mesma
+    sequência de rolagens se repete; spawn() cria fluxos filhos independentes (um por
+    combate), então o que acontece num combate não altera as rolagens de outro.
+    """
+
+    def __init__(self, seed=None):
+        self.seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self.rng = np.random.default_rng(self.seed_sequence)
+
+    @property
+    def seed(self):
+        """Entropia e posição na árvore de fluxos: o bastante para recriar este rolador"""
+        return self.seed_sequence.entropy, self.seed_sequence.spawn_key
+
+    def spawn(self):
+        return DiceRoller(self.seed_sequence.spawn(1)[0])
+
+    def d(self, sides=20):
+        """Um único dado, sem passar pelo parser"""
+        return int(self.rng.integers(1, sides + 1))
+
+    def between(self, low, high):
+        """Inteiro uniforme de `low` a `high` (inclusive), para faixas que não são dados"""
+        return int(self.rng.integers(low, high + 1))
+
+    def roll(self, expression):
+        expr = parse_dice(expression) if isinstance(expression, str) else expression
+        rolls, kept, total = [], [], expr.modifier
+        for term in expr.terms:
+            values = self.rng.integers(1, term.sides + 1, term.count).tolist()
+            chosen = sorted(values, reverse=not term.lowest)[:term.keep]
+            rolls.append(values)
+            kept.append(chosen)
+            total += term.sign * sum(chosen)
+        return DiceRoll(expr, rolls, kept, total)
+
+    def roll_many(self, expression, n):
+        """Totais de `n` rolagens independentes em um array int32 (sem laço em Python)"""
+        expr = parse_dice(expression) if isinstance(expression, str) else expression
+        totals = np.full(n, expr.modifier, dtype=np.int32)
+        for term in expr.terms:
+            if term.count == 1:
+                values = self.rng.integers(1, term.sides + 1, n, dtype=np.int32)
+            else:
+                dice = self.rng.integers(1, term.sides + 1, (n, term.count), dtype=np.int32)
+                if term.keep != term.count:
+                    dice.sort(axis=1)
+                    dice = dice[:, :term.keep] if term.lowest else dice[:, -term.keep:]
+                values = dice.sum(axis=1, dtype=np.int32)
+            totals += term.sign * values
+        return totals
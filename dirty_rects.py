@@ -0,0 +1,62 @@
+# dirty_rects.py
+# Renderização por retângulos sujos: só redesenha e envia à tela o que mudou
+# Requisitos: pip install pygame
+
+import pygame
+
+# ==================== ESTADO DE WIDGET ====================
+class DirtyState:
+    """
+    Guarda o último estado visual de um widget. update() devolve os
+    retângulos a redesenhar (área antiga e nova) quando algo mudou.
+    """
+
+    def __init__(self):
+        self.state = None
+        self.rect = None
+
+    def update(self, state, rect):
+        rect = pygame.Rect(rect) if rect is not None else None
+        if state == self.state and rect == self.rect:
+            return []
+        rects = [r for r in (self.rect, rect) if r is not None]
+        self.state, self.rect = state, rect
+        return rects
+
+# ==================== RENDERIZADOR ====================
+class DirtyRectRenderer:
+    """Acumula os retângulos alterados no frame e os envia com display.update(rects)"""
+
+    def __init__(self, size):
+        self.screen_rect = pygame.Rect((0, 0), size)
+        self.rects = []
+        self.full = True  # o primeiro frame sempre é completo
+
+    def mark(self, *rects):
+        for rect in rects:
+            rect = self.screen_rect.clip(rect)
+            if rect.w and rect.h:
+                self.rects.append(rect)
+
+    def mark_full(self):
+        self.full = True
+
+    def begin_frame(self, surf):
+        """Define o recorte do frame; retorna None quando não há nada a redesenhar"""
+        if self.full:
+            surf.set_clip(None)
+            return self.screen_rect
+        if not self.rects:
+            return None
+        clip = self.rects[0].unionall(self.rects[1:])
+        surf.set_clip(clip)
+        return clip
+
+    def present(self, surf):
+        surf.set_clip(None)
+        if self.full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.rects)
+        self.rects = []
+        self.full = False
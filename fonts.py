@@ -0,0 +1,180 @@
+# fonts.py
+# Registro único de fontes do processo, com fallback de glifos (emojis e símbolos)
+# Requisitos: pip install pygame
+#
+# Uso:
+#     from fonts import font_registry
+#     FONT = font_registry.get("MorrisRoman-Black.ttf,georgia", 22)
+#
+# A família segue a convenção do SysFont: nomes separados por vírgula, o primeiro
+# disponível vence. Nomes terminados em .ttf/.otf são arquivos do jogo (pasta font/,
+# pelo índice de recursos); os demais são fontes do sistema. None é a fonte padrão.
+
+import os
+import unicodedata
+
+import pygame
+
+from assets import asset_index, asset_log
+
+try:
+    import pygame.freetype as freetype
+except ImportError:  # build do pygame sem freetype: sem detecção de glifos, sem fallback
+    freetype = None
+
+# Fontes tentadas, em ordem, para glifos que a fonte do texto não tem
+EMOJI_FALLBACKS = ("segoeuiemoji", "segoeuisymbol", "applecoloremoji", "notocoloremoji",
+                   "notoemoji", "symbola", "dejavusans")
+# Seletores de variação (o "️" de "❤️"): sem largura, e nenhuma fonte do SDL_ttf os desenha
+_IGNORED = dict.fromkeys(map(ord, "\ufe0e\ufe0f"))
+DEFAULT_FONT_PATH = os.path.join(os.path.dirname(pygame.__file__), pygame.font.get_default_font())
+
+class FontRegistry:
+    """
+    Cada (família, tamanho, negrito, itálico) é resolvida e carregada uma única vez,
+    na primeira vez que alguém pede. A busca de fontes do sistema (lenta na primeira
+    chamada do SysFont) fica restrita a essa primeira resolução de cada família.
+    """
+
+    def __init__(self, emoji_fallbacks=EMOJI_FALLBACKS):
+        self.emoji_fallbacks = emoji_fallbacks
+        self._fonts = {}
+        self._paths = {}          # (nome, negrito, itálico) -> caminho ou None
+        self._info = {}           # Font -> (caminho do arquivo, tamanho): glifos e fontes reserva
+        self._probes = {}         # caminho -> (freetype.Font, {caractere: bool})
+        self._fallback_paths = None
+        self.loads = 0
+
+    # ---------- resolução ----------
+    def _resolve_name(self, name, bold, italic):
+        """Caminho do arquivo para um único nome de família, ou None se não existir"""
+        key = (name.lower(), bold, italic)
+        if key not in self._paths:
+            if name.lower() == pygame.font.get_default_font():
+                path = DEFAULT_FONT_PATH
+            elif name.lower().endswith((".ttf", ".otf")):
+                path = asset_index.find(name) or asset_index.find(f"font/{os.path.basename(name)}")
+            else:
+                path = pygame.font.match_font(name, bold, italic)
+            self._paths[key] = path
+        return self._paths[key]
+
+    def resolve(self, family, bold=False, italic=False):
+        """(nome, caminho) da primeira família disponível da lista, ou (None, None)"""
+        for name in (family or "").split(","):
+            name = name.strip()
+            if name:
+                path = self._resolve_name(name, bold, italic)
+                if path:
+                    return name, path
+        return None, None
+
+    # ---------- carregamento ----------
+    def get(self, family=None, size=20, bold=False, italic=False):
+        key = (family, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = self._load(family, size, bold, italic)
+        return font
+
+    def _load(self, family, size, bold, italic):
+        self.loads += 1
+        name, path = self.resolve(family, bold, italic)
+        font = None
+        if path:
+            try:
+                if name.lower().endswith((".ttf", ".otf")):
+                    font = pygame.font.Font(path, size)
+                    font.set_bold(bold)
+                    font.set_italic(italic)
+                else:
+                    # SysFont escolhe a variante negrito/itálico ou simula o estilo
+                    font = pygame.font.SysFont(name, size, bold, italic)
+            except (OSError, pygame.error) as e:
+                asset_log.error(f"Fonte '{name}' não pôde ser carregada: {e}")
+                font = None
+        if font is None:
+            if family:
+                asset_log.info(f"Nenhuma fonte de '{family}' encontrada; usando a padrão")
+            path = DEFAULT_FONT_PATH
+            font = pygame.font.Font(None, size)
+            font.set_bold(bold)
+            font.set_italic(italic)
+        self._info[font] = (path, size)
+        return font
+
+    def __len__(self):
+        return len(self._fonts)
+
+    # ---------- fallback de glifos ----------
+    def _covers(self, path, ch):
+        """True se a fonte em `path` tem o glifo (sem freetype, assume que tem)"""
+        if freetype is None or path is None:
+            return True
+        probe = self._probes.get(path)
+        if probe is None:
+            try:
+                probe = self._probes[path] = (freetype.Font(path, 16), {})
+            except (OSError, pygame.error):
+                probe = self._probes[path] = (None, {})
+        face, known = probe
+        if face is None:
+            return True
+        has = known.get(ch)
+        if has is None:
+            has = known[ch] = face.get_metrics(ch)[0] is not None
+        return has
+
+    def _fallbacks(self):
+        if self._fallback_paths is None:
+            self._fallback_paths = [name for name in self.emoji_fallbacks
+                                    if self._resolve_name(name, False, False)]
+        return self._fallback_paths
+
+    def runs(self, font, text):
+        """Divide o texto em trechos (fonte, texto): cada glifo vai para a primeira fonte que o tem"""
+        text = text.translate(_IGNORED)
+        path, size = self._info.get(font, (None, None))
+        if path is None or all(self._covers(path, ch) for ch in text):
+            return [(font, text)]
+
+        runs = []
+        for ch in text:
+            chosen = font
+            if not self._covers(path, ch) and unicodedata.category(ch) not in ("Zs", "Mn", "Cf"):
+                for name in self._fallbacks():
+                    if self._covers(self._resolve_name(name, False, False), ch):
+                        chosen = self.get(name, size)
+                        break
+            if runs and runs[-1][0] is chosen:
+                runs[-1] = (chosen, runs[-1][1] + ch)
+            else:
+                runs.append((chosen, ch))
+        return runs
+
+    def size(self, font, text):
+        """Como Font.size, mas medindo cada trecho com a fonte que vai desenhá-lo"""
+        runs = self.runs(font, text)
+        if len(runs) == 1:
+            return runs[0][0].size(runs[0][1])
+        sizes = [f.size(t) for f, t in runs]
+        return sum(w for w, _ in sizes), max(h for _, h in sizes)
+
+    def render(self, font, text, antialias, color):
+        """Como Font.render, trocando de fonte nos glifos que a fonte pedida não tem"""
+        runs = self.runs(font, text)
+        if len(runs) == 1:
+            return runs[0][0].render(runs[0][1], antialias, color)
+
+        # Trechos alinhados pela linha de base da fonte mais alta
+        ascent = max(f.get_ascent() for f, _ in runs)
+        parts = [(f.render(t, antialias, color), ascent - f.get_ascent()) for f, t in runs]
+        height = max(p.get_height() + dy for p, dy in parts)
+        surf = pygame.Surface((sum(p.get_width() for p, _ in parts), height), pygame.SRCALPHA)
+        x = 0
+        for part, dy in parts:
+            surf.blit(part, (x, dy))
+            x += part.get_width()
+        return surf
+
+font_registry = FontRegistry()
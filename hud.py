@@ -0,0 +1,75 @@
+# hud.py
+# HUD em modo retido: cada painel é composto uma vez em uma superfície fora da tela
+# e só é refeito quando os dados que ele exibe mudam
+# Requisitos: pip install pygame
+
+import pygame
+
+from dirty_rects import DirtyState
+
+_UNSET = object()
+
+# ==================== OBSERVADOR ====================
+class Observable:
+    """
+    Mixin que avisa os observadores quando um dos campos listados em
+    `watched_fields` recebe um valor diferente do atual.
+    """
+
+    watched_fields = frozenset()
+
+    def __setattr__(self, name, value):
+        if name not in self.watched_fields:
+            object.__setattr__(self, name, value)
+            return
+        old = self.__dict__.get(name, _UNSET)
+        object.__setattr__(self, name, value)
+        if old is not value and old != value:
+            for callback in self.__dict__.get("observers", ()):
+                callback(self, name)
+
+    def observe(self, callback):
+        """Registra callback(obj, campo); registrar duas vezes não duplica"""
+        observers = self.__dict__.setdefault("observers", [])
+        if callback not in observers:
+            observers.append(callback)
+
+    def unobserve(self, callback):
+        observers = self.__dict__.get("observers", [])
+        if callback in observers:
+            observers.remove(callback)
+
+# ==================== CAMADA DE HUD ====================
+class HudLayer:
+    """
+    Painel composto em uma superfície própria. render(surf) desenha o painel
+    em coordenadas locais; a camada só chama render de novo após invalidate().
+    """
+
+    def __init__(self, rect, render):
+        self.rect = pygame.Rect(rect)
+        self.render = render
+        self.surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self.valid = False
+        self.revision = 0
+        self.rebuilds = 0
+        self.dirty_state = DirtyState()
+
+    def invalidate(self, *_):
+        """Marca a camada para ser recomposta; aceita a assinatura dos observadores"""
+        self.valid = False
+        self.revision += 1
+
+    def draw(self, surf):
+        if not self.valid:
+            self.surface.fill((0, 0, 0, 0))
+            self.render(self.surface)
+            self.valid = True
+            self.rebuilds += 1
+        surf.blit(self.surface, self.rect.topleft)
+
+    def dirty_rects(self, *extra, visible=True):
+        """Retângulos alterados desde o último frame (modo retângulos sujos)"""
+        if not visible:
+            return self.dirty_state.update(None, None)
+        return self.dirty_state.update((self.revision, extra), self.rect)
@@ -0,0 +1,133 @@
+# particles.py
+# Sistema de partículas em arrays (estrutura de arrays com NumPy)
+# Requisitos: pip install pygame numpy
+
+import math
+import numpy as np
+import pygame
+
+from sprite_atlas import particle_atlas
+
+# ==================== SISTEMA DE PARTÍCULAS ====================
+class ParticleSystem:
+    """
+    Partículas guardadas em arrays paralelos (posição, velocidade, cor, tamanho, vida).
+    A integração é vetorizada e as partículas mortas são compactadas de uma vez,
+    sem remoções individuais de lista. O desenho usa o atlas de sprites compartilhado.
+    Velocidades em px/s e gravidade em px/s²; a posição do passo anterior é guardada
+    para o desenho interpolar entre passos fixos de simulação.
+    """
+
+    GRAVITY = 360.0  # px/s² (0.1 px/frame² a 60 Hz)
+
+    def __init__(self, capacity=256, atlas=particle_atlas):
+        self.count = 0
+        self.atlas = atlas
+        self.last_bounds = None
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        old = self.count
+        pos = np.zeros((capacity, 2), dtype=np.float32)
+        prev_pos = np.zeros((capacity, 2), dtype=np.float32)
+        vel = np.zeros((capacity, 2), dtype=np.float32)
+        color = np.zeros((capacity, 3), dtype=np.uint8)
+        size = np.zeros(capacity, dtype=np.float32)
+        life = np.zeros(capacity, dtype=np.float32)
+        max_life = np.ones(capacity, dtype=np.float32)
+        if old:
+            pos[:old] = self.pos[:old]
+            prev_pos[:old] = self.prev_pos[:old]
+            vel[:old] = self.vel[:old]
+            color[:old] = self.color[:old]
+            size[:old] = self.size[:old]
+            life[:old] = self.life[:old]
+            max_life[:old] = self.max_life[:old]
+        self.pos, self.prev_pos, self.vel, self.color = pos, prev_pos, vel, color
+        self.size, self.life, self.max_life = size, life, max_life
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def add_particles(self, x, y, color, count=5, speed=120, size=3, lifetime=1.0):
+        if count <= 0:
+            return
+        needed = self.count + count
+        if needed > self.capacity:
+            self._allocate(max(needed, self.capacity * 2))
+
+        s = slice(self.count, needed)
+        angle = np.random.uniform(0, math.pi * 2, count)
+        self.pos[s] = (x, y)
+        self.prev_pos[s] = (x, y)
+        self.vel[s, 0] = np.cos(angle) * speed
+        self.vel[s, 1] = np.sin(angle) * speed
+        self.color[s] = color[:3]
+        self.size[s] = np.random.uniform(size * 0.5, size * 1.5, count)
+        self.life[s] = lifetime
+        self.max_life[s] = lifetime
+        self.count = needed
+
+    def update(self, dt):
+        n = self.count
+        if not n:
+            return
+        self.prev_pos[:n] = self.pos[:n]
+        self.pos[:n] += self.vel[:n] * dt
+        self.life[:n] -= dt
+        self.vel[:n, 1] += self.GRAVITY * dt
+
+        alive = self.life[:n] > 0
+        if alive.all():
+            return
+        # Compacta os vivos no início dos arrays (equivalente a swap-remove em lote)
+        keep = np.flatnonzero(alive)
+        k = len(keep)
+        self.pos[:k] = self.pos[keep]
+        self.prev_pos[:k] = self.prev_pos[keep]
+        self.vel[:k] = self.vel[keep]
+        self.color[:k] = self.color[keep]
+        self.size[:k] = self.size[keep]
+        self.life[:k] = self.life[keep]
+        self.max_life[:k] = self.max_life[keep]
+        self.count = k
+
+    def draw(self, surf, alpha=1.0):
+        """Desenha as partículas; alpha interpola entre o passo anterior (0) e o atual (1)"""
+        n = self.count
+        if not n:
+            return
+        pos = self.pos[:n] if alpha >= 1.0 else self.prev_pos[:n] + (self.pos[:n] - self.prev_pos[:n]) * alpha
+        ratio = self.life[:n] / self.max_life[:n]
+        alpha = (255 * ratio).astype(np.int32)
+        radius = (self.size[:n] * ratio).astype(np.int32)
+        visible = np.flatnonzero((alpha > 0) & (radius > 0))
+        if not len(visible):
+            return
+
+        colors = [tuple(c) for c in self.color[visible].tolist()]
+        self.atlas.draw_batch(surf, zip(
+            colors,
+            radius[visible].tolist(),
+            alpha[visible].tolist(),
+            pos[visible, 0].astype(np.int32).tolist(),
+            pos[visible, 1].astype(np.int32).tolist(),
+        ))
+
+    def bounds(self):
+        """Retângulo que envolve todas as partículas vivas, em qualquer ponto da interpolação (ou None)"""
+        n = self.count
+        if not n:
+            return None
+        r = int(self.size[:n].max()) + 1
+        x0, y0 = np.minimum(self.pos[:n].min(axis=0), self.prev_pos[:n].min(axis=0))
+        x1, y1 = np.maximum(self.pos[:n].max(axis=0), self.prev_pos[:n].max(axis=0))
+        return pygame.Rect(int(x0) - r, int(y0) - r, int(x1 - x0) + 2 * r + 1, int(y1 - y0) + 2 * r + 1)
+
+    def dirty_rects(self):
+        """Área ocupada no frame anterior e no atual (modo retângulos sujos)"""
+        bounds = self.bounds()
+        rects = [r for r in (self.last_bounds, bounds) if r is not None]
+        self.last_bounds = bounds
+        return rects
@@ -0,0 +1,164 @@
+# procedural.py
+# Texturas procedurais montadas em arrays NumPy (pedra, céu estrelado, gradientes, manchas)
+# Requisitos: pip install pygame numpy
+#
+# Todas as funções aceitam `seed`: com o mesmo seed a textura sai idêntica.
+# Os arrays são (altura, largura, 4) uint8 RGBX, na ordem de linhas da imagem: viram
+# Surface com pygame.image.frombuffer sem transpor, e cada pixel cabe num uint32,
+# o que deixa as ampliações (np.repeat) tão baratas quanto copiar memória.
+
+import numpy as np
+import pygame
+
+def _rng(seed):
+    return seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+
+def to_surface(pixels, alpha=False):
+    """Array (h, w, 4) -> Surface, já no formato da tela se houver janela; alpha=True usa o 4º canal"""
+    pixels = np.ascontiguousarray(pixels, dtype=np.uint8)
+    size = (pixels.shape[1], pixels.shape[0])
+    fmt = "RGBA" if alpha else "RGBX"
+    if pygame.display.get_surface():
+        surf = pygame.image.frombuffer(pixels, size, fmt)
+        return surf.convert_alpha() if alpha else surf.convert()
+    # Sem janela a Surface não pode depender do array, então os bytes são copiados
+    return pygame.image.frombytes(pixels.tobytes(), size, fmt)
+
+def pack_colors(colors):
+    """Cores (..., 3) -> (..., 4) RGBX uint8"""
+    colors = np.asarray(colors)
+    packed = np.zeros(colors.shape[:-1] + (4,), dtype=np.uint8)
+    packed[..., :3] = np.clip(colors[..., :3], 0, 255)
+    return packed
+
+def expand(cells, rows, cols):
+    """Amplia uma grade (ch, cw, 4) repetindo cada célula rows[i] x cols[j] vezes"""
+    words = np.ascontiguousarray(cells).view(np.uint32)[..., 0]
+    words = np.repeat(np.repeat(words, rows, axis=0), cols, axis=1)
+    return words.view(np.uint8).reshape(words.shape + (4,))
+
+# ==================== GRADIENTES ====================
+def vertical_gradient_array(width, height, start_color, end_color):
+    """Mesmas cores de render_cache.create_gradient (razão y/altura, truncada)"""
+    ratio = np.arange(height, dtype=np.float64) / height
+    start = np.asarray(start_color[:3], dtype=np.float64)
+    end = np.asarray(end_color[:3], dtype=np.float64)
+    rows = pack_colors((start + (end - start) * ratio[:, None]).astype(np.int32))
+    return expand(rows[:, None, :], 1, width)
+
+def vertical_gradient(size, start_color, end_color):
+    return to_surface(vertical_gradient_array(size[0], size[1], start_color, end_color))
+
+def radial_vignette_array(size, color=(0, 0, 0), max_alpha=180, radius=None, center=None):
+    """
+    Vinheta RGBA: `color` transparente no centro, opacidade crescendo com a distância
+    até max_alpha em `radius` (padrão: largura / 1.5) e constante depois dele.
+    """
+    w, h = size
+    cx, cy = center or (w // 2, h // 2)
+    radius = radius or w / 1.5
+    dy = (np.arange(h, dtype=np.float32) - cy)[:, None]
+    dx = (np.arange(w, dtype=np.float32) - cx)[None, :]
+    ramp = np.minimum(np.sqrt(dx * dx + dy * dy) / radius, 1.0)
+    pixels = np.empty((h, w, 4), dtype=np.uint8)
+    pixels[..., :3] = color[:3]
+    pixels[..., 3] = (ramp * max_alpha).astype(np.uint8)
+    return pixels
+
+def radial_vignette(size, color=(0, 0, 0), max_alpha=180, radius=None, center=None):
+    return to_surface(radial_vignette_array(size, color, max_alpha, radius, center), alpha=True)
+
+# ==================== PEDRA ====================
+def stone_texture_array(size, block=4, shade=(80, 120), tint=(0, -10, -20), seed=None):
+    """Blocos de block x block pixels com tom sorteado em shade (inclusivo) e deslocamento tint por canal"""
+    w, h = size
+    rng = _rng(seed)
+    bw, bh = -(-w // block), -(-h // block)
+    shades = rng.integers(shade[0], shade[1] + 1, size=(bh, bw), dtype=np.int16)
+    colors = pack_colors(shades[:, :, None] + np.asarray(tint, dtype=np.int16))
+    # Cores calculadas por bloco; só a ampliação final toca todos os pixels
+    return expand(colors, block, block)[:h, :w]
+
+def stone_texture(size, block=4, shade=(80, 120), tint=(0, -10, -20), seed=None):
+    return to_surface(stone_texture_array(size, block, shade, tint, seed))
+
+# ==================== CÍRCULOS ====================
+_disk_offsets = {}
+
+def _disk(radius):
+    """Deslocamentos (dx, dy) dos pixels de um disco de raio `radius`"""
+    offsets = _disk_offsets.get(radius)
+    if offsets is None:
+        r = np.arange(-radius, radius + 1)
+        dy, dx = np.meshgrid(r, r, indexing="ij")
+        inside = dx * dx + dy * dy <= radius * radius
+        offsets = _disk_offsets[radius] = (dx[inside], dy[inside])
+    return offsets
+
+def stamp_disks(pixels, xs, ys, radii, colors):
+    """Pinta discos cheios em `pixels` de uma vez por raio (sem um draw.circle por disco)"""
+    h, w = pixels.shape[:2]
+    xs, ys, radii = np.asarray(xs), np.asarray(ys), np.asarray(radii)
+    colors = pack_colors(colors)
+    for radius in np.unique(radii):
+        sel = radii == radius
+        dx, dy = _disk(int(radius))
+        px = (xs[sel, None] + dx[None, :]).ravel()
+        py = (ys[sel, None] + dy[None, :]).ravel()
+        color = np.repeat(colors[sel], len(dx), axis=0)
+        inside = (px >= 0) & (px < w) & (py >= 0) & (py < h)
+        pixels[py[inside], px[inside]] = color[inside]
+    return pixels
+
+def starfield_array(pixels, count=100, area=None, radius=(1, 3), brightness=(150, 255), seed=None):
+    """Estrelas brancas em `area` (x, y, w, h; padrão: a imagem inteira) com raio e brilho sorteados"""
+    rng = _rng(seed)
+    x0, y0, aw, ah = area or (0, 0, pixels.shape[1], pixels.shape[0])
+    xs = rng.integers(x0, x0 + aw + 1, count)
+    ys = rng.integers(y0, y0 + ah + 1, count)
+    radii = rng.integers(radius[0], radius[1] + 1, count)
+    shade = rng.integers(brightness[0], brightness[1] + 1, count)
+    return stamp_disks(pixels, xs, ys, radii, np.repeat(shade[:, None], 3, axis=1))
+
+def night_sky(size, top, bottom, stars=100, star_height=None, seed=None):
+    """Gradiente de céu noturno com estrelas na faixa superior (star_height, padrão: metade)"""
+    w, h = size
+    pixels = vertical_gradient_array(w, h, top, bottom)
+    starfield_array(pixels, stars, (0, 0, w, star_height or h // 2), seed=seed)
+    return to_surface(pixels)
+
+# ==================== MANCHAS ====================
+def blotches_array(size, light, dark, count=150, extent=(50, 200), alpha=(5, 15), seed=None):
+    """
+    Fundo `light` com `count` quadrados translúcidos de `dark` sobrepostos. Cada
+    quadrado multiplica a distância até `dark` por (1 - alpha/255). Como as bordas
+    dos quadrados dividem a imagem em poucas faixas, a soma (em log) é feita numa
+    grade comprimida de faixas e só depois ampliada para o tamanho real.
+    """
+    w, h = size
+    rng = _rng(seed)
+    xs = rng.integers(0, w + 1, count)
+    ys = rng.integers(0, h + 1, count)
+    sides = rng.integers(extent[0], extent[1] + 1, count)
+    alphas = rng.integers(alpha[0], alpha[1] + 1, count)
+    x1, y1 = np.minimum(xs + sides, w), np.minimum(ys + sides, h)
+    weight = np.log1p(-alphas / 255.0)
+
+    cols = np.unique(np.concatenate(([0, w], xs, x1)))
+    rows = np.unique(np.concatenate(([0, h], ys, y1)))
+    cx0, cx1 = np.searchsorted(cols, xs), np.searchsorted(cols, x1)
+    cy0, cy1 = np.searchsorted(rows, ys), np.searchsorted(rows, y1)
+    diff = np.zeros((len(rows), len(cols)), dtype=np.float64)
+    np.add.at(diff, (cy0, cx0), weight)
+    np.add.at(diff, (cy0, cx1), -weight)
+    np.add.at(diff, (cy1, cx0), -weight)
+    np.add.at(diff, (cy1, cx1), weight)
+    keep = np.exp(diff.cumsum(axis=0).cumsum(axis=1)[:-1, :-1])
+
+    light = np.asarray(light[:3], dtype=np.float64)
+    dark = np.asarray(dark[:3], dtype=np.float64)
+    cells = pack_colors((dark + (light - dark) * keep[:, :, None]).astype(np.int32))
+    return expand(cells, np.diff(rows), np.diff(cols))
+
+def blotches(size, light, dark, count=150, extent=(50, 200), alpha=(5, 15), seed=None):
+    return to_surface(blotches_array(size, light, dark, count, extent, alpha, seed))
@@ -0,0 +1,120 @@
+# profiler.py
+# Medição de tempo por subsistema a cada frame, com overlay opcional na tela
+# Requisitos: pip install pygame
+
+import statistics
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import pygame
+
+# ==================== PROFILER DE FRAME ====================
+class FrameProfiler:
+    """
+    Acumula o tempo gasto em cada seção nomeada durante o frame e guarda uma
+    janela com os últimos frames. stats() e summary() expõem os números para
+    código (ex.: benchmarks); draw() mostra o overlay.
+    """
+
+    def __init__(self, window=120, refresh=0.25):
+        self.window = window
+        self.refresh = refresh          # intervalo (s) entre redesenhos do overlay
+        self.samples = {}               # seção -> ms nos últimos frames
+        self.totals = {}                # seção -> ms acumulados desde reset()
+        self.counters = {}
+        self.frames = 0
+        self.frame_times = deque(maxlen=window)
+        self._current = {}
+        self._frame_start = time.perf_counter()
+        self._overlay = None
+        self._overlay_time = 0.0
+
+    @contextmanager
+    def section(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000.0
+            self._current[name] = self._current.get(name, 0.0) + elapsed
+
+    def count(self, name, value):
+        """Registra um contador exibido junto das seções (ex.: número de partículas)"""
+        self.counters[name] = value
+
+    def end_frame(self):
+        now = time.perf_counter()
+        self.frame_times.append((now - self._frame_start) * 1000.0)
+        self._frame_start = now
+
+        for name in self._current:
+            if name not in self.samples:
+                self.samples[name] = deque(maxlen=self.window)
+        for name, samples in self.samples.items():
+            ms = self._current.get(name, 0.0)
+            samples.append(ms)
+            self.totals[name] = self.totals.get(name, 0.0) + ms
+        self.frames += 1
+        self._current = {}
+
+    def reset(self):
+        """Zera os acumulados (a janela do overlay continua)"""
+        self.totals = {name: 0.0 for name in self.totals}
+        self.frames = 0
+
+    def stats(self):
+        """Média, máximo e último valor (ms) de cada seção na janela atual"""
+        return {
+            name: {"mean_ms": statistics.fmean(s), "max_ms": max(s), "last_ms": s[-1]}
+            for name, s in self.samples.items() if s
+        }
+
+    def summary(self):
+        """Média por frame de cada seção desde o último reset(), mais os contadores"""
+        frames = max(1, self.frames)
+        return {
+            "frames": self.frames,
+            "sections_ms": {name: total / frames for name, total in self.totals.items()},
+            "counters": dict(self.counters),
+        }
+
+    # ==================== OVERLAY ====================
+    def _build_overlay(self, font):
+        stats = self.stats()
+        frame_ms = statistics.fmean(self.frame_times) if self.frame_times else 0.0
+        work_ms = sum(s["mean_ms"] for s in stats.values())
+        rows = [("FPS", f"{1000.0 / frame_ms:.1f}" if frame_ms else "-"),
+                ("frame / trabalho", f"{frame_ms:.2f} / {work_ms:.2f}")]
+        rows += [(name, f"{s['mean_ms']:.2f}  {s['max_ms']:.2f}") for name, s in stats.items()]
+        rows += [(name, f"{value:.1f}" if isinstance(value, float) else str(value))
+                 for name, value in self.counters.items()]
+
+        line_h = font.get_linesize()
+        width = 300
+        panel = pygame.Surface((width, 12 + line_h * (len(rows) + 1)), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        pygame.draw.rect(panel, (255, 215, 0), panel.get_rect(), 1)
+        header = font.render("PROFILER (F3)   média  máx ms", True, (255, 215, 0))
+        panel.blit(header, (8, 6))
+        for i, (label, value) in enumerate(rows, start=1):
+            y = 6 + i * line_h
+            panel.blit(font.render(label, True, (230, 230, 230)), (8, y))
+            value_surf = font.render(value, True, (255, 255, 200))
+            panel.blit(value_surf, (width - 8 - value_surf.get_width(), y))
+        return panel
+
+    def overlay_rect(self, pos):
+        if self._overlay is None:
+            return None
+        return self._overlay.get_rect(topleft=pos)
+
+    def draw(self, surf, font, pos):
+        now = time.perf_counter()
+        if self._overlay is None or now - self._overlay_time >= self.refresh:
+            # Texto fora do cache compartilhado: os números mudam sempre e só poluiriam o LRU
+            self._overlay = self._build_overlay(font)
+            self._overlay_time = now
+        surf.blit(self._overlay, pos)
+
+frame_profiler = FrameProfiler()
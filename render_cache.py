@@ -0,0 +1,122 @@
+# render_cache.py
+# Cache de superfícies pré-renderizadas compartilhado pelas telas do jogo
+# Requisitos: pip install pygame
+
+import pygame
+from collections import OrderedDict
+
+from procedural import vertical_gradient
+from fonts import font_registry
+
+# ==================== GRADIENTES ====================
+def create_gradient(width, height, start_color, end_color):
+    """Gradiente vertical montado de uma vez em um array (sem uma linha desenhada por y)"""
+    return vertical_gradient((width, height), start_color, end_color)
+
+def _prepare(surf):
+    """Converte a superfície para o formato da tela quando já existe uma janela"""
+    if pygame.display.get_surface() is None:
+        return surf
+    return surf.convert_alpha() if surf.get_flags() & pygame.SRCALPHA else surf.convert()
+
+# ==================== CACHE DE TEXTURAS ====================
+class GradientCache:
+    """Cache LRU de gradientes e painéis pré-renderizados"""
+
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key, build):
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = _prepare(build())
+        self._surfaces[key] = surf
+        while len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surf
+
+    def surface(self, key, build):
+        """Qualquer superfície pré-renderizada: build() só roda quando a chave não está no cache"""
+        return self._get(("surface",) + tuple(key), build)
+
+    def gradient(self, size, start_color, end_color):
+        """Gradiente vertical cacheado por (tamanho, cor inicial, cor final)"""
+        key = ("gradient", tuple(size), tuple(start_color), tuple(end_color))
+        return self._get(key, lambda: create_gradient(size[0], size[1], start_color, end_color))
+
+    def panel_skin(self, size, start_color, end_color, outer_color, frame_color, border_color):
+        """
+        Painel de pergaminho completo: moldura externa, madeira, gradiente e borda dourada.
+        A superfície tem 4px de margem em cada lado para a moldura externa.
+        """
+        key = ("panel", tuple(size), tuple(start_color), tuple(end_color),
+               tuple(outer_color), tuple(frame_color), tuple(border_color))
+
+        def build():
+            w, h = size
+            skin = pygame.Surface((w + 8, h + 8), pygame.SRCALPHA)
+            rect = pygame.Rect(4, 4, w, h)
+            pygame.draw.rect(skin, outer_color, rect.inflate(8, 8), border_radius=12)
+            pygame.draw.rect(skin, frame_color, rect, border_radius=10)
+            inner_rect = rect.inflate(-8, -8)
+            skin.blit(self.gradient(inner_rect.size, start_color, end_color), inner_rect.topleft)
+            pygame.draw.rect(skin, border_color, rect, 3, border_radius=10)
+            return skin
+
+        return self._get(key, build)
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+gradient_cache = GradientCache()
+
+# ==================== CACHE DE TEXTO ====================
+class TextCache:
+    """Cache LRU de textos renderizados, chaveado por (fonte, texto, cor, antialias)"""
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        # Glifos que a fonte não tem (emojis) saem de uma fonte reserva
+        surf = font_registry.render(font, text, antialias, color)
+        self._surfaces[key] = surf
+        while len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surf
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._surfaces)
+
+text_cache = TextCache()
@@ -0,0 +1,116 @@
+# scaled_cache.py
+# Cache em disco das imagens já redimensionadas, em pixels crus mapeáveis em memória
+# Requisitos: pip install pygame
+#
+# Uso: python scaled_cache.py --info      (mostra o conteúdo do cache)
+#      python scaled_cache.py --clear     (apaga o cache; ele é refeito no próximo início)
+
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+
+import pygame
+
+from assets import CACHE_DIR, asset_log
+
+SCALED_DIR = os.environ.get("RPG_SCALED_CACHE_DIR") or os.path.join(CACHE_DIR, "scaled")
+# Cabeçalho: marca, versão, largura, altura, bytes por pixel
+_HEADER = struct.Struct("<4sHIIB")
+_MAGIC = b"RPGS"
+_VERSION = 1
+ENABLED = os.environ.get("RPG_NO_ASSET_CACHE") != "1"
+
+# ==================== CACHE DE IMAGENS ESCALADAS ====================
+def source_hash(path):
+    """SHA-1 do conteúdo do arquivo original (renomear ou tocar o arquivo não invalida)"""
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def entry_path(digest, size, smooth=True):
+    w, h = size
+    return os.path.join(SCALED_DIR, f"{digest}_{w}x{h}{'' if smooth else '_n'}.raw")
+
+def load(digest, size, smooth=True):
+    """
+    Superfície RGBA montada direto sobre o arquivo mapeado em memória, ou None.
+    A superfície referencia o mapeamento; convert()/convert_alpha() fazem a cópia final.
+    """
+    if not ENABLED:
+        return None
+    try:
+        with open(entry_path(digest, size, smooth), "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        magic, version, w, h, bpp = _HEADER.unpack_from(mm)
+        if magic != _MAGIC or version != _VERSION or (w, h) != tuple(size) or bpp != 4 \
+                or len(mm) != _HEADER.size + w * h * 4:
+            raise ValueError("entrada inválida")
+        pixels = memoryview(mm)[_HEADER.size:]
+        return pygame.image.frombuffer(pixels, (w, h), "RGBA")
+    except (ValueError, struct.error, pygame.error) as e:
+        asset_log.warning(f"Cache de imagem descartado ({e}): {entry_path(digest, size, smooth)}")
+        mm.close()
+        return None
+
+def store(digest, surf, smooth=True):
+    """Grava os pixels RGBA de `surf`; falhas de escrita só desativam o cache desta imagem"""
+    if not ENABLED:
+        return
+    w, h = surf.get_size()
+    path = entry_path(digest, (w, h), smooth)
+    tmp = f"{path}.{os.getpid()}.{id(surf)}.tmp"
+    try:
+        os.makedirs(SCALED_DIR, exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, w, h, 4))
+            f.write(pygame.image.tobytes(surf, "RGBA"))
+        os.replace(tmp, path)
+    except (OSError, pygame.error) as e:
+        asset_log.debug(f"Imagem não foi salva no cache: {e}")
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+def entries():
+    try:
+        return sorted(os.path.join(SCALED_DIR, n) for n in os.listdir(SCALED_DIR) if n.endswith(".raw"))
+    except OSError:
+        return []
+
+def clear():
+    """Remove todas as entradas; retorna quantas foram apagadas"""
+    removed = 0
+    for path in entries():
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError as e:
+            asset_log.warning(f"Não foi possível remover {path}: {e}")
+    return removed
+
+def main():
+    parser = argparse.ArgumentParser(description="Cache em disco das imagens redimensionadas")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--clear", action="store_true", help="apaga todas as entradas do cache")
+    group.add_argument("--info", action="store_true", help="lista as entradas e o tamanho total")
+    args = parser.parse_args()
+
+    if args.clear:
+        print(f"[INFO] {clear()} imagens removidas de {SCALED_DIR}")
+    else:
+        paths = entries()
+        total = sum(os.path.getsize(p) for p in paths)
+        for path in paths:
+            print(f"  {os.path.basename(path)}  {os.path.getsize(path) / 1024:.0f} KB")
+        print(f"[INFO] {len(paths)} imagens, {total / (1 << 20):.1f} MB em {SCALED_DIR}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# sprite_atlas.py
+# Atlas de sprites circulares pré-renderizados, compartilhado pelos efeitos de partículas
+# Requisitos: pip install pygame
+
+import pygame
+
+# ==================== ATLAS DE CÍRCULOS ====================
+class CircleSpriteAtlas:
+    """
+    Guarda círculos pré-renderizados em folhas (páginas) grandes, um por
+    combinação quantizada de (cor, raio, alpha). Desenhar uma partícula é só
+    um blit de uma área da folha.
+    """
+
+    def __init__(self, page_size=512, color_step=8, alpha_step=16, max_radius=32):
+        self.page_size = page_size
+        self.color_step = color_step
+        self.alpha_step = alpha_step
+        self.max_radius = max_radius
+        self.pages = []
+        self._sprites = {}
+        self._lookup = {}  # atalho: chave sem quantizar -> (página, área, raio)
+        # Cursor de empacotamento em prateleiras na página atual
+        self._shelf_x = 0
+        self._shelf_y = 0
+        self._shelf_h = 0
+
+    def quantize(self, color, radius, alpha):
+        step = self.color_step
+        color = tuple(min(255, int(c + step // 2) // step * step) for c in color[:3])
+        radius = max(1, min(self.max_radius, int(radius)))
+        alpha = max(0, min(255, int(alpha) // self.alpha_step * self.alpha_step + self.alpha_step - 1))
+        return color, radius, alpha
+
+    def _new_page(self):
+        self.pages.append(pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA))
+        self._shelf_x = self._shelf_y = self._shelf_h = 0
+
+    def _place(self, w, h):
+        """Reserva um retângulo livre na página atual (empacotamento em prateleiras)"""
+        if not self.pages:
+            self._new_page()
+        if self._shelf_x + w > self.page_size:
+            self._shelf_x = 0
+            self._shelf_y += self._shelf_h
+            self._shelf_h = 0
+        if self._shelf_y + h > self.page_size:
+            self._new_page()
+        rect = pygame.Rect(self._shelf_x, self._shelf_y, w, h)
+        self._shelf_x += w
+        self._shelf_h = max(self._shelf_h, h)
+        return rect
+
+    def _entry(self, color, radius, alpha):
+        """Retorna (página, área, raio) do sprite, renderizando-o na primeira vez"""
+        raw = (color, radius, alpha)
+        entry = self._lookup.get(raw)
+        if entry is not None:
+            return entry
+
+        key = self.quantize(color, radius, alpha)
+        entry = self._sprites.get(key)
+        if entry is None:
+            color, radius, alpha = key
+            rect = self._place(radius * 2, radius * 2)
+            page = self.pages[-1]
+            pygame.draw.circle(page, (*color, alpha), rect.center, radius)
+            entry = self._sprites[key] = (page, rect, radius)
+        self._lookup[raw] = entry
+        return entry
+
+    def sprite(self, color, radius, alpha):
+        page, rect, _ = self._entry(color, radius, alpha)
+        return page.subsurface(rect)
+
+    def warm(self, colors, radii, alphas=None):
+        """Pré-renderiza as combinações informadas (ex.: na inicialização)"""
+        alphas = alphas if alphas is not None else range(0, 256, self.alpha_step)
+        for color in colors:
+            for radius in radii:
+                for alpha in alphas:
+                    self._entry(color, radius, alpha)
+
+    def draw(self, surf, color, radius, alpha, cx, cy):
+        """Desenha um único círculo centrado em (cx, cy)"""
+        page, area, r = self._entry(color, radius, alpha)
+        surf.blit(page, (int(cx) - r, int(cy) - r), area)
+
+    def draw_batch(self, surf, items):
+        """Desenha vários círculos com um único Surface.blits; items = (cor, raio, alpha, cx, cy)"""
+        entry = self._entry
+        blits = []
+        for color, radius, alpha, cx, cy in items:
+            page, area, r = entry(color, radius, alpha)
+            blits.append((page, (int(cx) - r, int(cy) - r), area))
+        if blits:
+            surf.blits(blits, doreturn=False)
+
+    def __len__(self):
+        return len(self._sprites)
+
+particle_atlas = CircleSpriteAtlas()
@@ -0,0 +1,82 @@
+# text_layout.py
+# Quebra de linhas e revelação incremental de texto (efeito máquina de escrever)
+# Requisitos: pip install pygame
+
+import pygame
+
+from render_cache import text_cache
+from fonts import font_registry
+
+def wrap_text(text, max_width, font):
+    words = text.split(' ')
+    lines = []
+    current_line = []
+
+    for word in words:
+        test_line = ' '.join(current_line + [word])
+        if font_registry.size(font, test_line)[0] <= max_width:
+            current_line.append(word)
+        else:
+            if current_line:
+                lines.append(' '.join(current_line))
+            current_line = [word]
+
+    if current_line:
+        lines.append(' '.join(current_line))
+
+    return lines
+
+class TypewriterText:
+    """
+    Layout de uma mensagem completa calculado uma única vez.
+    Cada linha tem sua própria superfície; revelar caracteres apenas
+    desenha os glifos novos nela, então o custo por frame não depende
+    do tamanho da mensagem.
+    """
+
+    def __init__(self, text, font, max_width, color, max_lines=None, line_height=None):
+        self.font = font
+        self.color = color
+        self.line_height = line_height or font.get_linesize()
+        self.lines = wrap_text(text, max_width, font)
+        if max_lines is not None:
+            self.lines = self.lines[:max_lines]
+
+        # Início de cada linha no texto original (as quebras consomem um espaço)
+        self.line_starts = []
+        start = 0
+        for line in self.lines:
+            self.line_starts.append(start)
+            start += len(line) + 1
+
+        # Posição x de cada glifo, medida com o prefixo inteiro para manter o kerning
+        self.offsets = [[font_registry.size(font, line[:k])[0] for k in range(len(line) + 1)] for line in self.lines]
+        self.surfaces = [
+            pygame.Surface((max(1, offsets[-1]), self.line_height), pygame.SRCALPHA)
+            for offsets in self.offsets
+        ]
+        self.revealed = [0] * len(self.lines)
+        self.char_index = 0
+
+    def reveal(self, char_index):
+        """Desenha nas superfícies das linhas os glifos até char_index"""
+        if char_index <= self.char_index:
+            return
+        self.char_index = char_index
+
+        for i, line in enumerate(self.lines):
+            target = max(0, min(len(line), char_index - self.line_starts[i]))
+            if target <= self.revealed[i]:
+                continue
+            surf = self.surfaces[i]
+            offsets = self.offsets[i]
+            for k in range(self.revealed[i], target):
+                ch = line[k]
+                if not ch.isspace():
+                    surf.blit(text_cache.render(self.font, ch, self.color), (offsets[k], 0))
+            self.revealed[i] = target
+
+    def draw(self, surf, x, y):
+        for i, line_surf in enumerate(self.surfaces):
+            if self.revealed[i]:
+                surf.blit(line_surf, (x, y + i * self.line_height))
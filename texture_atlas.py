@@ -0,0 +1,209 @@
+# texture_atlas.py
+# Folhas de textura (atlas) para os ícones de itens e os quadros do chefe demônio
+# Requisitos: pip install pygame
+#
+# Empacotar (offline, rodar de novo quando as imagens mudarem):
+#     python texture_atlas.py
+# gera atlas/<nome>.png (a folha) e atlas/<nome>.json (índice dos retângulos).
+
+import argparse
+import json
+import os
+
+import pygame
+
+from assets import ROOT, asset_log
+
+ATLAS_DIR = os.path.join(ROOT, "atlas")
+# Nome do atlas -> pastas de origem (relativas à raiz)
+ATLAS_SOURCES = {
+    "icons": ["rpg_icons_free"],
+    "demon": ["boss/01_demon_idle", "boss/02_demon_walk", "boss/03_demon_cleave"],
+}
+PADDING = 1  # espaço entre sprites para o filtro do smoothscale não vazar
+
+def sprite_key(name):
+    """'rpg_icons_free/Axe.png' -> 'axe' (nome do arquivo, sem extensão, minúsculo)"""
+    return os.path.splitext(os.path.basename(name.replace("\\", "/")))[0].lower()
+
+# ==================== EMPACOTADOR ====================
+def pack_rects(sizes, max_width):
+    """
+    Empacotamento em prateleiras com os retângulos ordenados por altura (maiores
+    primeiro). Retorna (posições na ordem de entrada, largura, altura da folha).
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    positions = [None] * len(sizes)
+    x = y = shelf_h = used_w = 0
+    for i in order:
+        w, h = sizes[i][0] + PADDING, sizes[i][1] + PADDING
+        if x + w > max_width and x > 0:
+            x, y, shelf_h = 0, y + shelf_h, 0
+        positions[i] = (x, y)
+        x += w
+        shelf_h = max(shelf_h, h)
+        used_w = max(used_w, x)
+    return positions, used_w, y + shelf_h
+
+def _pack_width(sizes):
+    """Largura que deixa a folha perto de quadrada (menos área desperdiçada)"""
+    area = sum((w + PADDING) * (h + PADDING) for w, h in sizes)
+    widest = max(w + PADDING for w, _ in sizes)
+    return max(widest, int(area ** 0.5 * 1.1))
+
+def build_atlas(name, folders):
+    """Lê os PNGs das pastas, recorta as bordas transparentes e grava folha + índice"""
+    sprites = []
+    for folder in folders:
+        base = os.path.join(ROOT, folder)
+        for filename in sorted(os.listdir(base)):
+            if not filename.lower().endswith(".png"):
+                continue
+            img = pygame.image.load(os.path.join(base, filename))
+            trim = img.get_bounding_rect(min_alpha=1)
+            if not trim.w or not trim.h:
+                trim = pygame.Rect(0, 0, 1, 1)
+            sprites.append((sprite_key(filename), img, trim))
+
+    sizes = [trim.size for _, _, trim in sprites]
+    positions, width, height = pack_rects(sizes, _pack_width(sizes))
+    sheet = pygame.Surface((width, height), pygame.SRCALPHA)
+    frames = {}
+    for (key, img, trim), (x, y) in zip(sprites, positions):
+        if key in frames:
+            raise ValueError(f"sprite duplicado no atlas '{name}': {key}")
+        sheet.blit(img, (x, y), trim)
+        frames[key] = {"rect": [x, y, trim.w, trim.h],
+                       "offset": [trim.x, trim.y],
+                       "source_size": list(img.get_size())}
+
+    os.makedirs(ATLAS_DIR, exist_ok=True)
+    pygame.image.save(sheet, os.path.join(ATLAS_DIR, f"{name}.png"))
+    with open(os.path.join(ATLAS_DIR, f"{name}.json"), "w", encoding="utf-8") as f:
+        json.dump({"image": f"{name}.png", "size": [width, height], "frames": frames},
+                  f, separators=(",", ":"), sort_keys=True)
+    source_area = sum(w * h for w, h in (img.get_size() for _, img, _ in sprites))
+    print(f"[INFO] Atlas '{name}': {len(frames)} sprites em {width}x{height} "
+          f"({width * height / source_area * 100:.0f}% da área original)")
+    return frames
+
+# ==================== ATLAS EM TEMPO DE EXECUÇÃO ====================
+class Atlas:
+    """
+    Uma folha carregada com um único arquivo aberto. get() devolve subsuperfícies
+    (sem cópia) e draw_batch() desenha vários sprites com um Surface.blits.
+    """
+
+    def __init__(self, index_path):
+        with open(index_path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.image_path = os.path.join(os.path.dirname(index_path), data["image"])
+        self.frames = {key: (pygame.Rect(e["rect"]), tuple(e["offset"]), tuple(e["source_size"]))
+                       for key, e in data["frames"].items()}
+        self._sheet = None
+        self._subsurfaces = {}
+        self._full_frames = {}
+
+    @property
+    def sheet(self):
+        if self._sheet is None:
+            sheet = pygame.image.load(self.image_path)
+            # Sem janela (modo headless) não há formato de tela para converter
+            self._sheet = sheet.convert_alpha() if pygame.display.get_surface() else sheet
+        return self._sheet
+
+    def __contains__(self, name):
+        return sprite_key(name) in self.frames
+
+    def __len__(self):
+        return len(self.frames)
+
+    def names(self):
+        return sorted(self.frames)
+
+    def get(self, name):
+        """Subsuperfície recortada (sem bordas transparentes) ou None"""
+        key = sprite_key(name)
+        sub = self._subsurfaces.get(key)
+        if sub is None and key in self.frames:
+            sub = self._subsurfaces[key] = self.sheet.subsurface(self.frames[key][0])
+        return sub
+
+    def get_frame(self, name):
+        """Sprite no tamanho original do arquivo (bordas transparentes restauradas), em cache"""
+        key = sprite_key(name)
+        frame = self._full_frames.get(key)
+        if frame is None and key in self.frames:
+            rect, offset, source_size = self.frames[key]
+            frame = pygame.Surface(source_size, pygame.SRCALPHA)
+            frame.blit(self.sheet, offset, rect)
+            self._full_frames[key] = frame
+        return frame
+
+    def draw(self, surf, name, pos):
+        """Desenha o sprite com o canto do quadro original em pos"""
+        rect, offset, _ = self.frames[sprite_key(name)]
+        surf.blit(self.sheet, (pos[0] + offset[0], pos[1] + offset[1]), rect)
+
+    def draw_batch(self, surf, items):
+        """Vários sprites da mesma folha em um único Surface.blits; items = (nome, pos)"""
+        frames, sheet = self.frames, self.sheet
+        blits = []
+        for name, (x, y) in items:
+            rect, (ox, oy), _ = frames[sprite_key(name)]
+            blits.append((sheet, (x + ox, y + oy), rect))
+        if blits:
+            surf.blits(blits, doreturn=False)
+
+class AtlasSet:
+    """Todos os atlas gerados em ATLAS_DIR, carregados sob demanda"""
+
+    def __init__(self, directory=ATLAS_DIR):
+        self.directory = directory
+        self._atlases = None
+
+    @property
+    def atlases(self):
+        if self._atlases is None:
+            self._atlases = {}
+            try:
+                names = sorted(n for n in os.listdir(self.directory) if n.endswith(".json"))
+            except OSError:
+                names = []
+            for filename in names:
+                try:
+                    self._atlases[filename[:-5]] = Atlas(os.path.join(self.directory, filename))
+                except (OSError, ValueError, KeyError) as e:
+                    asset_log.warning(f"Atlas inválido ignorado: {filename} ({e})")
+        return self._atlases
+
+    def __getitem__(self, name):
+        return self.atlases[name]
+
+    def find(self, name):
+        """Atlas que contém o sprite, ou None"""
+        for atlas in self.atlases.values():
+            if name in atlas:
+                return atlas
+        return None
+
+    def get(self, name):
+        atlas = self.find(name)
+        return atlas.get(name) if atlas else None
+
+texture_atlases = AtlasSet()
+
+def main():
+    parser = argparse.ArgumentParser(description="Empacota as imagens em folhas de textura")
+    parser.add_argument("names", nargs="*", help=f"atlas a gerar (padrão: {', '.join(ATLAS_SOURCES)})")
+    args = parser.parse_args()
+    unknown = [n for n in args.names if n not in ATLAS_SOURCES]
+    if unknown:
+        parser.error(f"atlas desconhecidos: {', '.join(unknown)}")
+
+    pygame.init()
+    for name in args.names or ATLAS_SOURCES:
+        build_atlas(name, ATLAS_SOURCES[name])
+
+if __name__ == "__main__":
+    main()
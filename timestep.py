@@ -0,0 +1,37 @@
+# timestep.py
+# Passo fixo de simulação desacoplado da taxa de renderização
+# Requisitos: nenhum
+
+# ==================== PASSO FIXO ====================
+class FixedTimestep:
+    """
+    Acumula o tempo real de cada frame e o converte em passos de simulação de
+    duração fixa. O resto que sobra no acumulador vira `alpha`, a fração entre o
+    penúltimo e o último passo usada para interpolar o desenho.
+    """
+
+    def __init__(self, hz=60, max_steps=5):
+        self.hz = hz
+        self.dt = 1.0 / hz
+        self.max_steps = max_steps  # limite de passos por frame (evita a espiral da morte)
+        self.accumulator = 0.0
+        self.steps = 0              # passos simulados desde o início
+        self.dropped = 0.0          # tempo (s) descartado por frames lentos demais
+
+    def advance(self, frame_dt):
+        """Soma o tempo do frame e retorna quantos passos fixos simular agora"""
+        self.accumulator += max(0.0, frame_dt)
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            # Frame muito lento: simula o máximo e descarta o atraso em vez de acelerar o jogo
+            self.dropped += (steps - self.max_steps) * self.dt
+            self.accumulator -= (steps - self.max_steps) * self.dt
+            steps = self.max_steps
+        self.accumulator -= steps * self.dt
+        self.steps += steps
+        return steps
+
+    @property
+    def alpha(self):
+        """Fração (0..1) do próximo passo já decorrida, para interpolar o desenho"""
+        return min(1.0, self.accumulator / self.dt)